@@ -0,0 +1,57 @@
+# migrations/env.py
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from src.config import settings
+from src.adapters.repositories.base import Base
+
+# Importar los modelos registra sus tablas en los metadatos de `Base` (necesario para --autogenerate)
+from src.adapters.repositories import db_models  # noqa: F401
+from src.adapters.repositories.types import BinaryUUID
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def compare_type(context, inspected_column, metadata_column, inspected_type, metadata_type):
+    """SQLite refleja BINARY(16) como NUMERIC; no es un cambio real de tipo."""
+    if isinstance(metadata_type, BinaryUUID) and context.dialect.name == "sqlite":
+        return False
+    return None
+
+
+def run_migrations_offline() -> None:
+    """Genera el SQL sin conectarse (alembic upgrade head --sql)."""
+    context.configure(
+        url=settings.get_db_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connectable = create_engine(settings.get_db_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=compare_type,
+            # SQLite no soporta ALTER TABLE completo; Alembic recrea la tabla cuando hace falta
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
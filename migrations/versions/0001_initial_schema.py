@@ -0,0 +1,81 @@
+"""Esquema inicial: practices, analyses y analysis_jobs
+
+Reproduce las tablas que antes creaba `Base.metadata.create_all` al arrancar.
+Las bases de datos existentes ya tienen estas tablas, así que solo se crean las que falten.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "0001_initial_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+MYSQL_TABLE_KWARGS = {"mysql_collate": "utf8mb4_bin"}
+UUID_TYPE = sa.CHAR(36)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("practices"):
+        op.create_table(
+            "practices",
+            sa.Column("practice_id", UUID_TYPE, primary_key=True),
+            sa.Column("user_id", UUID_TYPE, nullable=False),
+            sa.Column("letra_plantilla", sa.String(1), nullable=False),
+            sa.Column("url_imagen", sa.String(255), nullable=False),
+            sa.Column("fecha_carga", sa.DateTime()),
+            sa.Column("estado_analisis", sa.String(10)),
+            **MYSQL_TABLE_KWARGS,
+        )
+        op.create_index("ix_practices_user_id", "practices", ["user_id"])
+
+    if not inspector.has_table("analyses"):
+        op.create_table(
+            "analyses",
+            sa.Column("analisis_id", UUID_TYPE, primary_key=True),
+            sa.Column("practice_id", UUID_TYPE, sa.ForeignKey("practices.practice_id"), nullable=False),
+            sa.Column("puntuacion_general", sa.Integer()),
+            sa.Column("puntuacion_proporcion", sa.Integer()),
+            sa.Column("puntuacion_inclinacion", sa.Integer()),
+            sa.Column("puntuacion_espaciado", sa.Integer()),
+            sa.Column("puntuacion_consistencia", sa.Integer()),
+            sa.Column("fortalezas", sa.String(255)),
+            sa.Column("areas_mejora", sa.String(255)),
+            **MYSQL_TABLE_KWARGS,
+        )
+
+    if not inspector.has_table("analysis_jobs"):
+        op.create_table(
+            "analysis_jobs",
+            sa.Column("job_id", UUID_TYPE, primary_key=True),
+            sa.Column(
+                "practice_id", UUID_TYPE,
+                sa.ForeignKey("practices.practice_id", ondelete="CASCADE"), nullable=False
+            ),
+            sa.Column("letra", sa.String(1), nullable=False),
+            sa.Column("imagen", sa.LargeBinary().with_variant(mysql.MEDIUMBLOB(), "mysql"), nullable=False),
+            sa.Column("nombre_archivo", sa.String(255)),
+            sa.Column("content_type", sa.String(100)),
+            sa.Column("estado", sa.String(10), nullable=False),
+            sa.Column("intentos", sa.Integer(), nullable=False),
+            sa.Column("ultimo_error", sa.String(500)),
+            sa.Column("disponible_en", sa.DateTime(), nullable=False),
+            sa.Column("bloqueado_en", sa.DateTime()),
+            sa.Column("fecha_creacion", sa.DateTime()),
+            **MYSQL_TABLE_KWARGS,
+        )
+        op.create_index("ix_analysis_jobs_practice_id", "analysis_jobs", ["practice_id"])
+        op.create_index("ix_analysis_jobs_estado_disponible", "analysis_jobs", ["estado", "disponible_en"])
+
+
+def downgrade() -> None:
+    op.drop_table("analysis_jobs")
+    op.drop_table("analyses")
+    op.drop_table("practices")
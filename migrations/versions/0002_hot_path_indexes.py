@@ -0,0 +1,50 @@
+"""Índices para las consultas calientes
+
+- practices (user_id, fecha_carga, practice_id): el historial filtra por usuario y pagina por
+  (fecha_carga, practice_id); reemplaza al índice simple sobre user_id, que es su prefijo.
+- analyses.practice_id único: la relación con la práctica es uno a uno.
+
+En MySQL los índices se crean con ALGORITHM=INPLACE, LOCK=NONE para no bloquear escrituras.
+
+Revision ID: 0002_hot_path_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_hot_path_indexes"
+down_revision = "0001_initial_schema"
+branch_labels = None
+depends_on = None
+
+
+def _create_index_online(name: str, table: str, columns: list, unique: bool = False) -> None:
+    if op.get_bind().dialect.name == "mysql":
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        cols = ", ".join(columns)
+        op.execute(f"ALTER TABLE {table} ADD {kind} {name} ({cols}), ALGORITHM=INPLACE, LOCK=NONE")
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def upgrade() -> None:
+    _create_index_online("ix_practices_user_fecha", "practices", ["user_id", "fecha_carga", "practice_id"])
+    op.drop_index("ix_practices_user_id", table_name="practices")
+
+    # Antes de exigir unicidad se eliminan los análisis duplicados, conservando uno por práctica.
+    # La subconsulta derivada evita el error 1093 de MySQL (misma tabla en DELETE y subconsulta).
+    op.execute(
+        "DELETE FROM analyses WHERE analisis_id NOT IN ("
+        " SELECT analisis_id FROM ("
+        "  SELECT MAX(analisis_id) AS analisis_id FROM analyses GROUP BY practice_id"
+        " ) AS conservar"
+        ")"
+    )
+    _create_index_online("uq_analyses_practice_id", "analyses", ["practice_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_analyses_practice_id", table_name="analyses")
+    op.create_index("ix_practices_user_id", "practices", ["user_id"])
+    op.drop_index("ix_practices_user_fecha", table_name="practices")
@@ -0,0 +1,77 @@
+"""UUID en BINARY(16), fase 1 (expand): columnas nuevas, triggers y backfill
+
+Migración en línea en tres pasos para no bloquear las tablas:
+
+1. (esta migración, con la versión anterior del servicio en marcha)
+   - Añade una columna `<col>_bin BINARY(16)` por cada clave UUID (ALGORITHM=INPLACE, LOCK=NONE).
+   - Crea triggers BEFORE INSERT que rellenan esas columnas para las filas nuevas.
+   - Rellena las filas existentes por lotes, con un commit por lote.
+2. 0004_uuid_binary_contract: se ejecuta en la ventana de despliegue de la nueva versión y
+   sustituye las columnas CHAR(36) por las binarias.
+
+Crear triggers requiere el privilegio TRIGGER (y SUPER o log_bin_trust_function_creators=1
+si el binlog está activo). Si no es posible, usar gh-ost o pt-online-schema-change para el paso 1.
+
+En bases de datos que no son MySQL (SQLite de desarrollo) esta fase no hace nada:
+0004 reconstruye las tablas directamente.
+
+Revision ID: 0003_uuid_binary_expand
+Revises: 0002_hot_path_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_uuid_binary_expand"
+down_revision = "0002_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "practices": ["practice_id", "user_id"],
+    "analyses": ["analisis_id", "practice_id"],
+    "analysis_jobs": ["job_id", "practice_id"],
+}
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _to_bin(expr: str) -> str:
+    return f"UNHEX(REPLACE({expr}, '-', ''))"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "mysql":
+        return
+
+    for table, columns in UUID_COLUMNS.items():
+        added = ", ".join(f"ADD COLUMN {col}_bin BINARY(16) NULL" for col in columns)
+        op.execute(f"ALTER TABLE {table} {added}, ALGORITHM=INPLACE, LOCK=NONE")
+
+        assignments = ", ".join(f"NEW.{col}_bin = {_to_bin(f'NEW.{col}')}" for col in columns)
+        op.execute(
+            f"CREATE TRIGGER {table}_uuid_bin_ins BEFORE INSERT ON {table} "
+            f"FOR EACH ROW SET {assignments}"
+        )
+
+    # Backfill por lotes fuera de la transacción de Alembic para no retener bloqueos
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for table, columns in UUID_COLUMNS.items():
+            assignments = ", ".join(f"{col}_bin = {_to_bin(col)}" for col in columns)
+            pending = f"{columns[0]}_bin IS NULL"
+            while True:
+                result = bind.execute(
+                    sa.text(f"UPDATE {table} SET {assignments} WHERE {pending} LIMIT {BACKFILL_BATCH_SIZE}")
+                )
+                if not result.rowcount:
+                    break
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "mysql":
+        return
+
+    for table, columns in UUID_COLUMNS.items():
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_uuid_bin_ins")
+        dropped = ", ".join(f"DROP COLUMN {col}_bin" for col in columns)
+        op.execute(f"ALTER TABLE {table} {dropped}, ALGORITHM=INPLACE, LOCK=NONE")
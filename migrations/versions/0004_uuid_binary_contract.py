@@ -0,0 +1,177 @@
+"""UUID en BINARY(16), fase 2 (contract): las columnas binarias reemplazan a las CHAR(36)
+
+Debe ejecutarse junto con el despliegue de la versión que usa `BinaryUUID`
+(ver 0003_uuid_binary_expand). En MySQL:
+
+- Elimina los triggers de sincronización y las claves foráneas.
+- En cada tabla, en un único ALTER (INPLACE, sin bloquear DML): elimina la columna CHAR(36),
+  renombra `<col>_bin` a `<col>` y recrea la clave primaria y los índices.
+- Vuelve a crear las claves foráneas (INPLACE con foreign_key_checks=0; los datos ya son consistentes).
+
+En otros motores (SQLite de desarrollo) las tablas se reconstruyen copiando las filas.
+
+Revision ID: 0004_uuid_binary_contract
+Revises: 0003_uuid_binary_expand
+Create Date: 2026-10-18
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "0004_uuid_binary_contract"
+down_revision = "0003_uuid_binary_expand"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "practices": ["practice_id", "user_id"],
+    "analyses": ["analisis_id", "practice_id"],
+    "analysis_jobs": ["job_id", "practice_id"],
+}
+MYSQL_TABLE_KWARGS = {"mysql_collate": "utf8mb4_bin"}
+
+
+def _drop_foreign_keys(table: str) -> None:
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys(table):
+        op.execute(f"ALTER TABLE {table} DROP FOREIGN KEY {fk['name']}")
+
+
+def _upgrade_mysql() -> None:
+    for table in UUID_COLUMNS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_uuid_bin_ins")
+    _drop_foreign_keys("analyses")
+    _drop_foreign_keys("analysis_jobs")
+
+    op.execute(
+        "ALTER TABLE practices"
+        " DROP PRIMARY KEY, DROP INDEX ix_practices_user_fecha,"
+        " DROP COLUMN practice_id, DROP COLUMN user_id,"
+        " CHANGE COLUMN practice_id_bin practice_id BINARY(16) NOT NULL,"
+        " CHANGE COLUMN user_id_bin user_id BINARY(16) NOT NULL,"
+        " ADD PRIMARY KEY (practice_id),"
+        " ADD INDEX ix_practices_user_fecha (user_id, fecha_carga, practice_id),"
+        " ALGORITHM=INPLACE, LOCK=NONE"
+    )
+    op.execute(
+        "ALTER TABLE analyses"
+        " DROP PRIMARY KEY, DROP INDEX uq_analyses_practice_id,"
+        " DROP COLUMN analisis_id, DROP COLUMN practice_id,"
+        " CHANGE COLUMN analisis_id_bin analisis_id BINARY(16) NOT NULL,"
+        " CHANGE COLUMN practice_id_bin practice_id BINARY(16) NOT NULL,"
+        " ADD PRIMARY KEY (analisis_id),"
+        " ADD UNIQUE INDEX uq_analyses_practice_id (practice_id),"
+        " ALGORITHM=INPLACE, LOCK=NONE"
+    )
+    op.execute(
+        "ALTER TABLE analysis_jobs"
+        " DROP PRIMARY KEY, DROP INDEX ix_analysis_jobs_practice_id,"
+        " DROP COLUMN job_id, DROP COLUMN practice_id,"
+        " CHANGE COLUMN job_id_bin job_id BINARY(16) NOT NULL,"
+        " CHANGE COLUMN practice_id_bin practice_id BINARY(16) NOT NULL,"
+        " ADD PRIMARY KEY (job_id),"
+        " ADD INDEX ix_analysis_jobs_practice_id (practice_id),"
+        " ALGORITHM=INPLACE, LOCK=NONE"
+    )
+
+    op.execute("SET foreign_key_checks = 0")
+    op.execute(
+        "ALTER TABLE analyses ADD CONSTRAINT fk_analyses_practice_id"
+        " FOREIGN KEY (practice_id) REFERENCES practices (practice_id),"
+        " ALGORITHM=INPLACE, LOCK=NONE"
+    )
+    op.execute(
+        "ALTER TABLE analysis_jobs ADD CONSTRAINT fk_analysis_jobs_practice_id"
+        " FOREIGN KEY (practice_id) REFERENCES practices (practice_id) ON DELETE CASCADE,"
+        " ALGORITHM=INPLACE, LOCK=NONE"
+    )
+    op.execute("SET foreign_key_checks = 1")
+
+
+def _create_tables(suffix: str, uuid_type) -> None:
+    op.create_table(
+        f"practices{suffix}",
+        sa.Column("practice_id", uuid_type, primary_key=True),
+        sa.Column("user_id", uuid_type, nullable=False),
+        sa.Column("letra_plantilla", sa.String(1), nullable=False),
+        sa.Column("url_imagen", sa.String(255), nullable=False),
+        sa.Column("fecha_carga", sa.DateTime()),
+        sa.Column("estado_analisis", sa.String(10)),
+        **MYSQL_TABLE_KWARGS,
+    )
+    op.create_table(
+        f"analyses{suffix}",
+        sa.Column("analisis_id", uuid_type, primary_key=True),
+        sa.Column("practice_id", uuid_type, sa.ForeignKey("practices.practice_id"), nullable=False),
+        sa.Column("puntuacion_general", sa.Integer()),
+        sa.Column("puntuacion_proporcion", sa.Integer()),
+        sa.Column("puntuacion_inclinacion", sa.Integer()),
+        sa.Column("puntuacion_espaciado", sa.Integer()),
+        sa.Column("puntuacion_consistencia", sa.Integer()),
+        sa.Column("fortalezas", sa.String(255)),
+        sa.Column("areas_mejora", sa.String(255)),
+        **MYSQL_TABLE_KWARGS,
+    )
+    op.create_table(
+        f"analysis_jobs{suffix}",
+        sa.Column("job_id", uuid_type, primary_key=True),
+        sa.Column(
+            "practice_id", uuid_type,
+            sa.ForeignKey("practices.practice_id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column("letra", sa.String(1), nullable=False),
+        sa.Column("imagen", sa.LargeBinary().with_variant(mysql.MEDIUMBLOB(), "mysql"), nullable=False),
+        sa.Column("nombre_archivo", sa.String(255)),
+        sa.Column("content_type", sa.String(100)),
+        sa.Column("estado", sa.String(10), nullable=False),
+        sa.Column("intentos", sa.Integer(), nullable=False),
+        sa.Column("ultimo_error", sa.String(500)),
+        sa.Column("disponible_en", sa.DateTime(), nullable=False),
+        sa.Column("bloqueado_en", sa.DateTime()),
+        sa.Column("fecha_creacion", sa.DateTime()),
+        **MYSQL_TABLE_KWARGS,
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_practices_user_fecha", "practices", ["user_id", "fecha_carga", "practice_id"])
+    op.create_index("uq_analyses_practice_id", "analyses", ["practice_id"], unique=True)
+    op.create_index("ix_analysis_jobs_practice_id", "analysis_jobs", ["practice_id"])
+    op.create_index("ix_analysis_jobs_estado_disponible", "analysis_jobs", ["estado", "disponible_en"])
+
+
+def _rebuild_by_copy(suffix: str, uuid_type, convert) -> None:
+    """Crea tablas `<tabla><suffix>`, copia las filas convirtiendo los UUID y las intercambia."""
+    bind = op.get_bind()
+    _create_tables(suffix, uuid_type)
+    inspector = sa.inspect(bind)
+    for table, columns in UUID_COLUMNS.items():
+        # Tablas sin tipos: SQLite refleja BINARY como NUMERIC y alteraría los valores
+        names = [c["name"] for c in inspector.get_columns(table)]
+        source = sa.table(table, *(sa.column(name) for name in names))
+        target = sa.table(f"{table}{suffix}", *(sa.column(name) for name in names))
+        rows = [dict(row._mapping) for row in bind.execute(sa.select(source))]
+        for row in rows:
+            for col in columns:
+                row[col] = convert(row[col])
+        if rows:
+            bind.execute(target.insert(), rows)
+
+    for table in reversed(list(UUID_COLUMNS)):
+        op.drop_table(table)
+    for table in UUID_COLUMNS:
+        op.rename_table(f"{table}{suffix}", table)
+    _create_indexes()
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "mysql":
+        _upgrade_mysql()
+    else:
+        _rebuild_by_copy("_bin", sa.BINARY(16), lambda value: uuid.UUID(str(value)).bytes)
+
+
+def downgrade() -> None:
+    # Vuelta a CHAR(36) por copia; en MySQL implica reconstruir las tablas (no es en línea)
+    _rebuild_by_copy("_char", sa.CHAR(36), lambda value: str(uuid.UUID(bytes=bytes(value))))
@@ -0,0 +1,68 @@
+"""Resumen de progreso por (usuario, letra)
+
+Crea `practice_letter_stats` y lo rellena a partir de los análisis existentes. A partir de aquí
+lo mantiene el repositorio de prácticas en la misma transacción que completa o elimina una práctica.
+
+Los análisis que complete la versión anterior entre esta migración y el despliegue no se suman.
+Por eso, tras el despliegue, se recalcula el resumen desde `analyses` con
+`python -m tools.rebuild_letter_stats` (idempotente: se puede interrumpir y repetir).
+
+Revision ID: 0005_practice_letter_stats
+Revises: 0004_uuid_binary_contract
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_practice_letter_stats"
+down_revision = "0004_uuid_binary_contract"
+branch_labels = None
+depends_on = None
+
+SCORE_NAMES = ("general", "proporcion", "inclinacion", "espaciado", "consistencia")
+
+_LATEST = (
+    "(SELECT {column} FROM practices p2 JOIN analyses a2 ON a2.practice_id = p2.practice_id"
+    " WHERE p2.user_id = p.user_id AND p2.letra_plantilla = p.letra_plantilla"
+    " ORDER BY p2.fecha_carga DESC, p2.practice_id DESC LIMIT 1)"
+)
+
+
+def upgrade() -> None:
+    uuid_type = sa.BINARY(16)
+    score_columns = []
+    for name in SCORE_NAMES:
+        score_columns += [
+            sa.Column(f"suma_{name}", sa.Integer(), nullable=False),
+            sa.Column(f"min_{name}", sa.Integer(), nullable=False),
+            sa.Column(f"max_{name}", sa.Integer(), nullable=False),
+        ]
+    op.create_table(
+        "practice_letter_stats",
+        sa.Column("user_id", uuid_type, primary_key=True),
+        sa.Column("letra_plantilla", sa.String(1), primary_key=True),
+        sa.Column("intentos", sa.Integer(), nullable=False),
+        *score_columns,
+        sa.Column("ultima_practice_id", uuid_type, nullable=False),
+        sa.Column("ultima_fecha", sa.DateTime(), nullable=False),
+        sa.Column("ultima_puntuacion_general", sa.Integer(), nullable=False),
+        mysql_collate="utf8mb4_bin",
+    )
+
+    aggregates = ", ".join(
+        f"SUM(a.puntuacion_{name}), MIN(a.puntuacion_{name}), MAX(a.puntuacion_{name})" for name in SCORE_NAMES
+    )
+    aggregate_columns = ", ".join(f"suma_{name}, min_{name}, max_{name}" for name in SCORE_NAMES)
+    op.execute(
+        "INSERT INTO practice_letter_stats (user_id, letra_plantilla, intentos, "
+        f"{aggregate_columns}, ultima_practice_id, ultima_fecha, ultima_puntuacion_general) "
+        f"SELECT p.user_id, p.letra_plantilla, COUNT(*), {aggregates}, "
+        f"{_LATEST.format(column='p2.practice_id')}, MAX(p.fecha_carga), "
+        f"{_LATEST.format(column='a2.puntuacion_general')} "
+        "FROM practices p JOIN analyses a ON a.practice_id = p.practice_id "
+        "GROUP BY p.user_id, p.letra_plantilla"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("practice_letter_stats")
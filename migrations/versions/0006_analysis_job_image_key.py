@@ -0,0 +1,45 @@
+"""Los trabajos de análisis referencian la imagen en el almacenamiento de archivos
+
+- analysis_jobs.imagen_key: clave del objeto en IFileStorage.
+- analysis_jobs.imagen pasa a ser opcional. Solo la tienen los trabajos encolados por versiones anteriores,
+  que el worker sigue procesando. Cuando no quede ninguno, una migración posterior podrá eliminar la columna.
+
+En MySQL ambos cambios son INPLACE, sin bloquear la cola.
+
+Revision ID: 0006_analysis_job_image_key
+Revises: 0005_practice_letter_stats
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "0006_analysis_job_image_key"
+down_revision = "0005_practice_letter_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "mysql":
+        op.execute(
+            "ALTER TABLE analysis_jobs ADD COLUMN imagen_key VARCHAR(255) NULL,"
+            " MODIFY COLUMN imagen MEDIUMBLOB NULL, ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    with op.batch_alter_table("analysis_jobs") as batch:
+        batch.add_column(sa.Column("imagen_key", sa.String(255), nullable=True))
+        batch.alter_column("imagen", existing_type=sa.LargeBinary(), nullable=True)
+
+
+def downgrade() -> None:
+    # Los trabajos que solo tienen clave no se pueden representar en el esquema anterior
+    op.execute("DELETE FROM analysis_jobs WHERE imagen IS NULL")
+    with op.batch_alter_table("analysis_jobs") as batch:
+        batch.drop_column("imagen_key")
+        batch.alter_column(
+            "imagen",
+            existing_type=sa.LargeBinary().with_variant(mysql.MEDIUMBLOB(), "mysql"),
+            nullable=False,
+        )
@@ -0,0 +1,39 @@
+"""Caché persistente de resultados de análisis
+
+`analysis_results` guarda la respuesta ya mapeada del servicio de análisis por
+(SHA-256 de la imagen, letra, versión del modelo). Si se sube de nuevo la misma imagen para la misma letra,
+la práctica se completa sin volver a llamar al servicio. Es una tabla nueva, así que no bloquea nada.
+
+Revision ID: 0007_analysis_results
+Revises: 0006_analysis_job_image_key
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_analysis_results"
+down_revision = "0006_analysis_job_image_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_results",
+        sa.Column("sha256", sa.String(64), primary_key=True),
+        sa.Column("letra", sa.String(1), primary_key=True),
+        sa.Column("model_version", sa.String(32), primary_key=True),
+        sa.Column("puntuacion_general", sa.Integer(), nullable=False),
+        sa.Column("puntuacion_proporcion", sa.Integer(), nullable=False),
+        sa.Column("puntuacion_inclinacion", sa.Integer(), nullable=False),
+        sa.Column("puntuacion_espaciado", sa.Integer(), nullable=False),
+        sa.Column("puntuacion_consistencia", sa.Integer(), nullable=False),
+        sa.Column("fortalezas", sa.String(255), nullable=False),
+        sa.Column("areas_mejora", sa.String(255), nullable=False),
+        sa.Column("fecha_creacion", sa.DateTime()),
+        mysql_collate="utf8mb4_bin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("analysis_results")
@@ -0,0 +1,70 @@
+"""El análisis se elimina en cascada con su práctica
+
+`analyses.practice_id` pasa a ser ON DELETE CASCADE, igual que `analysis_jobs.practice_id`. Así una práctica
+se elimina con un único DELETE (comprobando el propietario en la misma sentencia) y el purgado de un usuario
+borra por lotes sin cargar las filas en el ORM.
+
+En MySQL se sustituye la clave foránea sin copiar la tabla (INPLACE). En SQLite la tabla se reconstruye.
+
+Revision ID: 0008_analyses_on_delete_cascade
+Revises: 0007_analysis_results
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_analyses_on_delete_cascade"
+down_revision = "0007_analysis_results"
+branch_labels = None
+depends_on = None
+
+# Columnas de `analyses` (0004) para reconstruir la tabla en SQLite
+ANALYSIS_COLUMNS = (
+    "analisis_id, practice_id, puntuacion_general, puntuacion_proporcion, puntuacion_inclinacion,"
+    " puntuacion_espaciado, puntuacion_consistencia, fortalezas, areas_mejora"
+)
+
+
+def _replace_foreign_key(ondelete) -> None:
+    if op.get_bind().dialect.name == "mysql":
+        for fk in sa.inspect(op.get_bind()).get_foreign_keys("analyses"):
+            op.execute(f"ALTER TABLE analyses DROP FOREIGN KEY {fk['name']}")
+        clause = f" ON DELETE {ondelete}" if ondelete else ""
+        op.execute("SET foreign_key_checks = 0")
+        op.execute(
+            "ALTER TABLE analyses ADD CONSTRAINT fk_analyses_practice_id"
+            f" FOREIGN KEY (practice_id) REFERENCES practices (practice_id){clause},"
+            " ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        op.execute("SET foreign_key_checks = 1")
+        return
+
+    # SQLite no permite cambiar una clave foránea: se copia la tabla con la nueva definición
+    clause = f" ON DELETE {ondelete}" if ondelete else ""
+    op.execute(
+        "CREATE TABLE analyses_new ("
+        " analisis_id BINARY(16) NOT NULL,"
+        " practice_id BINARY(16) NOT NULL,"
+        " puntuacion_general INTEGER,"
+        " puntuacion_proporcion INTEGER,"
+        " puntuacion_inclinacion INTEGER,"
+        " puntuacion_espaciado INTEGER,"
+        " puntuacion_consistencia INTEGER,"
+        " fortalezas VARCHAR(255),"
+        " areas_mejora VARCHAR(255),"
+        " PRIMARY KEY (analisis_id),"
+        f" CONSTRAINT fk_analyses_practice_id FOREIGN KEY (practice_id) REFERENCES practices (practice_id){clause}"
+        ")"
+    )
+    op.execute(f"INSERT INTO analyses_new ({ANALYSIS_COLUMNS}) SELECT {ANALYSIS_COLUMNS} FROM analyses")
+    op.execute("DROP TABLE analyses")
+    op.execute("ALTER TABLE analyses_new RENAME TO analyses")
+    op.create_index("uq_analyses_practice_id", "analyses", ["practice_id"], unique=True)
+
+
+def upgrade() -> None:
+    _replace_foreign_key("CASCADE")
+
+
+def downgrade() -> None:
+    _replace_foreign_key(None)
@@ -0,0 +1,26 @@
+# src/adapters/api/compression.py
+from typing import Sequence
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ResponseCompressionMiddleware:
+    """
+    Comprime con gzip las respuestas de la API cuando el cliente lo acepta (`Accept-Encoding`) y el cuerpo
+    supera `minimum_size`; las pequeñas se envían tal cual, porque comprimirlas no compensa.
+    Las rutas de `exclude_prefixes` (las imágenes de /media, ya comprimidas) no pasan por gzip.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int, compresslevel: int, exclude_prefixes: Sequence[str] = ()
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
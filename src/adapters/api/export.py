@@ -0,0 +1,54 @@
+# src/adapters/api/export.py
+# Serialización por bloques de la exportación del historial (GET /practices/export).
+import csv
+import io
+import json
+from enum import Enum
+from typing import List
+
+from src.ports.repositories.read_models import PracticeExportRow
+
+EXPORT_COLUMNS = PracticeExportRow._fields
+
+
+class FormatoExportacion(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    FormatoExportacion.NDJSON: "application/x-ndjson",
+    FormatoExportacion.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _plain_values(row: PracticeExportRow) -> list:
+    # Las puntuaciones y los textos ya son int/str (o None si la práctica no tiene análisis)
+    return [
+        str(row.practice_id),
+        row.letra_plantilla.value,
+        row.fecha_carga.isoformat(),
+        row.estado_analisis.value if row.estado_analisis is not None else None,
+        *row[4:],
+    ]
+
+
+def ndjson_chunk(rows: List[PracticeExportRow]) -> bytes:
+    """Un objeto JSON por línea; las puntuaciones de una práctica sin análisis van como null."""
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, _plain_values(row))), ensure_ascii=False) + "\n" for row in rows
+    ).encode("utf-8")
+
+
+def csv_header() -> bytes:
+    return csv_chunk([], header=True)
+
+
+def csv_chunk(rows: List[PracticeExportRow], header: bool = False) -> bytes:
+    """Filas CSV (RFC 4180, fin de línea CRLF); las puntuaciones de una práctica sin análisis van vacías."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(_plain_values(row) for row in rows)
+    return buffer.getvalue().encode("utf-8")
@@ -1,43 +1,125 @@
 # src/adapters/api/main.py
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, status, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 # Importamos el router que contiene todos nuestros endpoints de prácticas
 from src.adapters.api import practice_routes
+from src.adapters.api.compression import ResponseCompressionMiddleware
+from src.adapters.api.media import ImmutableStaticFiles
+from src.adapters.api.request_context import RequestContextMiddleware
+from src.adapters.api.responses import build_renderer
+from src.adapters.api.security import token_cache
+from src.adapters.api.uploads import MULTIPART_OVERHEAD, UploadSizeLimitMiddleware
+
+from src.adapters.repositories import database
+from src.adapters.repositories import providers
+from src.adapters.repositories.providers import open_repositories
+from src.adapters.clients import AnalysisServiceClient
+from src.adapters.imaging import build_image_preprocessor
+from src.adapters.workers import AnalysisWorkerPool
+from src.adapters.observability import setup_logging, shutdown_logging
+from src.adapters.observability.metrics import REGISTRY
+from src.adapters.storage import LOCAL_MEDIA_PATH, build_file_storage
+from src.config import settings
+
+logger = logging.getLogger(__name__)
 
-# Importamos lo necesario de SQLAlchemy para la creación inicial de las tablas
-from src.adapters.repositories.database import engine
-from src.adapters.repositories.base import Base
-
-# Es crucial importar los modelos de la base de datos aquí.
-# Aunque no los usemos directamente en este archivo, al importarlos,
-# se registran en los metadatos de `Base`, permitiendo que `create_all` los encuentre.
-from src.adapters.repositories import db_models
-
-# --- Creación de Tablas en la Base de Datos ---
-# Esta línea es la que crea las tablas "practices" y "analyses" en tu base de datos MySQL
-# (específicamente en el schema 'scriptoria_trace') la primera vez que se ejecuta la aplicación.
-# Si las tablas ya existen, no hace nada.
-def init_db():
-    """Inicializa las tablas de la base de datos."""
-    try:
-        print("Creando tablas en la base de datos si no existen...")
-        Base.metadata.create_all(bind=engine)
-        print("Tablas verificadas/creadas exitosamente.")
-    except Exception as e:
-        print(f"Error al crear las tablas: {e}")
-        print("Asegúrate de que la base de datos esté configurada correctamente.")
-
-# Ejecutamos la inicialización de la base de datos
-init_db()
+# --- Esquema de la Base de Datos ---
+# El esquema se gestiona con migraciones de Alembic (carpeta `migrations/`) y se aplica
+# como un paso de despliegue independiente, antes de arrancar los workers:
+#
+#     alembic upgrade head
+#
+# Así el arranque del servicio no toca la base de datos y los cambios de esquema
+# se pueden desplegar sin parar el servicio.
+
+
+# --- Ciclo de Vida de la Aplicación ---
+# Configura el logging, crea el almacenamiento de imágenes, el pool de preprocesado de imágenes y un único cliente
+# HTTP (con pool keep-alive) hacia analysis-service, arranca los workers que procesan la cola de análisis y libera
+# todo al apagar el servicio.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging(
+        level=settings.log_level,
+        fmt=settings.log_format,
+        levels=settings.log_levels,
+        sample_rate=settings.log_sample_rate,
+    )
+    # Un JSON_RENDERER desconocido o sin su paquete instalado falla al arrancar, no en la primera petición
+    build_renderer(settings.json_renderer)
+    file_storage = build_file_storage()
+    analysis_client = None
+    worker_pool = None
+    preprocessor = None
+    if settings.analysis_service_base_url:
+        preprocessor = build_image_preprocessor()
+        if preprocessor is not None:
+            await preprocessor.start()
+        analysis_client = AnalysisServiceClient(
+            base_url=settings.analysis_service_base_url,
+            timeout=settings.analysis_service_timeout,
+            max_connections=settings.analysis_http_max_connections,
+            max_keepalive_connections=settings.analysis_http_max_keepalive_connections,
+            keepalive_expiry=settings.analysis_http_keepalive_expiry,
+            http2=settings.analysis_http2,
+            max_concurrency=settings.analysis_client_max_concurrency,
+            queue_timeout=settings.analysis_client_queue_timeout,
+            max_retries=settings.analysis_client_max_retries,
+            retry_base_delay=settings.analysis_client_retry_base_delay,
+            retry_max_delay=settings.analysis_client_retry_max_delay,
+            breaker_failure_threshold=settings.analysis_breaker_failure_threshold,
+            breaker_recovery_timeout=settings.analysis_breaker_recovery_timeout,
+            breaker_half_open_max_calls=settings.analysis_breaker_half_open_max_calls,
+            lb_strategy=settings.analysis_lb_strategy,
+        )
+        worker_pool = AnalysisWorkerPool(
+            client=analysis_client,
+            repositories_factory=open_repositories,
+            file_storage=file_storage,
+            workers=settings.analysis_workers,
+            max_concurrency=settings.analysis_max_concurrency,
+            poll_interval=settings.analysis_job_poll_interval,
+            max_attempts=settings.analysis_job_max_attempts,
+            retry_backoff=settings.analysis_job_retry_backoff,
+            visibility_timeout=settings.analysis_job_visibility_timeout,
+            model_version=settings.get_analysis_result_version(),
+            preprocessor=preprocessor,
+        )
+        await worker_pool.start()
+    else:
+        logger.warning("ANALYSIS_SERVICE_BASE_URL no está configurada. Los análisis quedarán en cola.")
+
+    app.state.file_storage = file_storage
+    app.state.analysis_client = analysis_client
+    app.state.analysis_worker_pool = worker_pool
+    app.state.image_preprocessor = preprocessor
+    yield
+
+    if worker_pool is not None:
+        await worker_pool.stop()
+    if preprocessor is not None:
+        await preprocessor.aclose()
+    if analysis_client is not None:
+        await analysis_client.aclose()
+    await file_storage.aclose()
+    if providers.practice_cache is not None:
+        await providers.practice_cache.aclose()
+    if database.async_engine is not None:
+        await database.async_engine.dispose()
+    shutdown_logging()
 
 
 # --- Creación de la Aplicación Principal FastAPI ---
 app = FastAPI(
     title="Servicio de Trazos - Scriptoria AI",
     description="Microservicio para gestionar las prácticas de caligrafía de los usuarios y sus análisis.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
@@ -47,6 +129,55 @@ app = FastAPI(
 # Todos los endpoints de ese archivo ahora estarán disponibles bajo la aplicación principal.
 app.include_router(practice_routes.router)
 
+# Límite del cuerpo de las subidas mientras se recibe; el de cada imagen se comprueba en las rutas
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        "/practices": settings.upload_max_bytes + MULTIPART_OVERHEAD,
+        "/practices/batch": settings.upload_batch_max_bytes + MULTIPART_OVERHEAD,
+    },
+)
+
+# Compresión gzip negociada con el cliente para las respuestas grandes (historial, exportaciones)
+if settings.response_gzip_enabled:
+    app.add_middleware(
+        ResponseCompressionMiddleware,
+        minimum_size=settings.response_gzip_minimum_size,
+        compresslevel=settings.response_gzip_level,
+        exclude_prefixes=(LOCAL_MEDIA_PATH,),
+    )
+
+# Identificador de correlación por petición (cabecera X-Request-ID), una línea de log por petición
+# y las métricas HTTP de /metrics
+app.add_middleware(RequestContextMiddleware)
+
+
+def _analysis_client_samples():
+    """Gauges del cliente de analysis-service, leídos en el momento de exportar /metrics."""
+    analysis_client = getattr(app.state, "analysis_client", None)
+    if analysis_client is None:
+        return
+    bulkhead = analysis_client.bulkhead.stats()
+    yield "analysis_requests_in_flight", "Llamadas a analysis-service en curso.", [({}, analysis_client.stats()["in_flight_requests"])]
+    yield "analysis_bulkhead_waiting", "Llamadas esperando hueco en el bulkhead.", [({}, bulkhead["waiting"])]
+    yield "analysis_replica_outstanding", "Peticiones en curso por réplica.", [
+        ({"replica": replica.base_url}, replica.outstanding) for replica in analysis_client.balancer.replicas
+    ]
+    yield "analysis_replica_available", "1 si la réplica admite tráfico (circuito no abierto).", [
+        ({"replica": replica.base_url}, 1 if replica.is_available() else 0) for replica in analysis_client.balancer.replicas
+    ]
+
+
+REGISTRY.register_collector(_analysis_client_samples)
+
+# Con almacenamiento local, las imágenes se sirven desde la propia API
+if settings.file_storage_backend.lower() == "local":
+    app.mount(
+        LOCAL_MEDIA_PATH,
+        ImmutableStaticFiles(directory=settings.file_storage_local_dir, check_dir=False),
+        name="media",
+    )
+
 
 # --- Exception Handlers ---
 @app.exception_handler(RequestValidationError)
@@ -88,12 +219,30 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 
 # --- Endpoints de Nivel de Aplicación ---
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Métricas del proceso en formato de texto de Prometheus."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # Es un buen lugar para mantener endpoints que son para el servicio
 # en general, como una verificación de estado (health check).
 @app.get("/health", status_code=status.HTTP_200_OK, tags=["Monitoring"])
-def health_check():
+def health_check(request: Request):
     """
     Verifica que el servicio esté funcionando correctamente.
     Es útil para sistemas de monitoreo, balanceadores de carga o Kubernetes.
+    Incluye el uso del pool de conexiones hacia analysis-service y los aciertos de las cachés.
     """
-    return {"status": "ok", "service": "TraceService"}
\ No newline at end of file
+    analysis_client = getattr(request.app.state, "analysis_client", None)
+    preprocessor = getattr(request.app.state, "image_preprocessor", None)
+    practice_cache = providers.practice_cache
+    return {
+        "status": "ok",
+        "service": "TraceService",
+        "analysis_client": analysis_client.stats() if analysis_client else None,
+        "image_preprocessing": preprocessor.stats() if preprocessor else None,
+        "practice_cache": practice_cache.stats() if practice_cache else None,
+        "analysis_result_cache": providers.analysis_result_cache.stats(),
+        "jwt_cache": token_cache.stats(),
+    }
\ No newline at end of file
@@ -0,0 +1,17 @@
+# src/adapters/api/media.py
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    Sirve las imágenes del almacenamiento local. La ruta incluye el hash del contenido,
+    así que un objeto nunca cambia y los navegadores/CDN pueden cachearlo indefinidamente.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
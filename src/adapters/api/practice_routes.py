@@ -1,89 +1,96 @@
 # src/adapters/api/practice_routes.py
-from fastapi import APIRouter, Depends, UploadFile, Form, File, HTTPException, status, Request
+import datetime
+import logging
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, UploadFile, Form, File, HTTPException, status, Request, Response, Query, Header
+)
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import AsyncIterator, List, Optional
+from fastapi.responses import StreamingResponse
 
 # DTOs
 from src.use_cases.dtos import (
-    PracticeResultDTO, PracticeHistoryDTO, UpdateAnalysisRequestDTO
+    CreatePracticeResponseDTO, PracticeResultDTO, PracticeHistoryDTO, UpdateAnalysisRequestDTO,
+    BatchCreatePracticeResponseDTO, BatchPracticeItemResultDTO, LetterProgressDTO,
+    AnalysisIngestRequestDTO, AnalysisIngestResponseDTO, PurgeUserPracticesResponseDTO
 )
 # Casos de Uso
 from src.use_cases.create_practice import CreatePracticeUseCase
+from src.use_cases.create_practice_batch import CreatePracticeBatchUseCase, PracticeBatchItem
 from src.use_cases.get_practice_result import GetPracticeResultUseCase
 from src.use_cases.list_user_practices import ListUserPracticesUseCase
+from src.use_cases.get_letter_stats import GetLetterStatsUseCase
 from src.use_cases.update_practice_analysis import UpdatePracticeAnalysisUseCase
+from src.use_cases.ingest_analysis_results import IngestAnalysisResultsUseCase
 from src.use_cases.delete_practice import DeletePracticeUseCase
+from src.use_cases.purge_user_practices import PurgeUserPracticesUseCase
+from src.use_cases.export_user_practices import ExportUserPracticesUseCase, build_export_filter
 
 # Seguridad y dependencias
-from sqlalchemy.orm import Session
-from src.adapters.api.security import get_current_user_id
-from src.adapters.repositories.database import get_db
-from src.adapters.repositories.mysql_practice_repository import MySQLPracticeRepository
-from src.domain.value_objects.enums import LetraPermitida
-from src.adapters.clients import AnalysisServiceClient, AnalysisServiceError
+from src.adapters.api.export import FormatoExportacion, MEDIA_TYPES, csv_chunk, csv_header, ndjson_chunk
+from src.adapters.api.responses import FastJSONResponse, dto_response
+from src.adapters.api.security import get_current_user_id, verify_service_token
+from src.adapters.api.uploads import UploadRejectedError, inspect_upload
+from src.adapters.observability import bind_practice_id
+from src.adapters.repositories.providers import Repositories, get_repositories, open_repositories
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from src.ports.storage.file_storage import IFileStorage
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+from src.ports.repositories.read_models import PracticeExportFilter
 from src.config import settings
 
 router = APIRouter(prefix="/practices", tags=["Prácticas de Caligrafía"])
+logger = logging.getLogger(__name__)
 
 # --- Inyección de Dependencias ---
-def get_practice_repository(db: Session = Depends(get_db)) -> MySQLPracticeRepository:
-    return MySQLPracticeRepository(db=db)
+def get_practice_repository(repositories: Repositories = Depends(get_repositories)) -> IAsyncPracticeRepository:
+    return repositories.practices
 
+def get_analysis_result_repository(repositories: Repositories = Depends(get_repositories)) -> IAsyncAnalysisResultRepository:
+    return repositories.analysis_results
 
-def _clamp_score(value: Any) -> int:
-    try:
-        numeric = float(value)
-    except (TypeError, ValueError):
-        return 0
-    return max(0, min(100, int(round(numeric))))
+def get_file_storage(request: Request) -> IFileStorage:
+    return request.app.state.file_storage
 
 
-def _short_text(value: Optional[str]) -> str:
-    text = value or "Sin información disponible"
-    return text[:255]
+def _practice_etag(practice: PracticeResultDTO) -> str:
+    # El contenido de una práctica solo cambia con su transición de estado
+    # (PENDIENTE -> COMPLETADO/ERROR), así que (id, estado) identifica la representación
+    return f'"{practice.practice_id}-{practice.estado_analisis.value}"'
 
 
-def _build_analysis_request_dto(payload: Dict[str, Any]) -> UpdateAnalysisRequestDTO:
-    metrics = payload.get("metricas_detalle", {}) or {}
-    feedback = payload.get("feedback_final", {}) or {}
-    fortalezas_candidate = metrics.get("fortalezas_base")
-    areas_candidate = metrics.get("areas_mejora_base")
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Comparación débil (RFC 9110): se ignora el prefijo W/
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
 
-    if not fortalezas_candidate:
-        analisis_reglas = feedback.get("analisis_reglas")
-        if isinstance(analisis_reglas, dict):
-            fortalezas_candidate = analisis_reglas.get("fortalezas")
-        else:
-            fortalezas_candidate = feedback.get("fortalezas")
 
-    if not areas_candidate:
-        analisis_reglas = feedback.get("analisis_reglas")
-        if isinstance(analisis_reglas, dict):
-            areas_candidate = analisis_reglas.get("areas_mejora")
-        else:
-            areas_candidate = feedback.get("areas_mejora")
-
-    return UpdateAnalysisRequestDTO(
-        puntuacion_general=_clamp_score(metrics.get("score_global")),
-        puntuacion_proporcion=_clamp_score(metrics.get("puntuacion_proporcion")),
-        puntuacion_inclinacion=_clamp_score(metrics.get("puntuacion_inclinacion")),
-        puntuacion_espaciado=_clamp_score(metrics.get("puntuacion_espaciado")),
-        puntuacion_consistencia=_clamp_score(metrics.get("puntuacion_consistencia")),
-        fortalezas=_short_text(fortalezas_candidate),
-        areas_mejora=_short_text(areas_candidate),
-    )
+def _notify_analysis_workers(request: Request) -> None:
+    worker_pool = getattr(request.app.state, "analysis_worker_pool", None)
+    if worker_pool is not None:
+        worker_pool.notify()
 
 
 # --- Endpoints ---
 
-@router.post("", response_model=PracticeResultDTO, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=CreatePracticeResponseDTO, status_code=status.HTTP_202_ACCEPTED)
 async def create_practice(
+    request: Request,
     user_id: uuid.UUID = Depends(get_current_user_id),
     letra: str = Form(...),
     imagen: UploadFile = File(...),
-    repo: MySQLPracticeRepository = Depends(get_practice_repository)
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository),
+    file_storage: IFileStorage = Depends(get_file_storage),
+    result_repo: IAsyncAnalysisResultRepository = Depends(get_analysis_result_repository)
 ):
-    """Sube una nueva práctica y coordina el análisis con el microservicio externo."""
+    """
+    Sube una nueva práctica y encola su análisis.
+    Responde de inmediato con la práctica en estado PENDIENTE; el resultado se consulta en GET /practices/{practice_id}.
+    Si la misma imagen ya se analizó para esa letra, la práctica se devuelve directamente COMPLETADA.
+    """
     
     # Validar que la letra sea un valor válido del enum
     try:
@@ -101,141 +108,338 @@ async def create_practice(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="El campo 'imagen' es requerido y debe contener un archivo. Asegúrate de enviar el archivo en el campo 'imagen' del formulario multipart/form-data."
         )
-    
-    print(f"[TraceService] Recibida petición POST /practices - letra: {letra_enum.value}, usuario: {user_id}, archivo: {imagen.filename}")
-    
-    # Leer los bytes para reenviarlos al servicio de análisis
-    try:
-        image_bytes = await imagen.read()
-        imagen.file.seek(0)  # Permite reusar el archivo en otras capas si es necesario
-    except Exception as e:
-        print(f"[TraceService] ERROR al leer el archivo: {e}")
+
+    if imagen.size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Error al leer el archivo de imagen: {str(e)}"
+            detail="La imagen recibida está vacía. Por favor, envía un archivo de imagen válido."
         )
-    
-    if not image_bytes:
+
+    # Tamaño y formato real de la imagen, antes de tocar el almacenamiento o la base de datos
+    try:
+        content_type = await inspect_upload(imagen, settings.upload_max_bytes)
+    except UploadRejectedError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    # El caso de uso copia la imagen al almacenamiento desde el temporal de la subida
+    use_case = CreatePracticeUseCase(repo, file_storage, result_repo)
+    creation_response = await use_case.execute(
+        user_id=user_id, letra=letra_enum, imagen=imagen, content_type=content_type
+    )
+    bind_practice_id(creation_response.practice_id)
+    if creation_response.estado_analisis == EstadoAnalisis.PENDIENTE:
+        _notify_analysis_workers(request)
+    logger.info(
+        "Práctica creada",
+        extra={
+            "user_id": str(user_id),
+            "letra": letra_enum.value,
+            "size": imagen.size,
+            "content_type": content_type,
+            "estado": creation_response.estado_analisis.value,
+            "sampled": True,
+        },
+    )
+
+    return creation_response
+
+@router.post("/batch", response_model=BatchCreatePracticeResponseDTO, status_code=status.HTTP_202_ACCEPTED)
+async def create_practice_batch(
+    request: Request,
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    letras: List[str] = Form(...),
+    imagenes: List[UploadFile] = File(...),
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository),
+    file_storage: IFileStorage = Depends(get_file_storage),
+    result_repo: IAsyncAnalysisResultRepository = Depends(get_analysis_result_repository)
+):
+    """
+    Sube varias prácticas en una sola petición multipart.
+    Los campos 'letras' e 'imagenes' se repiten y se emparejan por posición.
+    Los elementos inválidos se reportan individualmente sin impedir que el resto se registre.
+    """
+    if len(letras) != len(imagenes):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="La imagen recibida está vacía. Por favor, envía un archivo de imagen válido."
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Se recibieron {len(letras)} letras y {len(imagenes)} imágenes; deben emparejarse una a una."
         )
-    
-    print(f"[TraceService] Imagen recibida correctamente - tamaño: {len(image_bytes)} bytes, tipo: {imagen.content_type}")
-
-    use_case = CreatePracticeUseCase(repo)
-    creation_response = use_case.execute(user_id=user_id, letra=letra_enum, imagen=imagen)
-    practice_id = uuid.UUID(creation_response.practice_id)
-    print(f"[TraceService] Práctica creada con ID: {practice_id}")
-
-    # Intentar conectarse al servicio de análisis
-    analysis_client = None
-    if not settings.analysis_service_base_url:
-        print("[TraceService] ADVERTENCIA: ANALYSIS_SERVICE_BASE_URL no está configurada. El análisis se omitirá.")
-    else:
+    if len(letras) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"El lote supera el máximo de {settings.batch_max_items} prácticas por petición."
+        )
+
+    resultados: List[BatchPracticeItemResultDTO] = []
+    items: List[PracticeBatchItem] = []
+    indices_validos: List[int] = []
+    for indice, (letra, imagen) in enumerate(zip(letras, imagenes)):
         try:
-            analysis_client = AnalysisServiceClient(
-                base_url=settings.analysis_service_base_url,
-                timeout=settings.analysis_service_timeout,
-            )
-            print(f"[TraceService] Cliente de análisis inicializado. URL base: {settings.analysis_service_base_url}")
-        except AnalysisServiceError as exc:
-            print(f"[TraceService] ERROR: No se pudo inicializar el cliente de análisis: {exc}")
-            analysis_client = None
+            letra_enum = LetraPermitida(letra)
+        except ValueError:
+            resultados.append(BatchPracticeItemResultDTO(indice=indice, letra=letra, error=f"Valor de 'letra' inválido: '{letra}'."))
+            continue
+
+        if not imagen or not imagen.filename:
+            resultados.append(BatchPracticeItemResultDTO(indice=indice, letra=letra, error="La imagen es requerida."))
+            continue
+
+        if imagen.size == 0:
+            resultados.append(BatchPracticeItemResultDTO(indice=indice, letra=letra, error="La imagen recibida está vacía."))
+            continue
 
-    if analysis_client and image_bytes:
         try:
-            print(f"[TraceService] Enviando análisis a Analysis Service para práctica {practice_id}...")
-            analysis_payload = await analysis_client.analyze_letter(
-                letter_char=letra_enum.value,
-                image_bytes=image_bytes,
-                filename=imagen.filename,
-                content_type=imagen.content_type,
-            )
-            print(f"[TraceService] Análisis recibido exitosamente para práctica {practice_id}")
-            
-            analysis_dto = _build_analysis_request_dto(analysis_payload)
-            update_uc = UpdatePracticeAnalysisUseCase(repo)
-            update_uc.execute(practice_id=practice_id, analysis_data=analysis_dto)
-            print(f"[TraceService] Práctica {practice_id} actualizada con resultados del análisis")
-        except AnalysisServiceError as exc:
-            print(f"[TraceService] ERROR al comunicarse con Analysis Service: {exc}")
-        except Exception as exc:  # noqa: BLE001
-            print(f"[TraceService] ERROR inesperado al procesar análisis: {type(exc).__name__}: {exc}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print(f"[TraceService] Análisis no ejecutado. Cliente disponible: {analysis_client is not None}, Imagen disponible: {len(image_bytes) > 0}")
-
-    # Devolver el resultado actualizado (o pendiente si falló el análisis)
-    result_uc = GetPracticeResultUseCase(repo)
-    result = result_uc.execute(practice_id)
-    print(f"[TraceService] Devolviendo resultado para práctica {practice_id}")
-    return result
-
-@router.get("/history", response_model=List[PracticeHistoryDTO])
-def get_user_history(
+            content_type = await inspect_upload(imagen, settings.upload_max_bytes)
+        except UploadRejectedError as e:
+            resultados.append(BatchPracticeItemResultDTO(indice=indice, letra=letra, error=str(e)))
+            continue
+
+        items.append(PracticeBatchItem(letra=letra_enum, imagen=imagen, content_type=content_type))
+        indices_validos.append(indice)
+
+    use_case = CreatePracticeBatchUseCase(repo, file_storage, result_repo)
+    creadas = await use_case.execute(user_id=user_id, items=items)
+    if any(creada.estado_analisis == EstadoAnalisis.PENDIENTE for creada in creadas):
+        _notify_analysis_workers(request)
+
+    for indice, creada in zip(indices_validos, creadas):
+        resultados.append(BatchPracticeItemResultDTO(
+            indice=indice,
+            letra=letras[indice],
+            practice_id=creada.practice_id,
+            estado_analisis=creada.estado_analisis,
+        ))
+    resultados.sort(key=lambda r: r.indice)
+
+    logger.info(
+        "Lote registrado",
+        extra={
+            "user_id": str(user_id),
+            "aceptadas": len(creadas),
+            "rechazadas": len(resultados) - len(creadas),
+            "sampled": True,
+        },
+    )
+    return BatchCreatePracticeResponseDTO(
+        total=len(resultados),
+        aceptadas=len(creadas),
+        rechazadas=len(resultados) - len(creadas),
+        resultados=resultados,
+    )
+
+@router.get("/history", response_model=List[PracticeHistoryDTO], response_class=FastJSONResponse)
+async def get_user_history(
     user_id: uuid.UUID = Depends(get_current_user_id),
-    repo: MySQLPracticeRepository = Depends(get_practice_repository)
+    limit: Optional[int] = Query(None, ge=1, le=settings.history_page_size_max),
+    cursor: Optional[str] = Query(None),
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository)
 ):
-    """Obtiene el historial de prácticas de un usuario."""
+    """
+    Obtiene el historial de prácticas de un usuario, de la más reciente a la más antigua.
+    Si hay más resultados, la cabecera `X-Next-Cursor` trae el valor de `cursor` para pedir la siguiente página.
+    """
     use_case = ListUserPracticesUseCase(repo)
-    return use_case.execute(user_id=user_id)
+    try:
+        page = await use_case.execute(
+            user_id=user_id, limit=limit or settings.history_page_size_default, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+    return dto_response(page.items, headers=headers)
+
+@router.get("/stats", response_model=List[LetterProgressDTO])
+async def get_user_letter_stats(
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository)
+):
+    """
+    Obtiene el progreso del usuario por letra: intentos, promedio/mínimo/máximo de cada puntuación y último intento.
+    Solo cuenta las prácticas con el análisis completado.
+    """
+    use_case = GetLetterStatsUseCase(repo)
+    return await use_case.execute(user_id)
+
+async def _export_chunks(
+    user_id: uuid.UUID, filtro: PracticeExportFilter, formato: FormatoExportacion
+) -> AsyncIterator[bytes]:
+    # La respuesta se envía después de salir del endpoint, cuando la sesión de la petición ya se cerró:
+    # la exportación abre la suya y la mantiene hasta el último bloque
+    if formato == FormatoExportacion.CSV:
+        yield csv_header()
+    filas = 0
+    try:
+        async with open_repositories() as repositories:
+            use_case = ExportUserPracticesUseCase(repositories.practices, batch_size=settings.export_batch_size)
+            async for rows in use_case.execute(user_id, filtro):
+                filas += len(rows)
+                yield csv_chunk(rows) if formato == FormatoExportacion.CSV else ndjson_chunk(rows)
+    except Exception:
+        # La cabecera 200 ya salió: se corta la conexión para que el cliente no dé el fichero por completo
+        logger.exception("Error durante la exportación del historial", extra={"user_id": str(user_id), "filas": filas})
+        raise
+    logger.info(
+        "Historial exportado",
+        extra={"user_id": str(user_id), "formato": formato.value, "filas": filas},
+    )
+
+@router.get("/export")
+async def export_user_history(
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    formato: FormatoExportacion = Query(FormatoExportacion.NDJSON),
+    letra: Optional[str] = Query(None),
+    desde: Optional[datetime.datetime] = Query(None, description="Fecha de carga mínima (incluida)."),
+    hasta: Optional[datetime.datetime] = Query(None, description="Fecha de carga máxima (excluida)."),
+):
+    """
+    Exporta el historial completo del usuario, con el análisis de cada práctica, como NDJSON o CSV.
+    Las filas se envían a medida que se leen de la base de datos: la descarga empieza antes de que termine
+    la consulta y la memoria no depende del tamaño del historial. Se puede filtrar por letra y por fecha de carga.
+    """
+    letra_enum = None
+    if letra is not None:
+        try:
+            letra_enum = LetraPermitida(letra)
+        except ValueError:
+            valores_validos = [e.value for e in LetraPermitida]
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Valor de 'letra' inválido: '{letra}'. Valores permitidos: {valores_validos}"
+            )
+    try:
+        filtro = build_export_filter(letra=letra_enum, desde=desde, hasta=hasta)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        _export_chunks(user_id, filtro, formato),
+        media_type=MEDIA_TYPES[formato],
+        headers={
+            "Content-Disposition": f'attachment; filename="practicas-{user_id}.{formato.value}"',
+            "Cache-Control": "no-store",
+        },
+    )
 
-@router.get("/{practice_id}", response_model=PracticeResultDTO)
-def get_practice_result(
+@router.get("/{practice_id}", response_model=PracticeResultDTO, response_class=FastJSONResponse)
+async def get_practice_result(
     practice_id: uuid.UUID,
     user_id: uuid.UUID = Depends(get_current_user_id),
-    repo: MySQLPracticeRepository = Depends(get_practice_repository)
+    if_none_match: Optional[str] = Header(None),
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository)
 ):
-    """Obtiene el resultado detallado de una práctica específica."""
+    """
+    Obtiene el resultado detallado de una práctica específica.
+    Devuelve un `ETag`; si el cliente lo reenvía en `If-None-Match` y la práctica no cambió, responde 304 sin cuerpo.
+    """
     use_case = GetPracticeResultUseCase(repo)
     try:
-        practice = use_case.execute(practice_id)
-        # Valida que el usuario solo pueda ver sus propias prácticas
-        if practice.user_id != str(user_id):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Acceso denegado a esta práctica.")
-        return practice
+        practice = await use_case.execute(practice_id)
     except FileNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Práctica no encontrada.")
 
-@router.put("/{practice_id}/analysis", response_model=PracticeResultDTO)
-def update_practice_analysis(
+    # Valida que el usuario solo pueda ver sus propias prácticas
+    if practice.user_id != str(user_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Acceso denegado a esta práctica.")
+
+    etag = _practice_etag(practice)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    return dto_response(practice, headers=cache_headers)
+
+@router.put("/{practice_id}/analysis", response_model=PracticeResultDTO, dependencies=[Depends(verify_service_token)])
+async def update_practice_analysis(
     practice_id: uuid.UUID,
     request: UpdateAnalysisRequestDTO,
-    repo: MySQLPracticeRepository = Depends(get_practice_repository)
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository)
 ):
     """
     ENDPOINT INTERNO: Usado por el servicio de IA para registrar los resultados de un análisis.
-    En producción, este endpoint debería estar protegido por un método de autenticación de servicio a servicio.
+    Requiere el token de servicio en la cabecera `X-Service-Token`.
     """
     use_case = UpdatePracticeAnalysisUseCase(repo)
     try:
-        return use_case.execute(practice_id=practice_id, analysis_data=request)
+        return await use_case.execute(practice_id=practice_id, analysis_data=request)
     except FileNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Práctica no encontrada.")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
+@router.post("/analyses/batch", response_model=AnalysisIngestResponseDTO, dependencies=[Depends(verify_service_token)])
+async def ingest_analysis_results(
+    request: AnalysisIngestRequestDTO,
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository)
+):
+    """
+    ENDPOINT INTERNO: Usado por el servicio de IA para registrar muchos resultados en una sola transacción.
+    Cada elemento indica si se aplicó, si la práctica no existe o si ya no estaba pendiente; esos casos
+    no hacen fallar al resto del lote. Requiere el token de servicio en la cabecera `X-Service-Token`.
+    """
+    if len(request.resultados) > settings.analysis_ingest_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"El lote supera el máximo de {settings.analysis_ingest_max_items} resultados por petición."
+        )
+
+    respuesta = await IngestAnalysisResultsUseCase(repo).execute(request.resultados)
+    logger.info(
+        "Lote de análisis registrado",
+        extra={
+            "total": respuesta.total,
+            "aplicados": respuesta.aplicados,
+            "no_encontradas": respuesta.no_encontradas,
+            "ya_completadas": respuesta.ya_completadas,
+        },
+    )
+    return respuesta
+
 @router.delete("/{practice_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_practice(
+async def delete_practice(
     practice_id: uuid.UUID,
     user_id: uuid.UUID = Depends(get_current_user_id),
-    repo: MySQLPracticeRepository = Depends(get_practice_repository)
+    repo: IAsyncPracticeRepository = Depends(get_practice_repository)
 ):
-    """Elimina una práctica del historial."""
-    # Primero, verifica que la práctica pertenece al usuario
-    practice_repo_check = GetPracticeResultUseCase(repo)
+    """Elimina una práctica del historial. Solo el usuario que la subió puede eliminarla."""
+    use_case = DeletePracticeUseCase(repo)
     try:
-        practice = practice_repo_check.execute(practice_id)
-        if practice.user_id != str(user_id):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No tienes permiso para eliminar esta práctica.")
+        await use_case.execute(practice_id, user_id)
     except FileNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Práctica no encontrada.")
+    except PermissionError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
 
-    # Si todo está bien, procede a eliminar
-    use_case = DeletePracticeUseCase(repo)
-    use_case.execute(practice_id)
+
+async def _purge_user_practices(user_id: uuid.UUID) -> None:
+    # Se ejecuta después de enviar la respuesta, con su propia sesión: la de la petición ya se cerró
+    try:
+        async with open_repositories() as repositories:
+            use_case = PurgeUserPracticesUseCase(
+                repositories.practices,
+                batch_size=settings.purge_batch_size,
+                pause=settings.purge_batch_pause,
+            )
+            total = await use_case.execute(user_id)
+    except Exception:
+        logger.exception("Error al purgar el historial del usuario", extra={"user_id": str(user_id)})
+        return
+    logger.info("Historial del usuario purgado", extra={"user_id": str(user_id), "practicas_eliminadas": total})
+
+@router.delete("", response_model=PurgeUserPracticesResponseDTO, status_code=status.HTTP_202_ACCEPTED)
+async def purge_user_practices(
+    background_tasks: BackgroundTasks,
+    user_id: uuid.UUID = Depends(get_current_user_id)
+):
+    """
+    Elimina todo el historial del usuario autenticado (baja de la cuenta), con sus análisis y su resumen por letra.
+    Responde 202 al momento y borra en segundo plano por lotes (`PURGE_BATCH_SIZE`, `PURGE_BATCH_PAUSE`).
+    Es idempotente: si se interrumpe, basta con volver a llamarlo.
+    """
+    background_tasks.add_task(_purge_user_practices, user_id)
+    return PurgeUserPracticesResponseDTO(
+        user_id=str(user_id),
+        mensaje="El historial se está eliminando. Puede tardar unos minutos si tiene muchas prácticas."
+    )
 
 
 # --- Endpoint de Debug (TEMPORAL - Eliminar en producción) ---
@@ -247,15 +451,15 @@ async def debug_practice_request(
     """Endpoint temporal para debuggear qué está llegando en la petición."""
     try:
         content_type = request.headers.get("content-type", "")
-        print(f"[DEBUG] Content-Type: {content_type}")
-        print(f"[DEBUG] Headers: {dict(request.headers)}")
+        # Las cabeceras no se registran: incluyen el token de autorización
+        logger.debug("Petición de debug", extra={"content_type": content_type})
         
         form_data = {}
         files_received = {}
         
         if "multipart/form-data" in content_type:
             form = await request.form()
-            print(f"[DEBUG] Form keys recibidos: {list(form.keys())}")
+            logger.debug("Campos del formulario", extra={"form_keys": list(form.keys())})
             
             for key, value in form.items():
                 if hasattr(value, 'filename') or isinstance(value, UploadFile):
@@ -268,10 +472,9 @@ async def debug_practice_request(
                         value.file.seek(0)
                 else:
                     form_data[key] = value
-                    print(f"[DEBUG] Form field '{key}': {value}")
         else:
             body = await request.body()
-            print(f"[DEBUG] Body recibido (no multipart): {body[:200]}")
+            logger.debug("Cuerpo no multipart", extra={"body_size": len(body)})
         
         return {
             "content_type": content_type,
@@ -284,7 +487,7 @@ async def debug_practice_request(
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
-        print(f"[DEBUG] ERROR: {error_detail}")
+        logger.exception("Error en el endpoint de debug")
         return {
             "error": str(e),
             "traceback": error_detail
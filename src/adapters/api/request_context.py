@@ -0,0 +1,74 @@
+# src/adapters/api/request_context.py
+import logging
+import re
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.observability import log_context
+from src.adapters.observability.instrumentation import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS, route_label
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "x-request-id"
+# Se acepta el identificador del cliente o del proxy solo si es corto y sin caracteres raros
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+
+class RequestContextMiddleware:
+    """
+    Asigna a cada petición un `request_id` (el de la cabecera `X-Request-ID` o uno nuevo),
+    lo deja en el contexto de logging, lo devuelve en la respuesta y registra una línea
+    por petición con el estado y la duración (muestreada, salvo los 5xx). La misma medida
+    alimenta el histograma `http_request_duration_seconds` de /metrics.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER.encode("latin-1"):
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        status_code = 500
+        method = scope["method"]
+        HTTP_REQUESTS_IN_PROGRESS.inc(method)
+        start = time.perf_counter()
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (REQUEST_ID_HEADER.encode("latin-1"), request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        with log_context(request_id=request_id):
+            try:
+                await self.app(scope, receive, send_with_request_id)
+            finally:
+                duration = time.perf_counter() - start
+                HTTP_REQUESTS_IN_PROGRESS.dec(method)
+                HTTP_REQUEST_DURATION.observe(duration, method, route_label(scope), str(status_code))
+                duration_ms = round(duration * 1000, 1)
+                logger.log(
+                    logging.ERROR if status_code >= 500 else logging.INFO,
+                    "%s %s -> %s",
+                    method,
+                    scope["path"],
+                    status_code,
+                    extra={"status": status_code, "duration_ms": duration_ms, "sampled": True},
+                )
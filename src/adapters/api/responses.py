@@ -0,0 +1,79 @@
+# src/adapters/api/responses.py
+import functools
+import json
+from typing import Any, Callable, Mapping, Optional
+
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.config import settings
+
+Renderer = Callable[[Any], bytes]
+
+
+def render_standard(content: Any) -> bytes:
+    """El mismo resultado que FastAPI por defecto: `jsonable_encoder` y `JSONResponse.render`."""
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def render_pydantic(content: Any) -> bytes:
+    """Serializa los DTOs directamente con pydantic-core, sin pasar por dicts intermedios."""
+    return to_json(content)
+
+
+def _orjson_renderer() -> Renderer:
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError("JSON_RENDERER=orjson requiere el paquete 'orjson' (pip install orjson).") from e
+
+    def default(value: Any) -> Any:
+        # orjson serializa por sí mismo datetime, UUID y enums; los DTOs se le pasan como dict
+        if isinstance(value, BaseModel):
+            return value.model_dump()
+        raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+    def render_orjson(content: Any) -> bytes:
+        return orjson.dumps(content, default=default)
+
+    return render_orjson
+
+
+@functools.lru_cache(maxsize=None)
+def build_renderer(name: str) -> Renderer:
+    """
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún renderizador.
+        ImportError: Si el renderizador necesita un paquete opcional que no está instalado.
+    """
+    if name == "standard":
+        return render_standard
+    if name == "pydantic":
+        return render_pydantic
+    if name == "orjson":
+        return _orjson_renderer()
+    raise ValueError(f"JSON_RENDERER desconocido: '{name}'. Valores permitidos: ['orjson', 'pydantic', 'standard']")
+
+
+class FastJSONResponse(JSONResponse):
+    """`JSONResponse` que serializa con el renderizador configurado en `JSON_RENDERER`."""
+
+    def render(self, content: Any) -> bytes:
+        return build_renderer(settings.json_renderer)(content)
+
+
+def dto_response(
+    content: Any, status_code: int = status.HTTP_200_OK, headers: Optional[Mapping[str, str]] = None
+) -> FastJSONResponse:
+    """
+    Respuesta JSON para DTOs que los casos de uso ya construyeron a partir de datos de la base de datos.
+    Si la ruta devuelve el DTO, FastAPI lo vuelca a dict y lo valida otra vez contra `response_model`
+    antes de serializarlo; al devolver una `Response` se serializa una sola vez.
+    `response_model` se mantiene en la ruta para la documentación de OpenAPI.
+    """
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
@@ -1,8 +1,13 @@
 # src/adapters/api/security.py
+import hmac
+import time
 import uuid
+from typing import Optional
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from jose import JWTError, jwt
+from src.adapters.cache import TokenVerificationCache
+from src.adapters.observability.instrumentation import JWT_VERIFICATION_DURATION
 from src.config import settings
 
 # Esta URL es ficticia. Le dice a Swagger UI dónde debe ir el cliente para obtener un token.
@@ -15,11 +20,25 @@ CREDENTIALS_EXCEPTION = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+# Endpoints internos: analysis-service se identifica con un token compartido en esta cabecera
+service_token_header = APIKeyHeader(name="X-Service-Token", auto_error=False)
+_service_tokens = [t.strip().encode() for t in (settings.service_auth_tokens or "").split(",") if t.strip()]
+
+# Tokens ya verificados en este proceso; un cliente que sondea reutiliza el mismo token muchas veces
+token_cache = TokenVerificationCache(max_entries=settings.jwt_cache_max_entries, ttl=settings.jwt_cache_ttl)
+
 def get_current_user_id(token: str = Depends(oauth2_scheme)) -> uuid.UUID:
     """
     Decodifica el token JWT para obtener el ID del usuario.
     Esta función es una dependencia de FastAPI que se puede inyectar en los endpoints.
+    Los tokens ya verificados se resuelven desde `token_cache` sin volver a comprobar la firma.
     """
+    start = time.perf_counter()
+    cached_user_id = token_cache.get(token)
+    if cached_user_id is not None:
+        JWT_VERIFICATION_DURATION.observe(time.perf_counter() - start, "hit")
+        return cached_user_id
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         
@@ -37,5 +56,29 @@ def get_current_user_id(token: str = Depends(oauth2_scheme)) -> uuid.UUID:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="El ID de usuario en el token es inválido."
         )
-        
-    return user_id
\ No newline at end of file
+
+    token_cache.put(token, user_id, payload.get("exp"))
+    JWT_VERIFICATION_DURATION.observe(time.perf_counter() - start, "miss")
+    return user_id
+
+
+def verify_service_token(token: Optional[str] = Depends(service_token_header)) -> None:
+    """
+    Dependencia de los endpoints que solo puede llamar analysis-service. Exige en `X-Service-Token`
+    uno de los tokens de SERVICE_AUTH_TOKENS; la comparación es de tiempo constante.
+    """
+    if not _service_tokens:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="La autenticación de servicio no está configurada.",
+        )
+    if token is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Falta el token de servicio.")
+
+    candidate = token.encode()
+    # Se comparan todos los tokens, aunque uno ya coincida, para no revelar por tiempo cuál es
+    valid = False
+    for expected in _service_tokens:
+        valid |= hmac.compare_digest(candidate, expected)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token de servicio inválido.")
@@ -0,0 +1,120 @@
+# src/adapters/api/uploads.py
+import logging
+from typing import Mapping, Optional
+
+from fastapi import HTTPException, UploadFile, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Margen para los campos del formulario y los delimitadores multipart alrededor de la imagen
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Bytes necesarios para reconocer cualquiera de los formatos admitidos
+_SNIFF_SIZE = 12
+
+
+class UploadRejectedError(ValueError):
+    """La imagen subida no se admite; `status_code` es el código HTTP con el que se rechaza."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """Tipo de imagen según sus primeros bytes (firma del formato); None si no es PNG, JPEG ni WEBP."""
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+async def inspect_upload(imagen: UploadFile, max_bytes: int) -> str:
+    """
+    Comprueba el tamaño de la imagen ya recibida y reconoce su formato por la firma, sin fiarse
+    del Content-Type que declara el cliente. Solo lee la cabecera del archivo.
+
+    Returns:
+        El tipo MIME real de la imagen.
+
+    Raises:
+        UploadRejectedError: 413 si supera `max_bytes`; 415 si no es una imagen admitida.
+    """
+    if imagen.size is not None and imagen.size > max_bytes:
+        raise UploadRejectedError(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            f"La imagen '{imagen.filename}' supera el máximo de {max_bytes} bytes.",
+        )
+
+    await imagen.seek(0)
+    header = await imagen.read(_SNIFF_SIZE)
+    await imagen.seek(0)
+
+    content_type = sniff_image_type(header)
+    if content_type is None:
+        raise UploadRejectedError(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            f"El archivo '{imagen.filename}' no es una imagen PNG, JPEG o WEBP.",
+        )
+    if imagen.content_type and imagen.content_type != content_type:
+        logger.debug(
+            "El Content-Type declarado no coincide con el contenido",
+            extra={"declarado": imagen.content_type, "detectado": content_type},
+        )
+    return content_type
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Limita el tamaño del cuerpo de las rutas de subida mientras se recibe. Si `Content-Length` ya supera
+    el límite, responde 413 sin leer el cuerpo; si no (p. ej. con chunked), cuenta los bytes y corta en
+    cuanto lo superan. Así una subida enorme no llega a volcarse entera al temporal del formulario.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Mapping[str, int]) -> None:
+        self.app = app
+        # Ruta exacta -> bytes como máximo del cuerpo
+        self.limits = dict(limits)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" and scope["method"] == "POST" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > limit:
+                    response = JSONResponse(
+                        {"detail": _too_large_detail(limit)}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # FastAPI propaga las HTTPException que surgen al leer el formulario
+                    raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _too_large_detail(limit))
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def _too_large_detail(limit: int) -> str:
+    return f"La petición supera el máximo de {limit} bytes."
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from src.config import settings
+from src.ports.cache.practice_cache import IPracticeCache
+from .in_memory_practice_cache import InMemoryPracticeCache
+from .analysis_result_lru import AnalysisResultLRU
+from .token_verification_cache import TokenVerificationCache
+
+
+def build_practice_cache() -> Optional[IPracticeCache]:
+    """Crea la caché de prácticas según `settings.practice_cache_backend` ("memory", "redis" o "none")."""
+    backend = settings.practice_cache_backend.lower()
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryPracticeCache(max_entries=settings.practice_cache_max_entries)
+    if backend == "redis":
+        if not settings.practice_cache_redis_url:
+            raise ValueError("PRACTICE_CACHE_BACKEND=redis requiere PRACTICE_CACHE_REDIS_URL.")
+        from .redis_practice_cache import RedisPracticeCache
+        return RedisPracticeCache(settings.practice_cache_redis_url)
+    raise ValueError(f"PRACTICE_CACHE_BACKEND desconocido: '{settings.practice_cache_backend}'.")
+
+
+__all__ = ["AnalysisResultLRU", "InMemoryPracticeCache", "TokenVerificationCache", "build_practice_cache"]
@@ -0,0 +1,44 @@
+# src/adapters/cache/analysis_result_lru.py
+from collections import OrderedDict
+from typing import Optional
+
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+
+
+class AnalysisResultLRU:
+    """
+    Nivel en memoria de la caché de resultados de análisis (el nivel persistente es la tabla `analysis_results`).
+    Los resultados no caducan: la clave incluye la versión del modelo. Solo se usa desde el event loop.
+    También lleva los contadores de aciertos de ambos niveles.
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[AnalysisResultKey, UpdateAnalysisRequestDTO]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        resultado = self._entries.get(key)
+        if resultado is not None:
+            self._entries.move_to_end(key)
+        return resultado
+
+    def put(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        self._entries[key] = resultado
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.memory_hits + self.db_hits) / lookups, 3) if lookups else None,
+        }
@@ -0,0 +1,57 @@
+# src/adapters/cache/in_memory_practice_cache.py
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.domain.entities.practica import Practica
+from src.ports.cache.practice_cache import IPracticeCache
+
+
+class InMemoryPracticeCache(IPracticeCache):
+    """
+    LRU en memoria del proceso con expiración por entrada.
+    Solo se usa desde el event loop, así que no necesita bloqueos.
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[uuid.UUID, Tuple[Practica, Optional[float]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, practice_id: uuid.UUID) -> Optional[Practica]:
+        entry = self._entries.get(practice_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        practica, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[practice_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(practice_id)
+        self.hits += 1
+        # Copia: los casos de uso modifican la entidad antes de llamar a update()
+        return practica.model_copy(deep=True)
+
+    async def set(self, practica: Practica, ttl: Optional[float]) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[practica.practice_id] = (practica.model_copy(deep=True), expires_at)
+        self._entries.move_to_end(practica.practice_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, practice_id: uuid.UUID) -> None:
+        self._entries.pop(practice_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,48 @@
+# src/adapters/cache/redis_practice_cache.py
+# Caché compartida entre procesos/réplicas. Requiere el paquete opcional `redis` (>= 4.2, con redis.asyncio).
+import uuid
+from typing import Optional
+
+from src.domain.entities.practica import Practica
+from src.ports.cache.practice_cache import IPracticeCache
+
+
+class RedisPracticeCache(IPracticeCache):
+    """Guarda cada práctica como JSON bajo `<prefix><practice_id>`."""
+
+    def __init__(self, url: str, key_prefix: str = "trace:practice:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ImportError(
+                "PRACTICE_CACHE_BACKEND=redis requiere el paquete 'redis' (pip install redis)."
+            ) from e
+
+        self._redis = redis_asyncio.from_url(url)
+        self._key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, practice_id: uuid.UUID) -> str:
+        return f"{self._key_prefix}{practice_id}"
+
+    async def get(self, practice_id: uuid.UUID) -> Optional[Practica]:
+        raw = await self._redis.get(self._key(practice_id))
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Practica.model_validate_json(raw)
+
+    async def set(self, practica: Practica, ttl: Optional[float]) -> None:
+        px = int(ttl * 1000) if ttl is not None else None
+        await self._redis.set(self._key(practica.practice_id), practica.model_dump_json(), px=px)
+
+    async def invalidate(self, practice_id: uuid.UUID) -> None:
+        await self._redis.delete(self._key(practice_id))
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,79 @@
+# src/adapters/cache/token_verification_cache.py
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class TokenVerificationCache:
+    """
+    LRU de tokens JWT ya verificados: digest SHA-256 del token -> `user_id`.
+
+    Evita repetir la verificación de la firma en cada petición de un mismo cliente (p. ej. al
+    sondear GET /practices/{id}). Una entrada nunca sobrevive al `exp` del token y como mucho
+    dura `ttl` segundos. Se guarda el digest y no el token, así que la caché no contiene credenciales.
+    Las dependencias síncronas de FastAPI se ejecutan en el threadpool, por eso lleva un lock.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[uuid.UUID, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl > 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[uuid.UUID]:
+        if not self.enabled:
+            return None
+        key = self._digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, user_id: uuid.UUID, exp: Optional[float]) -> None:
+        """Guarda un token recién verificado. `exp` es el claim del token (segundos desde epoch)."""
+        if not self.enabled:
+            return
+        # `exp` es hora de pared (UTC), por eso se usa time.time() y no un reloj monotónico
+        expires_at = time.time() + self._ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= time.time():
+            return
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl": self._ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            }
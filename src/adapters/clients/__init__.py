@@ -1,4 +1,16 @@
-from .analysis_service_client import AnalysisServiceClient, AnalysisServiceError
-
-__all__ = ["AnalysisServiceClient", "AnalysisServiceError"]
+from .analysis_service_client import AnalysisServiceClient, AnalysisServiceError, AnalysisServiceUnavailableError
+from .analysis_mapper import build_analysis_request_dto
+from .load_balancer import LoadBalancer, Replica
+from .resilience import Bulkhead, CircuitBreaker, RetryPolicy
 
+__all__ = [
+    "AnalysisServiceClient",
+    "AnalysisServiceError",
+    "AnalysisServiceUnavailableError",
+    "build_analysis_request_dto",
+    "Bulkhead",
+    "CircuitBreaker",
+    "LoadBalancer",
+    "Replica",
+    "RetryPolicy",
+]
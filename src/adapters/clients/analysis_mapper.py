@@ -0,0 +1,48 @@
+# src/adapters/clients/analysis_mapper.py
+from typing import Any, Dict, Optional
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+
+
+def _clamp_score(value: Any) -> int:
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return 0
+    return max(0, min(100, int(round(numeric))))
+
+
+def _short_text(value: Optional[str]) -> str:
+    text = value or "Sin información disponible"
+    return text[:255]
+
+
+def build_analysis_request_dto(payload: Dict[str, Any]) -> UpdateAnalysisRequestDTO:
+    """Traduce la respuesta de Analysis-service al DTO que entiende nuestro caso de uso."""
+    metrics = payload.get("metricas_detalle", {}) or {}
+    feedback = payload.get("feedback_final", {}) or {}
+    fortalezas_candidate = metrics.get("fortalezas_base")
+    areas_candidate = metrics.get("areas_mejora_base")
+
+    if not fortalezas_candidate:
+        analisis_reglas = feedback.get("analisis_reglas")
+        if isinstance(analisis_reglas, dict):
+            fortalezas_candidate = analisis_reglas.get("fortalezas")
+        else:
+            fortalezas_candidate = feedback.get("fortalezas")
+
+    if not areas_candidate:
+        analisis_reglas = feedback.get("analisis_reglas")
+        if isinstance(analisis_reglas, dict):
+            areas_candidate = analisis_reglas.get("areas_mejora")
+        else:
+            areas_candidate = feedback.get("areas_mejora")
+
+    return UpdateAnalysisRequestDTO(
+        puntuacion_general=_clamp_score(metrics.get("score_global")),
+        puntuacion_proporcion=_clamp_score(metrics.get("puntuacion_proporcion")),
+        puntuacion_inclinacion=_clamp_score(metrics.get("puntuacion_inclinacion")),
+        puntuacion_espaciado=_clamp_score(metrics.get("puntuacion_espaciado")),
+        puntuacion_consistencia=_clamp_score(metrics.get("puntuacion_consistencia")),
+        fortalezas=_short_text(fortalezas_candidate),
+        areas_mejora=_short_text(areas_candidate),
+    )
@@ -1,21 +1,177 @@
+import asyncio
+import logging
+import time
 import httpx
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from src.adapters.clients.load_balancer import LEAST_OUTSTANDING, LoadBalancer, Replica, parse_base_urls
+from src.adapters.observability.instrumentation import ANALYSIS_REQUEST_DURATION
+from src.adapters.clients.resilience import (
+    Bulkhead,
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+)
+
+logger = logging.getLogger(__name__)
+
+# Respuestas que indican sobrecarga o un problema transitorio: se pueden repetir sin riesgo
+_RETRYABLE_STATUS = {429, 502, 503, 504}
 
 
 class AnalysisServiceError(Exception):
-    """Error personalizado para fallos al comunicarse con el servicio de análisis."""
+    """
+    Error personalizado para fallos al comunicarse con el servicio de análisis.
+
+    `retryable` indica que repetir la misma petición es seguro y puede funcionar (p. ej. no se
+    llegó a conectar); `unhealthy` indica que el fallo habla de la salud del servicio y cuenta
+    para el circuit breaker (un 4xx, en cambio, es culpa de la petición). `status` es el código
+    HTTP o el tipo de fallo (`timeout`, `connect_error`...), para las métricas.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        retryable: bool = False,
+        unhealthy: bool = False,
+        retry_after: Optional[float] = None,
+        status: str = "error",
+    ) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+        self.unhealthy = unhealthy
+        self.retry_after = retry_after
+        self.status = status
+
+
+class AnalysisServiceUnavailableError(AnalysisServiceError):
+    """
+    La petición no se envió: todas las réplicas tienen el circuito abierto o el bulkhead está lleno.
+    `retry_after` sugiere cuántos segundos esperar antes de volver a intentarlo.
+    """
 
 
 class AnalysisServiceClient:
-    """Cliente HTTP para comunicarse con el microservicio de análisis."""
+    """
+    Cliente HTTP para comunicarse con el microservicio de análisis.
+
+    Mantiene un único `httpx.AsyncClient` con pool de conexiones keep-alive, por lo que
+    debe crearse una sola vez por proceso y cerrarse con `aclose()` al apagar el servicio.
 
-    def __init__(self, base_url: Optional[str], timeout: float = 30.0) -> None:
-        if not base_url:
+    `base_url` admite varias réplicas (lista o URLs separadas por comas); cada petición va a la
+    réplica elegida por el `LoadBalancer` y cada réplica tiene su propio circuit breaker.
+    `transport` sustituye al transporte de red de httpx (p. ej. `httpx.ASGITransport` en las pruebas).
+    """
+
+    def __init__(
+        self,
+        base_url: Union[str, Sequence[str], None],
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        max_concurrency: int = 16,
+        queue_timeout: float = 5.0,
+        max_retries: int = 2,
+        retry_base_delay: float = 0.2,
+        retry_max_delay: float = 2.0,
+        breaker_failure_threshold: int = 5,
+        breaker_recovery_timeout: float = 30.0,
+        breaker_half_open_max_calls: int = 1,
+        lb_strategy: str = LEAST_OUTSTANDING,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.base_urls = parse_base_urls(base_url)
+        if not self.base_urls:
             raise AnalysisServiceError(
                 "ANALYSIS_SERVICE_BASE_URL no está configurada."
             )
-        self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._in_flight = 0
+        self._total_requests = 0
+        self._retries = 0
+
+        # Capas de resiliencia: límite de concurrencia, reintentos con jitter y un circuit
+        # breaker por réplica (expulsión pasiva de las que fallan)
+        self.bulkhead = Bulkhead(max_concurrency, queue_timeout)
+        self.retry_policy = RetryPolicy(max_retries, retry_base_delay, retry_max_delay)
+        replicas = [
+            Replica(
+                url,
+                CircuitBreaker(
+                    failure_threshold=breaker_failure_threshold,
+                    recovery_timeout=breaker_recovery_timeout,
+                    half_open_max_calls=breaker_half_open_max_calls,
+                    name=url,
+                ),
+            )
+            for url in self.base_urls
+        ]
+        self.balancer = LoadBalancer(replicas, lb_strategy)
+
+        # Configurar cliente HTTP con seguimiento automático de redirects y mejor timeout
+        timeout_config = httpx.Timeout(
+            connect=10.0,  # Timeout para establecer conexión
+            read=self.timeout,  # Timeout para leer respuesta
+            write=10.0,  # Timeout para escribir datos
+            pool=5.0  # Timeout para obtener conexión del pool
+        )
+        try:
+            self._client = httpx.AsyncClient(
+                timeout=timeout_config, limits=self.limits, http2=http2, follow_redirects=True, transport=transport
+            )
+            self.http2 = http2
+        except ImportError:
+            # HTTP/2 requiere el extra `httpx[http2]` (paquete h2)
+            logger.warning("HTTP/2 no disponible (instala 'httpx[http2]'). Se usará HTTP/1.1.")
+            self._client = httpx.AsyncClient(
+                timeout=timeout_config, limits=self.limits, follow_redirects=True, transport=transport
+            )
+            self.http2 = False
+
+    async def aclose(self) -> None:
+        """Cierra las conexiones del pool."""
+        await self._client.aclose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Métricas de uso del pool de conexiones."""
+        connections = []
+        # httpx no expone el pool públicamente; se lee del transporte de httpcore si está disponible
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        if pool is not None:
+            connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "open_connections": len(connections),
+            "idle_connections": idle,
+            "active_connections": len(connections) - idle,
+            "in_flight_requests": self._in_flight,
+            "total_requests": self._total_requests,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool de conexiones más el estado de las capas de resiliencia, para `/health`."""
+        return {
+            **self.pool_stats(),
+            "retries": self._retries,
+            "bulkhead": self.bulkhead.stats(),
+            "load_balancing": self.balancer.strategy,
+            "replicas": self.balancer.stats(),
+        }
+
+    def retry_after(self) -> float:
+        """Segundos que faltan para que alguna réplica vuelva a admitir llamadas (0 si alguna las admite)."""
+        return self.balancer.retry_after()
 
     async def analyze_letter(
         self,
@@ -24,7 +180,13 @@ class AnalysisServiceClient:
         filename: Optional[str] = None,
         content_type: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Envía la imagen al servicio de análisis y retorna las métricas."""
+        """
+        Envía la imagen al servicio de análisis y retorna las métricas.
+
+        Los fallos transitorios se reintentan con backoff y jitter, preferentemente en otra réplica.
+        Si todas las réplicas tienen el circuito abierto o no hay hueco en el bulkhead se lanza
+        `AnalysisServiceUnavailableError` sin enviar nada.
+        """
         if not image_bytes:
             raise AnalysisServiceError("La imagen recibida está vacía.")
 
@@ -36,48 +198,149 @@ class AnalysisServiceClient:
             )
         }
         data = {"letter_char": letter_char}
-        url = f"{self.base_url}/analyze"
-        
-        print(f"[AnalysisServiceClient] Enviando petición a: {url}")
-        print(f"[AnalysisServiceClient] Parámetros - letra: {letter_char}, tamaño imagen: {len(image_bytes)} bytes")
 
-        # Configurar cliente HTTP con seguimiento automático de redirects y mejor timeout
-        timeout_config = httpx.Timeout(
-            connect=10.0,  # Timeout para establecer conexión
-            read=self.timeout,  # Timeout para leer respuesta
-            write=10.0,  # Timeout para escribir datos
-            pool=5.0  # Timeout para obtener conexión del pool
-        )
-        
-        async with httpx.AsyncClient(timeout=timeout_config, follow_redirects=True) as client:
+        retry = 0
+        tried: List[Replica] = []
+        while True:
             try:
-                response = await client.post(url, data=data, files=files)
-                print(f"[AnalysisServiceClient] Respuesta recibida: {response.status_code}")
-            except httpx.ConnectError as exc:
-                error_msg = f"No se pudo conectar al servicio de análisis en {url}. Verifica que el servicio esté corriendo."
-                print(f"[AnalysisServiceClient] ERROR de conexión: {error_msg}")
-                raise AnalysisServiceError(error_msg) from exc
-            except httpx.TimeoutException as exc:
-                error_msg = f"Timeout al esperar respuesta del servicio de análisis (timeout: {self.timeout}s)."
-                print(f"[AnalysisServiceClient] ERROR de timeout: {error_msg}")
-                raise AnalysisServiceError(error_msg) from exc
-            except Exception as exc:
-                error_msg = f"Error inesperado al comunicarse con el servicio de análisis: {type(exc).__name__}: {exc}"
-                print(f"[AnalysisServiceClient] ERROR inesperado: {error_msg}")
-                raise AnalysisServiceError(error_msg) from exc
+                return await self._attempt("/analyze", data, files, tried)
+            except AnalysisServiceUnavailableError:
+                raise
+            except AnalysisServiceError as exc:
+                if not exc.retryable or retry >= self.retry_policy.max_retries:
+                    raise
+                retry += 1
+                self._retries += 1
+                delay = self.retry_policy.delay(retry, exc.retry_after)
+                logger.warning(
+                    "Reintento %d/%d en %.2fs: %s",
+                    retry,
+                    self.retry_policy.max_retries,
+                    delay,
+                    exc,
+                    extra={"replica": tried[-1].base_url if tried else None},
+                )
+                await asyncio.sleep(delay)
+
+    async def _attempt(
+        self, path: str, data: Dict[str, Any], files: Dict[str, Any], tried: List[Replica]
+    ) -> Dict[str, Any]:
+        """
+        Un intento: hueco en el bulkhead, elección de réplica (con permiso de su circuito) y la
+        petición HTTP. La réplica usada se añade a `tried` para que un reintento busque otra.
+        """
+        # Si no hay ninguna réplica disponible se falla antes de ocupar el bulkhead
+        retry_after = self.balancer.retry_after()
+        if retry_after > 0:
+            raise AnalysisServiceUnavailableError(
+                f"Servicio de análisis no disponible: todas las réplicas expulsadas durante {retry_after:.1f}s",
+                retry_after=retry_after,
+            )
+
+        try:
+            async with self.bulkhead.slot():
+                # La réplica se elige ya dentro del bulkhead, con la carga actual de cada una
+                try:
+                    replica = self.balancer.acquire(exclude=tried)
+                except CircuitOpenError as exc:
+                    raise AnalysisServiceUnavailableError(
+                        f"Servicio de análisis no disponible: {exc}", retry_after=exc.retry_after
+                    ) from exc
+                tried.append(replica)
+                result = await self._call_replica(replica, path, data, files)
+        except BulkheadFullError as exc:
+            raise AnalysisServiceUnavailableError(
+                f"Servicio de análisis saturado: {exc}", retry_after=self.bulkhead.queue_timeout
+            ) from exc
+        return result
+
+    async def _call_replica(
+        self, replica: Replica, path: str, data: Dict[str, Any], files: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        url = f"{replica.base_url}{path}"
+        logger.debug("Enviando petición", extra={"url": url, "letra": data.get("letter_char")})
+        start = time.perf_counter()
+        try:
+            with replica.track():
+                result = await self._send(url, data, files)
+        except AnalysisServiceError as exc:
+            ANALYSIS_REQUEST_DURATION.observe(time.perf_counter() - start, replica.base_url, exc.status)
+            replica.record_error(str(exc))
+            if exc.unhealthy:
+                replica.breaker.record_failure()
+            else:
+                # Un 4xx no dice nada de la salud de la réplica: ni cuenta como fallo ni cierra
+                # un circuito semiabierto, solo devuelve el permiso de la llamada de prueba
+                replica.breaker.release()
+            raise
+        except BaseException:
+            # Cancelación u otro error ajeno a la réplica
+            replica.breaker.release()
+            raise
+
+        ANALYSIS_REQUEST_DURATION.observe(time.perf_counter() - start, replica.base_url, "200")
+        replica.breaker.record_success()
+        return result
+
+    async def _send(self, url: str, data: Dict[str, Any], files: Dict[str, Any]) -> Dict[str, Any]:
+        self._in_flight += 1
+        self._total_requests += 1
+        try:
+            response = await self._client.post(url, data=data, files=files)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+            # La petición no llegó al servicio: repetirla es seguro
+            error_msg = f"No se pudo conectar al servicio de análisis en {url}. Verifica que el servicio esté corriendo."
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(error_msg, retryable=True, unhealthy=True, status="connect_error") from exc
+        except httpx.PoolTimeout as exc:
+            error_msg = "No hubo ninguna conexión libre en el pool hacia el servicio de análisis."
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(error_msg, retryable=True, status="pool_timeout") from exc
+        except httpx.TimeoutException as exc:
+            # El servicio puede seguir procesando la petición; no se repite para no duplicar la espera
+            error_msg = f"Timeout al esperar respuesta del servicio de análisis (timeout: {self.timeout}s)."
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(error_msg, unhealthy=True, status="timeout") from exc
+        except httpx.RemoteProtocolError as exc:
+            # Típicamente una conexión keep-alive que el servidor cerró antes de responder
+            error_msg = f"El servicio de análisis cerró la conexión: {exc}"
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(error_msg, retryable=True, unhealthy=True, status="protocol_error") from exc
+        except Exception as exc:
+            error_msg = f"Error inesperado al comunicarse con el servicio de análisis: {type(exc).__name__}: {exc}"
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(error_msg, unhealthy=True) from exc
+        finally:
+            self._in_flight -= 1
 
         if response.status_code >= 400:
             error_detail = response.text[:500]  # Limitar tamaño del mensaje de error
             error_msg = f"Error {response.status_code} desde Analysis-service: {error_detail}"
-            print(f"[AnalysisServiceClient] ERROR HTTP: {error_msg}")
-            raise AnalysisServiceError(error_msg)
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(
+                error_msg,
+                retryable=response.status_code in _RETRYABLE_STATUS,
+                unhealthy=response.status_code >= 500 or response.status_code == 429,
+                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+                status=str(response.status_code),
+            )
 
         try:
             result = response.json()
-            print(f"[AnalysisServiceClient] Análisis completado exitosamente")
+            logger.debug("Análisis completado", extra={"url": url, "status": response.status_code})
             return result
         except ValueError as exc:
             error_msg = f"La respuesta del servicio de análisis no es JSON válido. Status: {response.status_code}, Contenido: {response.text[:200]}"
-            print(f"[AnalysisServiceClient] ERROR parsing JSON: {error_msg}")
-            raise AnalysisServiceError(error_msg) from exc
+            logger.warning(error_msg, extra={"url": url})
+            raise AnalysisServiceError(error_msg, unhealthy=True, status="invalid_json") from exc
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Solo se admite la forma en segundos; la forma con fecha HTTP se ignora
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
 
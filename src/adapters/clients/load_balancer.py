@@ -0,0 +1,143 @@
+# src/adapters/clients/load_balancer.py
+import math
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Collection, Dict, Iterator, List, Optional, Sequence, Union
+
+from src.adapters.clients.resilience import CircuitBreaker, CircuitOpenError
+
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA = "ewma"
+
+
+def parse_base_urls(value: Union[str, Sequence[str], None]) -> List[str]:
+    """Acepta una URL, varias separadas por comas o una lista; quita duplicados y la `/` final."""
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else list(value)
+    urls: List[str] = []
+    for item in items:
+        url = item.strip().rstrip("/")
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+class Replica:
+    """
+    Una réplica de analysis-service con sus propias métricas.
+
+    Su `CircuitBreaker` hace de expulsión pasiva: tras varios fallos seguidos la réplica deja
+    de recibir tráfico durante un tiempo y después vuelve con una llamada de prueba.
+    """
+
+    def __init__(self, base_url: str, breaker: CircuitBreaker, ewma_decay: float = 10.0) -> None:
+        self.base_url = base_url
+        self.breaker = breaker
+        self.ewma_decay = ewma_decay
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._ewma: Optional[float] = None
+        self._ewma_at = 0.0
+
+    @property
+    def ewma_latency(self) -> float:
+        """Latencia media con decaimiento exponencial (segundos); 0 si aún no hay medidas."""
+        return self._ewma or 0.0
+
+    def is_available(self) -> bool:
+        state = self.breaker.state
+        if state == CircuitBreaker.OPEN:
+            return False
+        if state == CircuitBreaker.HALF_OPEN:
+            return self.breaker.half_open_calls < self.breaker.half_open_max_calls
+        return True
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Cuenta la petición como en curso y mide su latencia (también si falla)."""
+        self.outstanding += 1
+        self.requests += 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.outstanding -= 1
+            self._observe(time.monotonic() - start)
+
+    def record_error(self, error: str) -> None:
+        self.errors += 1
+        self.last_error = error[:200]
+
+    def _observe(self, latency: float) -> None:
+        now = time.monotonic()
+        if self._ewma is None:
+            self._ewma = latency
+        else:
+            # El peso de la media anterior decae con el tiempo transcurrido, no con el número de peticiones
+            weight = math.exp(-(now - self._ewma_at) / self.ewma_decay)
+            self._ewma = self._ewma * weight + latency * (1 - weight)
+        self._ewma_at = now
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_ratio": round(self.errors / self.requests, 3) if self.requests else 0.0,
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 1),
+            "last_error": self.last_error,
+            "circuit_breaker": self.breaker.stats(),
+        }
+
+
+class LoadBalancer:
+    """
+    Reparte las peticiones entre réplicas sin un proxy intermedio.
+
+    - `least_outstanding`: la réplica con menos peticiones en curso.
+    - `ewma`: la de menor latencia EWMA ponderada por sus peticiones en curso; las réplicas
+      sin medidas todavía se prueban primero, repartidas por peticiones en curso.
+
+    Los empates se resuelven al azar para no cargar siempre la primera réplica.
+    """
+
+    def __init__(self, replicas: List[Replica], strategy: str = LEAST_OUTSTANDING) -> None:
+        if not replicas:
+            raise ValueError("Se necesita al menos una réplica.")
+        strategy = strategy.lower()
+        if strategy not in (LEAST_OUTSTANDING, EWMA):
+            raise ValueError(f"Estrategia de balanceo desconocida: {strategy}")
+        self.replicas = replicas
+        self.strategy = strategy
+
+    def retry_after(self) -> float:
+        """0 si alguna réplica admite llamadas; si no, segundos hasta que la primera vuelva a admitirlas."""
+        return min(replica.breaker.retry_after() for replica in self.replicas)
+
+    def acquire(self, exclude: Collection[Replica] = ()) -> Replica:
+        """
+        Elige una réplica y reserva el permiso de su circuito. Evita las de `exclude` (p. ej. la que
+        acaba de fallar) salvo que no quede otra. Lanza `CircuitOpenError` si todas están expulsadas.
+        """
+        available = [replica for replica in self.replicas if replica.is_available()]
+        preferred = [replica for replica in available if replica not in exclude] or available
+        if not preferred:
+            raise CircuitOpenError(self.retry_after())
+
+        replica = min(preferred, key=self._score)
+        replica.breaker.before_call()
+        return replica
+
+    def _score(self, replica: Replica):
+        if self.strategy == EWMA:
+            # Sin medidas la latencia es 0 y decide el número de peticiones en curso
+            return (replica.ewma_latency * (replica.outstanding + 1), replica.outstanding, random.random())
+        return (replica.outstanding, random.random())
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [replica.stats() for replica in self.replicas]
@@ -0,0 +1,189 @@
+# src/adapters/clients/resilience.py
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """El circuito está abierto: la dependencia se considera caída y no se intenta la llamada."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Circuito abierto; se reintentará en {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class BulkheadFullError(Exception):
+    """No quedó ningún hueco libre en el bulkhead antes de agotar la espera en cola."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de tres estados para una dependencia remota.
+
+    - `closed`: las llamadas pasan; tras `failure_threshold` fallos seguidos se abre.
+    - `open`: las llamadas fallan al instante con `CircuitOpenError` durante `recovery_timeout` segundos.
+    - `half_open`: se dejan pasar hasta `half_open_max_calls` llamadas de prueba; si una tiene éxito
+      se cierra y si falla se vuelve a abrir.
+
+    No es seguro entre hilos: está pensado para usarse desde un único event loop.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        name: str = "",
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        # El paso de open a half_open ocurre al consultar el estado, sin temporizadores
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    @property
+    def half_open_calls(self) -> int:
+        """Llamadas de prueba en curso mientras el circuito está semiabierto."""
+        return self._half_open_calls
+
+    def retry_after(self) -> float:
+        """Segundos hasta que el circuito admita una llamada de prueba (0 si ya las admite)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def before_call(self) -> None:
+        """Reserva permiso para una llamada o lanza `CircuitOpenError`."""
+        state = self.state
+        if state == self.OPEN:
+            self._rejected += 1
+            raise CircuitOpenError(self.retry_after())
+        if state == self.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                self._rejected += 1
+                raise CircuitOpenError(0.0)
+            self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        if self._state != self.CLOSED:
+            logger.info("Dependencia recuperada; circuito cerrado", extra={"dependency": self.name})
+        self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """
+        Devuelve el permiso de una llamada que terminó sin indicar la salud de la dependencia (p. ej. un 4xx
+        o una cancelación). No cambia el estado ni la cuenta de fallos seguidos.
+        """
+        if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _open(self) -> None:
+        if self._state != self.OPEN:
+            self._times_opened += 1
+            logger.warning(
+                "Circuito abierto tras %d fallos seguidos",
+                self._consecutive_failures,
+                extra={"dependency": self.name},
+            )
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_calls = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_after": round(self.retry_after(), 1),
+            "times_opened": self._times_opened,
+            "rejected_calls": self._rejected,
+        }
+
+
+class Bulkhead:
+    """
+    Limita las llamadas simultáneas a una dependencia. Las que no encuentran hueco esperan
+    como mucho `queue_timeout` segundos y después fallan con `BulkheadFullError`, en lugar de
+    acumularse sin límite mientras la dependencia va lenta.
+    """
+
+    def __init__(self, max_concurrency: int, queue_timeout: float) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._active = 0
+        self._waiting = 0
+        self._rejected = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise BulkheadFullError(
+                f"{self.max_concurrency} llamadas en curso; no hubo hueco en {self.queue_timeout:.1f}s"
+            ) from None
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self._active,
+            "waiting": self._waiting,
+            "rejected_calls": self._rejected,
+        }
+
+
+class RetryPolicy:
+    """Reintentos con backoff exponencial y jitter completo (espera aleatoria entre 0 y el tope)."""
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.2, max_delay: float = 2.0) -> None:
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, retry: int, retry_after: Optional[float] = None) -> float:
+        """Espera antes del reintento número `retry` (empezando en 1); respeta `Retry-After` si es mayor."""
+        cap = min(self.max_delay, self.base_delay * (2 ** (retry - 1)))
+        delay = random.uniform(0, cap)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
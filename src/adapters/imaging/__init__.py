@@ -0,0 +1,28 @@
+from typing import Optional
+
+from src.config import settings
+from .image_preprocessor import ImagePreprocessor, PreparedImage
+from .preprocessing import PreprocessingOptions
+
+
+def preprocessing_options() -> PreprocessingOptions:
+    return PreprocessingOptions(
+        max_size=settings.image_preprocess_max_size,
+        format=settings.image_preprocess_format.upper(),
+        quality=settings.image_preprocess_quality,
+        crop=settings.image_preprocess_crop,
+        crop_margin=settings.image_preprocess_crop_margin,
+    )
+
+
+def build_image_preprocessor() -> Optional[ImagePreprocessor]:
+    """Crea el preprocesador si `settings.image_preprocessing_enabled`; si no, las imágenes se envían tal cual."""
+    if not settings.image_preprocessing_enabled:
+        return None
+    return ImagePreprocessor(
+        preprocessing_options(),
+        workers=settings.image_preprocess_workers,
+        max_pending=settings.image_preprocess_max_pending,
+    )
+
+__all__ = ["ImagePreprocessor", "PreparedImage", "PreprocessingOptions", "build_image_preprocessor", "preprocessing_options"]
@@ -0,0 +1,120 @@
+# src/adapters/imaging/image_preprocessor.py
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional
+
+from src.adapters.observability.instrumentation import IMAGE_PREPROCESS_BYTES, IMAGE_PREPROCESS_DURATION
+from .preprocessing import FORMATS, PreprocessingOptions, preprocess_image, warm_up
+
+logger = logging.getLogger(__name__)
+
+
+class PreparedImage(NamedTuple):
+    """Imagen lista para enviar a analysis-service."""
+    image_bytes: bytes
+    filename: Optional[str]
+    content_type: Optional[str]
+
+
+class ImagePreprocessor:
+    """
+    Ejecuta `preprocess_image` en un `ProcessPoolExecutor` para que la decodificación y el reescalado
+    (CPU pura) no bloqueen el event loop ni compitan por el GIL. Como mucho `max_pending` imágenes
+    esperan o se procesan a la vez; el resto espera su turno sin copiar sus bytes al pool.
+
+    Si una imagen no se puede preprocesar se envía la original: la decisión final es de analysis-service.
+    """
+
+    def __init__(self, options: PreprocessingOptions, workers: int = 2, max_pending: Optional[int] = None):
+        try:
+            import PIL  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "IMAGE_PREPROCESSING_ENABLED=true requiere el paquete 'Pillow' (pip install Pillow)."
+            ) from e
+        if options.format not in FORMATS:
+            raise ValueError(
+                f"IMAGE_PREPROCESS_FORMAT desconocido: '{options.format}'. Valores permitidos: {sorted(FORMATS)}"
+            )
+        if options.max_size < 1:
+            raise ValueError("IMAGE_PREPROCESS_MAX_SIZE debe ser al menos 1.")
+
+        self.options = options
+        self.workers = max(1, workers)
+        self._semaphore = asyncio.Semaphore(max_pending or self.workers * 2)
+        self._executor = self._new_executor()
+        self._processed = 0
+        self._failed = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # "spawn": un fork del proceso del servidor copiaría sus hilos y conexiones abiertas
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async def start(self) -> None:
+        """Arranca los procesos del pool antes de la primera imagen."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._executor, warm_up) for _ in range(self.workers)))
+
+    async def prepare(self, image_bytes: bytes, filename: Optional[str], content_type: Optional[str]) -> PreparedImage:
+        start = time.perf_counter()
+        async with self._semaphore:
+            executor = self._executor
+            try:
+                processed = await asyncio.get_running_loop().run_in_executor(
+                    executor, preprocess_image, image_bytes, self.options
+                )
+            except BrokenProcessPool:
+                # Un proceso hijo murió (p. ej. por memoria): se recrea el pool para las siguientes imágenes.
+                # Todas las imágenes que estaban en el pool roto llegan aquí; solo la primera lo sustituye,
+                # las demás no deben cerrar el pool nuevo (cancelaría las imágenes que ya se envían a él)
+                if self._executor is executor:
+                    logger.error("El pool de preprocesado se ha roto; se recrea")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = self._new_executor()
+                return self._fallback(image_bytes, filename, content_type, start, "BrokenProcessPool")
+            except ValueError as exc:
+                return self._fallback(image_bytes, filename, content_type, start, str(exc))
+
+        self._processed += 1
+        self._bytes_in += len(image_bytes)
+        self._bytes_out += len(processed.data)
+        IMAGE_PREPROCESS_DURATION.observe(time.perf_counter() - start, "ok")
+        IMAGE_PREPROCESS_BYTES.inc("in", amount=len(image_bytes))
+        IMAGE_PREPROCESS_BYTES.inc("out", amount=len(processed.data))
+        logger.debug(
+            "Imagen preprocesada",
+            extra={"bytes_in": len(image_bytes), "bytes_out": len(processed.data), "width": processed.width, "height": processed.height},
+        )
+        new_content_type, extension = FORMATS[self.options.format]
+        stem = os.path.splitext(filename or "practice")[0]
+        return PreparedImage(processed.data, f"{stem}.{extension}", new_content_type)
+
+    def _fallback(
+        self, image_bytes: bytes, filename: Optional[str], content_type: Optional[str], start: float, error: str
+    ) -> PreparedImage:
+        self._failed += 1
+        IMAGE_PREPROCESS_DURATION.observe(time.perf_counter() - start, "error")
+        logger.warning("No se pudo preprocesar la imagen; se envía la original: %s", error)
+        return PreparedImage(image_bytes, filename, content_type)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_size": self.options.max_size,
+            "format": self.options.format,
+            "processed": self._processed,
+            "failed": self._failed,
+            "bytes_in": self._bytes_in,
+            "bytes_out": self._bytes_out,
+            "ratio": round(self._bytes_out / self._bytes_in, 3) if self._bytes_in else None,
+        }
+
+    async def aclose(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
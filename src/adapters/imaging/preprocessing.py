@@ -0,0 +1,93 @@
+# src/adapters/imaging/preprocessing.py
+# Preprocesado de la imagen antes de enviarla a analysis-service: orientación EXIF, escala de grises,
+# recorte al trazo, reducción y recodificación. Requiere el paquete opcional `Pillow`.
+#
+# `preprocess_image` se ejecuta en los procesos hijos del pool: recibe y devuelve solo valores serializables.
+import io
+from typing import NamedTuple, Optional, Tuple
+
+FORMATS = {
+    # formato de Pillow -> (content type, extensión)
+    "PNG": ("image/png", "png"),
+    "WEBP": ("image/webp", "webp"),
+    "JPEG": ("image/jpeg", "jpg"),
+}
+
+# El trazo se busca en una copia reducida y suavizada: más rápido y sin que el ruido de la foto cuente como tinta
+_BBOX_WORKING_SIZE = 256
+# Un píxel de la copia es trazo si, con el contraste normalizado, es más oscuro que este umbral (0-255)
+_INK_THRESHOLD = 64
+
+
+class PreprocessingOptions(NamedTuple):
+    max_size: int = 512           # Lado mayor, en píxeles, de la imagen enviada
+    format: str = "PNG"           # PNG, WEBP o JPEG
+    quality: int = 85             # Solo para WEBP y JPEG
+    crop: bool = True             # Recortar al rectángulo que contiene el trazo
+    crop_margin: float = 0.1      # Margen alrededor del trazo, como fracción de su lado mayor
+
+
+class ProcessedImage(NamedTuple):
+    data: bytes
+    width: int
+    height: int
+
+
+def _ink_bbox(image, margin: float) -> Optional[Tuple[int, int, int, int]]:
+    from PIL import Image, ImageFilter, ImageOps
+
+    small = image.copy()
+    small.thumbnail((_BBOX_WORKING_SIZE, _BBOX_WORKING_SIZE), Image.Resampling.BILINEAR)
+    small = ImageOps.autocontrast(small.filter(ImageFilter.GaussianBlur(2)), cutoff=1)
+    bbox = small.point([255 if p < _INK_THRESHOLD else 0 for p in range(256)]).getbbox()
+    if bbox is None:
+        return None
+
+    scale_x, scale_y = image.width / small.width, image.height / small.height
+    left, top, right, bottom = bbox[0] * scale_x, bbox[1] * scale_y, bbox[2] * scale_x, bbox[3] * scale_y
+    pad = max(right - left, bottom - top) * margin
+    return (
+        max(0, int(left - pad)),
+        max(0, int(top - pad)),
+        min(image.width, int(right + pad)),
+        min(image.height, int(bottom + pad)),
+    )
+
+
+def preprocess_image(image_bytes: bytes, options: PreprocessingOptions) -> ProcessedImage:
+    """
+    Devuelve la imagen orientada según su EXIF, en escala de grises, recortada al trazo,
+    reducida a `max_size` como máximo (nunca ampliada) y codificada en `options.format`.
+
+    Raises:
+        ValueError: Si la imagen no se puede decodificar o es desproporcionadamente grande.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+        # En JPEG se decodifica directamente a escala reducida (mucho más rápido con fotos de móvil).
+        # Se deja margen de sobra para que el recorte conserve resolución suficiente.
+        image.draft("L", (options.max_size * 4, options.max_size * 4))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("L")
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        raise ValueError(f"No se pudo decodificar la imagen: {exc}") from exc
+
+    if options.crop:
+        bbox = _ink_bbox(image, options.crop_margin)
+        if bbox is not None:
+            image = image.crop(bbox)
+    image.thumbnail((options.max_size, options.max_size), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    if options.format == "PNG":
+        image.save(buffer, format="PNG", optimize=True)
+    else:
+        image.save(buffer, format=options.format, quality=options.quality)
+    return ProcessedImage(buffer.getvalue(), image.width, image.height)
+
+
+def warm_up() -> None:
+    """Importa Pillow en el proceso hijo para que la primera imagen no pague ese coste."""
+    import PIL.Image  # noqa: F401
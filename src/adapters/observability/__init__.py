@@ -0,0 +1,14 @@
+from .context import bind_practice_id, current_context, log_context, practice_id_var, request_id_var
+from .logging_setup import JsonFormatter, SamplingFilter, setup_logging, shutdown_logging
+
+__all__ = [
+    "bind_practice_id",
+    "current_context",
+    "log_context",
+    "practice_id_var",
+    "request_id_var",
+    "JsonFormatter",
+    "SamplingFilter",
+    "setup_logging",
+    "shutdown_logging",
+]
@@ -0,0 +1,33 @@
+# src/adapters/observability/context.py
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# Identificadores de correlación del contexto actual (petición HTTP o trabajo del worker).
+# Son contextvars, así que cada tarea de asyncio y cada llamada al threadpool ven los suyos.
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+practice_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("practice_id", default=None)
+
+
+def current_context() -> Dict[str, Optional[str]]:
+    return {"request_id": request_id_var.get(), "practice_id": practice_id_var.get()}
+
+
+def bind_practice_id(practice_id) -> None:
+    """Asocia la práctica al resto de la petición o tarea en curso (p. ej. en cuanto se crea)."""
+    practice_id_var.set(str(practice_id) if practice_id is not None else None)
+
+
+@contextmanager
+def log_context(request_id: Optional[str] = None, practice_id=None) -> Iterator[None]:
+    """Fija los identificadores dentro del bloque y restaura los anteriores al salir."""
+    tokens = []
+    if request_id is not None:
+        tokens.append((request_id_var, request_id_var.set(request_id)))
+    if practice_id is not None:
+        tokens.append((practice_id_var, practice_id_var.set(str(practice_id))))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
@@ -0,0 +1,244 @@
+# src/adapters/observability/instrumentation.py
+import contextvars
+import functools
+import inspect
+import time
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.adapters.observability.metrics import REGISTRY, Sample
+
+# --- Métricas del servicio ---
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "Duración de las peticiones HTTP por ruta y estado.", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_PROGRESS = REGISTRY.gauge(
+    "http_requests_in_progress", "Peticiones HTTP en curso.", ("method",)
+)
+REPOSITORY_CALL_DURATION = REGISTRY.histogram(
+    "repository_call_duration_seconds",
+    "Duración de cada método de repositorio, incluidos el commit y el mapeo.",
+    ("repository", "method", "outcome"),
+)
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds",
+    "Duración de cada sentencia SQL, por método de repositorio que la lanzó y resultado.",
+    ("engine", "operation", "statement", "outcome"),
+)
+JWT_VERIFICATION_DURATION = REGISTRY.histogram(
+    "jwt_verification_duration_seconds",
+    "Duración de la dependencia que valida el token JWT.",
+    ("cache",),
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01),
+)
+ANALYSIS_REQUEST_DURATION = REGISTRY.histogram(
+    "analysis_request_duration_seconds",
+    "Duración de las llamadas a analysis-service por réplica y resultado (código HTTP o tipo de error).",
+    ("replica", "status"),
+)
+IMAGE_PREPROCESS_DURATION = REGISTRY.histogram(
+    "image_preprocess_duration_seconds",
+    "Duración del preprocesado de una imagen, incluida la espera por un hueco en el pool de procesos.",
+    ("outcome",),
+)
+IMAGE_PREPROCESS_BYTES = REGISTRY.counter(
+    "image_preprocess_bytes_total",
+    "Bytes de las imágenes antes (in) y después (out) del preprocesado.",
+    ("direction",),
+)
+
+# Método de repositorio en curso; lo leen los hooks de SQLAlchemy para etiquetar cada sentencia.
+# Las contextvars llegan tanto al threadpool como a los greenlets de AsyncSession.
+db_operation_var: contextvars.ContextVar[str] = contextvars.ContextVar("db_operation", default="other")
+
+_instrumented_engines: List[Tuple[str, Engine]] = []
+
+
+# --- Base de datos ---
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Mide cada sentencia con los eventos `before/after_cursor_execute` y publica el estado del pool.
+    Para un motor asíncrono se pasa `async_engine.sync_engine`.
+    """
+    if any(existing is engine for _, existing in _instrumented_engines):
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        DB_QUERY_DURATION.observe(elapsed, name, db_operation_var.get(), _statement_kind(statement), "ok")
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # Una sentencia que falla no pasa por after_cursor_execute: se mide aquí (p. ej. un timeout
+        # de bloqueo tarda lo mismo que la espera) y se saca su inicio de la pila de la conexión
+        connection = exception_context.connection
+        starts = connection.info.get("query_start") if connection is not None else None
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        statement = exception_context.statement or ""
+        DB_QUERY_DURATION.observe(elapsed, name, db_operation_var.get(), _statement_kind(statement), "error")
+
+    _instrumented_engines.append((name, engine))
+
+
+def _statement_kind(statement: str) -> str:
+    keyword = statement.lstrip()[:8].split(None, 1)
+    kind = keyword[0].upper() if keyword else ""
+    return kind if kind in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+# (métrica, método del pool, ayuda)
+_POOL_GAUGES = (
+    ("db_pool_size", "size", "Conexiones que el pool mantiene abiertas como base."),
+    ("db_pool_checked_out", "checkedout", "Conexiones del pool en uso."),
+    ("db_pool_checked_in", "checkedin", "Conexiones del pool libres."),
+    ("db_pool_overflow", "overflow", "Conexiones por encima del tamaño del pool (negativo mientras no se ha llenado)."),
+)
+
+
+def _pool_samples():
+    for metric_name, method_name, documentation in _POOL_GAUGES:
+        samples: List[Sample] = []
+        for name, engine in _instrumented_engines:
+            # NullPool/StaticPool (p. ej. SQLite en memoria) no tienen estas métricas
+            method = getattr(engine.pool, method_name, None)
+            if method is not None:
+                samples.append(({"engine": name}, method()))
+        if samples:
+            yield metric_name, documentation, samples
+
+
+REGISTRY.register_collector(_pool_samples)
+
+
+# --- Repositorios ---
+
+def instrument_repository(repository: str) -> Callable[[type], type]:
+    """
+    Decorador de clase: mide cada método público del repositorio (síncrono o asíncrono) y deja
+    su nombre en `db_operation_var` para que las sentencias SQL que lance queden etiquetadas.
+    """
+
+    def decorate(cls: type) -> type:
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attribute, _wrap_method(repository, attribute, value))
+        return cls
+
+    return decorate
+
+
+def _wrap_method(repository: str, method: str, func: Callable) -> Callable:
+    operation = f"{repository}.{method}"
+
+    if inspect.isasyncgenfunction(func):
+        # Iteradores (p. ej. exportaciones con cursor del lado del servidor): las sentencias se lanzan
+        # al pedir cada elemento, así que la operación se fija en cada paso y se mide hasta el cierre
+        @functools.wraps(func)
+        async def async_gen_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "ok"
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = db_operation_var.set(operation)
+                    try:
+                        item = await generator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    except BaseException:
+                        outcome = "error"
+                        raise
+                    finally:
+                        db_operation_var.reset(token)
+                    yield item
+            finally:
+                token = db_operation_var.set(operation)
+                try:
+                    await generator.aclose()
+                finally:
+                    db_operation_var.reset(token)
+                    REPOSITORY_CALL_DURATION.observe(time.perf_counter() - start, repository, method, outcome)
+
+        return async_gen_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def sync_gen_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "ok"
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = db_operation_var.set(operation)
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        break
+                    except BaseException:
+                        outcome = "error"
+                        raise
+                    finally:
+                        db_operation_var.reset(token)
+                    yield item
+            finally:
+                token = db_operation_var.set(operation)
+                try:
+                    generator.close()
+                finally:
+                    db_operation_var.reset(token)
+                    REPOSITORY_CALL_DURATION.observe(time.perf_counter() - start, repository, method, outcome)
+
+        return sync_gen_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = db_operation_var.set(operation)
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                REPOSITORY_CALL_DURATION.observe(time.perf_counter() - start, repository, method, outcome)
+                db_operation_var.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        token = db_operation_var.set(operation)
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = func(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            REPOSITORY_CALL_DURATION.observe(time.perf_counter() - start, repository, method, outcome)
+            db_operation_var.reset(token)
+
+    return sync_wrapper
+
+
+def route_label(scope: dict) -> str:
+    """Plantilla de la ruta (p. ej. `/practices/{practice_id}`) para no crear una serie por id."""
+    route = scope.get("route")
+    path: Optional[str] = getattr(route, "path", None)
+    return path or "unmatched"
@@ -0,0 +1,163 @@
+# src/adapters/observability/logging_setup.py
+import datetime
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import zlib
+from typing import Optional
+
+from src.adapters.observability.context import current_context
+
+# Atributos propios de LogRecord; el resto son campos estructurados pasados con `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+# Librerías que registran cada petición en INFO; se pueden subir de nivel con `levels`
+_QUIET_LOGGERS = {"httpx": "WARNING", "httpcore": "WARNING"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class ContextFilter(logging.Filter):
+    """Copia los identificadores de correlación al registro en el hilo o tarea que emite el log."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in current_context().items():
+            if getattr(record, key, None) is None:
+                setattr(record, key, value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Muestrea los eventos INFO/DEBUG marcados como de alto volumen (`extra={"sampled": True}`).
+    Los WARNING y superiores pasan siempre. La decisión depende del `request_id`, así que una
+    petición muestreada conserva todas sus líneas y una descartada no deja líneas sueltas.
+    """
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or record.levelno >= logging.WARNING or not getattr(record, "sampled", False):
+            return True
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            return (zlib.crc32(request_id.encode()) % 10000) < self.rate * 10000
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro con los identificadores de correlación y los campos de `extra`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and key != "sampled" and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Formato legible para desarrollo local, con los mismos campos que el JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        fields = {
+            key: value
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES and key != "sampled" and value is not None
+        }
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        elif record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que deja el registro listo para otro hilo: resuelve el mensaje y el traceback,
+    pero conserva los campos de `extra` para que el formateador JSON los vea.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(
+    level: str = "INFO",
+    fmt: str = "json",
+    levels: Optional[str] = None,
+    sample_rate: float = 1.0,
+) -> None:
+    """
+    Configura el logging del proceso. Los registros se encolan sin bloquear y un hilo aparte
+    (`QueueListener`) los formatea y escribe en stdout, así el event loop nunca espera a la E/S.
+
+    `levels` ajusta loggers concretos, p. ej. "src.adapters.clients=DEBUG,sqlalchemy.engine=WARNING".
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(TextFormatter() if fmt.lower() == "text" else JsonFormatter())
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _ContextQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level.upper())
+    for name, logger_level in _QUIET_LOGGERS.items():
+        logging.getLogger(name).setLevel(logger_level)
+    for item in (levels or "").split(","):
+        name, _, logger_level = item.partition("=")
+        if name.strip() and logger_level.strip():
+            logging.getLogger(name.strip()).setLevel(logger_level.strip().upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Vacía la cola y detiene el hilo escritor; se llama al apagar el servicio. Lo que se registre
+    después se escribe directamente, sin cola, para no perderlo.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if isinstance(handler, _ContextQueueHandler):
+            direct = _listener.handlers[0]
+            for log_filter in handler.filters:
+                direct.addFilter(log_filter)
+            root.handlers = [direct]
+            break
+    _listener = None
@@ -0,0 +1,88 @@
+# src/adapters/repositories/async_mysql_analysis_job_repository.py
+from typing import List, Optional
+import datetime
+import uuid
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.ports.repositories.async_analysis_job_repository import IAsyncAnalysisJobRepository
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import EstadoTrabajo
+from src.adapters.observability.instrumentation import instrument_repository
+from .db_models import AnalysisJobDB
+from .mappers import job_db_to_entity, job_entity_to_db
+
+@instrument_repository("jobs")
+class AsyncMySQLAnalysisJobRepository(IAsyncAnalysisJobRepository):
+    """Cola de trabajos de análisis sobre `AsyncSession`. Misma semántica que `MySQLAnalysisJobRepository`."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, trabajo: TrabajoAnalisis) -> None:
+        self.session.add(job_entity_to_db(trabajo))
+        await self.session.commit()
+
+    async def enqueue_many(self, trabajos: List[TrabajoAnalisis]) -> None:
+        self.session.add_all([job_entity_to_db(t) for t in trabajos])
+        await self.session.commit()
+
+    async def claim_next(self, visibility_timeout: int) -> Optional[TrabajoAnalisis]:
+        now = datetime.datetime.utcnow()
+        abandonado_antes_de = now - datetime.timedelta(seconds=visibility_timeout)
+
+        result = await self.session.execute(
+            select(AnalysisJobDB)
+            .where(
+                or_(
+                    and_(AnalysisJobDB.estado == EstadoTrabajo.PENDIENTE, AnalysisJobDB.disponible_en <= now),
+                    and_(AnalysisJobDB.estado == EstadoTrabajo.EN_PROCESO, AnalysisJobDB.bloqueado_en <= abandonado_antes_de),
+                )
+            )
+            .order_by(AnalysisJobDB.disponible_en)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job_db = result.scalars().first()
+        if not job_db:
+            await self.session.rollback()
+            return None
+
+        # UPDATE condicional con `intentos` como versión (ver MySQLAnalysisJobRepository.claim_next)
+        intentos_previos = job_db.intentos or 0
+        reservado = await self.session.execute(
+            update(AnalysisJobDB)
+            .where(AnalysisJobDB.job_id == job_db.job_id, AnalysisJobDB.intentos == intentos_previos)
+            .values(estado=EstadoTrabajo.EN_PROCESO, bloqueado_en=now, intentos=intentos_previos + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if not reservado.rowcount:
+            await self.session.rollback()
+            return None
+
+        trabajo = job_db_to_entity(job_db)
+        trabajo.estado = EstadoTrabajo.EN_PROCESO
+        trabajo.intentos = intentos_previos + 1
+        await self.session.commit()
+        return trabajo
+
+    async def complete(self, job_id: uuid.UUID) -> None:
+        await self.session.execute(delete(AnalysisJobDB).where(AnalysisJobDB.job_id == job_id))
+        await self.session.commit()
+
+    async def reschedule(
+        self, job_id: uuid.UUID, error: str, disponible_en: datetime.datetime, consume_attempt: bool = True
+    ) -> None:
+        values = dict(estado=EstadoTrabajo.PENDIENTE, ultimo_error=error[:500], disponible_en=disponible_en, bloqueado_en=None)
+        if not consume_attempt:
+            # claim_next ya sumó el intento; se descuenta
+            values["intentos"] = AnalysisJobDB.intentos - 1
+        await self.session.execute(update(AnalysisJobDB).where(AnalysisJobDB.job_id == job_id).values(**values))
+        await self.session.commit()
+
+    async def mark_failed(self, job_id: uuid.UUID, error: str) -> None:
+        await self.session.execute(
+            update(AnalysisJobDB)
+            .where(AnalysisJobDB.job_id == job_id)
+            .values(estado=EstadoTrabajo.ERROR, ultimo_error=error[:500], bloqueado_en=None)
+        )
+        await self.session.commit()
@@ -0,0 +1,31 @@
+# src/adapters/repositories/async_mysql_analysis_result_repository.py
+from typing import Dict, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+from src.adapters.observability.instrumentation import instrument_repository
+from .queries import (
+    analysis_result_query, analysis_results_query, analysis_results_by_key, analysis_result_insert, analysis_result_to_dto
+)
+
+@instrument_repository("analysis_results")
+class AsyncMySQLAnalysisResultRepository(IAsyncAnalysisResultRepository):
+    """Caché persistente de resultados sobre `AsyncSession`. Misma semántica que `MySQLAnalysisResultRepository`."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        result_db = (await self.session.execute(analysis_result_query(key))).scalars().first()
+        return analysis_result_to_dto(result_db) if result_db else None
+
+    async def find_many(self, keys: Sequence[AnalysisResultKey]) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+        if not keys:
+            return {}
+        results_db = (await self.session.execute(analysis_results_query(keys))).scalars().all()
+        return analysis_results_by_key(keys, results_db)
+
+    async def save(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        await self.session.execute(analysis_result_insert(self.session.get_bind().dialect.name, key, resultado))
+        await self.session.commit()
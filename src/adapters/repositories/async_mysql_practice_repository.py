@@ -0,0 +1,225 @@
+# src/adapters/repositories/async_mysql_practice_repository.py
+from typing import AsyncIterator, Optional, List, Sequence, Tuple
+import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import (
+    HistoryCursor, PracticeHistoryRow, LetterStatsRow, CompletionOutcome, PracticeCompletion, DeletionOutcome,
+    PracticeExportFilter, PracticeExportRow
+)
+from src.adapters.observability.instrumentation import instrument_repository
+
+# Modelos del dominio
+from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+
+# Modelos de la base de datos (SQLAlchemy)
+from .db_models import PracticeDB
+from .mappers import practice_db_to_entity, practice_entity_to_db, apply_practice_changes, job_entity_to_db
+from .queries import (
+    history_page_query, history_row_from_result, complete_pending_practice, completed_practice_query,
+    practice_state_query, completed_practice_from_row, analysis_insert, analysis_values,
+    practices_for_completion_query, complete_pending_practices, classify_completions, fail_pending_practice,
+    delete_owned_practice, owned_practice_for_delete_query, user_practice_ids_query, delete_practices,
+    export_query, export_row_from_result
+)
+from .letter_stats import (
+    letter_stats_upsert, letter_stats_lock, letter_stats_aggregate_query, letter_stats_latest_query,
+    letter_stats_replace, letter_stats_by_user_query, letter_stats_row_from_result, letter_stats_delete_user,
+    letter_stats_letters_query, letter_stats_user_ids_query
+)
+
+@instrument_repository("practices")
+class AsyncMySQLPracticeRepository(IAsyncPracticeRepository):
+    """
+    Repositorio de prácticas sobre `AsyncSession` (aiomysql en producción, aiosqlite en pruebas).
+    Las relaciones se cargan siempre de forma ansiosa: en modo asíncrono no hay lazy loading.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, practica: Practica) -> None:
+        self.session.add(practice_entity_to_db(practica))
+        await self.session.commit()
+
+    async def save_many(self, practicas: List[Practica]) -> None:
+        self.session.add_all([practice_entity_to_db(p) for p in practicas])
+        await self.session.commit()
+
+    async def save_with_job(self, practica: Practica, trabajo: Optional[TrabajoAnalisis]) -> None:
+        await self.save_many_with_jobs([practica], [trabajo] if trabajo is not None else [])
+
+    async def save_many_with_jobs(self, practicas: List[Practica], trabajos: List[TrabajoAnalisis]) -> None:
+        # Mismo orden que el repositorio síncrono: las prácticas, luego el resumen y los trabajos que las referencian
+        self.session.add_all([practice_entity_to_db(p) for p in practicas])
+        await self.session.flush()
+        completed = [p for p in practicas if p.analisis is not None]
+        if completed:
+            await self.session.execute(letter_stats_upsert(self.session.get_bind().dialect.name, completed))
+        if trabajos:
+            self.session.add_all([job_entity_to_db(t) for t in trabajos])
+        await self.session.commit()
+
+    async def find_by_id(self, practice_id: uuid.UUID) -> Optional[Practica]:
+        practice_db = await self._get_with_analysis(practice_id)
+        return practice_db_to_entity(practice_db) if practice_db else None
+
+    async def find_by_user_id(self, user_id: uuid.UUID) -> List[Practica]:
+        result = await self.session.execute(
+            select(PracticeDB)
+            .options(joinedload(PracticeDB.analisis))
+            .where(PracticeDB.user_id == user_id)
+            .order_by(PracticeDB.fecha_carga.desc())
+        )
+        return [practice_db_to_entity(p) for p in result.unique().scalars().all() if p]
+
+    async def find_history_page(
+        self, user_id: uuid.UUID, limit: int, cursor: Optional[HistoryCursor] = None
+    ) -> List[PracticeHistoryRow]:
+        result = await self.session.execute(history_page_query(user_id, limit, cursor))
+        return [history_row_from_result(row) for row in result.all()]
+
+    async def stream_export(
+        self, user_id: uuid.UUID, filtro: PracticeExportFilter, batch_size: int
+    ) -> AsyncIterator[List[PracticeExportRow]]:
+        # AsyncSession.stream usa un cursor del lado del servidor (SSCursor en aiomysql)
+        result = await self.session.stream(export_query(user_id, filtro).execution_options(yield_per=batch_size))
+        try:
+            async for partition in result.partitions():
+                yield [export_row_from_result(row) for row in partition]
+        finally:
+            await result.close()
+
+    async def update(self, practica: Practica) -> None:
+        practice_db = await self._get_with_analysis(practica.practice_id)
+        if practice_db:
+            # Mismo orden que el repositorio síncrono: primero el flush del ORM, luego el resumen por letra
+            completes = practice_db.analisis is None and practica.analisis is not None
+            apply_practice_changes(practice_db, practica)
+            if completes:
+                await self.session.flush()
+                await self.session.execute(letter_stats_upsert(self.session.get_bind().dialect.name, [practica]))
+            await self.session.commit()
+
+    async def complete_if_pending(self, practice_id: uuid.UUID, analisis: Analisis) -> PracticeCompletion:
+        # Mismo protocolo que el repositorio síncrono
+        dialect = self.session.get_bind().dialect
+        result = await self.session.execute(complete_pending_practice(practice_id, returning=dialect.update_returning))
+        if dialect.update_returning:
+            row = result.first()
+        else:
+            row = (await self.session.execute(completed_practice_query(practice_id))).first() if result.rowcount else None
+
+        if row is None:
+            estado = (await self.session.execute(practice_state_query(practice_id))).scalar()
+            await self.session.rollback()
+            return PracticeCompletion(CompletionOutcome.NOT_FOUND if estado is None else CompletionOutcome.NOT_PENDING)
+
+        practica = completed_practice_from_row(practice_id, row, analisis)
+        await self.session.execute(letter_stats_upsert(dialect.name, [practica]))
+        await self.session.execute(analysis_insert(), analysis_values(practice_id, analisis))
+        await self.session.commit()
+        # Sin expire_on_commit, una práctica recién guardada en esta sesión seguiría en PENDIENTE
+        self.session.expire_all()
+        return PracticeCompletion(CompletionOutcome.COMPLETED, practica)
+
+    async def complete_many_if_pending(
+        self, resultados: Sequence[Tuple[uuid.UUID, Analisis]]
+    ) -> List[PracticeCompletion]:
+        if not resultados:
+            return []
+        # Se bloquean primero todas las prácticas del lote (luego las filas del resumen, igual
+        # que complete_if_pending) y se decide cada elemento con lo leído
+        practice_ids = list({practice_id for practice_id, _ in resultados})
+        rows = (await self.session.execute(practices_for_completion_query(practice_ids))).all()
+        completions = classify_completions(resultados, rows)
+
+        completed = [c.practica for c in completions if c.outcome == CompletionOutcome.COMPLETED]
+        if completed:
+            dialect_name = self.session.get_bind().dialect.name
+            await self.session.execute(complete_pending_practices([p.practice_id for p in completed]))
+            await self.session.execute(letter_stats_upsert(dialect_name, completed))
+            await self.session.execute(analysis_insert(), [analysis_values(p.practice_id, p.analisis) for p in completed])
+        await self.session.commit()
+        if completed:
+            self.session.expire_all()
+        return completions
+
+    async def fail_if_pending(self, practice_id: uuid.UUID) -> CompletionOutcome:
+        # Mismo protocolo que el repositorio síncrono
+        result = await self.session.execute(fail_pending_practice(practice_id))
+        if result.rowcount:
+            await self.session.commit()
+            self.session.expire_all()
+            return CompletionOutcome.COMPLETED
+        estado = (await self.session.execute(practice_state_query(practice_id))).scalar()
+        await self.session.rollback()
+        return CompletionOutcome.NOT_FOUND if estado is None else CompletionOutcome.NOT_PENDING
+
+    async def delete(self, practice_id: uuid.UUID, user_id: uuid.UUID) -> DeletionOutcome:
+        # Mismo protocolo que el repositorio síncrono
+        dialect = self.session.get_bind().dialect
+        if dialect.delete_returning:
+            row = (await self.session.execute(delete_owned_practice(practice_id, user_id, returning=True))).first()
+        else:
+            row = (await self.session.execute(owned_practice_for_delete_query(practice_id, user_id))).first()
+            if row is not None:
+                await self.session.execute(delete_owned_practice(practice_id, user_id, returning=False))
+
+        if row is None:
+            exists = (await self.session.execute(practice_state_query(practice_id))).first() is not None
+            await self.session.rollback()
+            return DeletionOutcome.FORBIDDEN if exists else DeletionOutcome.NOT_FOUND
+
+        if row.estado_analisis == EstadoAnalisis.COMPLETADO:
+            await self.session.execute(letter_stats_lock(user_id, row.letra_plantilla))
+            await self._recompute_letter_stats(user_id, row.letra_plantilla)
+        await self.session.commit()
+        # El DELETE no pasa por el ORM: se descarta lo que la sesión tuviera cargado de la práctica
+        self.session.expire_all()
+        return DeletionOutcome.DELETED
+
+    async def purge_user_batch(self, user_id: uuid.UUID, limit: int) -> List[uuid.UUID]:
+        practice_ids = list((await self.session.execute(user_practice_ids_query(user_id, limit))).scalars())
+        if practice_ids:
+            await self.session.execute(delete_practices(user_id, practice_ids))
+        if len(practice_ids) < limit:
+            await self.session.execute(letter_stats_delete_user(user_id))
+        await self.session.commit()
+        if practice_ids:
+            self.session.expire_all()
+        return practice_ids
+
+    async def get_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        result = await self.session.execute(letter_stats_by_user_query(user_id))
+        return [letter_stats_row_from_result(row) for row in result.all()]
+
+    async def rebuild_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        letras = list((await self.session.execute(letter_stats_letters_query(user_id))).scalars())
+        for letra in letras:
+            await self.session.execute(letter_stats_lock(user_id, letra))
+            await self._recompute_letter_stats(user_id, letra)
+        await self.session.commit()
+        return await self.get_letter_stats(user_id)
+
+    async def find_letter_stats_user_ids(self, after: Optional[uuid.UUID], limit: int) -> List[uuid.UUID]:
+        return list((await self.session.execute(letter_stats_user_ids_query(after, limit))).scalars())
+
+    async def _recompute_letter_stats(self, user_id: uuid.UUID, letra: LetraPermitida) -> None:
+        aggregate = (await self.session.execute(letter_stats_aggregate_query(user_id, letra))).one()
+        latest = (await self.session.execute(letter_stats_latest_query(user_id, letra))).first()
+        for stmt in letter_stats_replace(user_id, letra, aggregate, latest):
+            await self.session.execute(stmt)
+
+    async def _get_with_analysis(self, practice_id: uuid.UUID) -> Optional[PracticeDB]:
+        result = await self.session.execute(
+            select(PracticeDB)
+            .options(joinedload(PracticeDB.analisis))
+            .where(PracticeDB.practice_id == practice_id)
+        )
+        return result.unique().scalars().first()
@@ -0,0 +1,56 @@
+# src/adapters/repositories/cached_analysis_result_repository.py
+# Caché de resultados en dos niveles: LRU en memoria del proceso y, detrás, la tabla `analysis_results`.
+from typing import Dict, Optional, Sequence
+
+from src.adapters.cache.analysis_result_lru import AnalysisResultLRU
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+
+
+class CachedAnalysisResultRepository(IAsyncAnalysisResultRepository):
+
+    def __init__(self, repository: IAsyncAnalysisResultRepository, lru: AnalysisResultLRU):
+        self.repository = repository
+        self.lru = lru
+
+    async def find(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        resultado = self.lru.get(key)
+        if resultado is not None:
+            self.lru.memory_hits += 1
+            return resultado
+
+        resultado = await self.repository.find(key)
+        if resultado is None:
+            self.lru.misses += 1
+            return None
+
+        self.lru.db_hits += 1
+        self.lru.put(key, resultado)
+        return resultado
+
+    async def find_many(self, keys: Sequence[AnalysisResultKey]) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+        found = {}
+        pending = []
+        for key in dict.fromkeys(keys):
+            resultado = self.lru.get(key)
+            if resultado is not None:
+                self.lru.memory_hits += 1
+                found[key] = resultado
+            else:
+                pending.append(key)
+        if not pending:
+            return found
+
+        # Las claves que no están en memoria se buscan juntas en la tabla
+        from_db = await self.repository.find_many(pending)
+        self.lru.db_hits += len(from_db)
+        self.lru.misses += len(pending) - len(from_db)
+        for key, resultado in from_db.items():
+            self.lru.put(key, resultado)
+        found.update(from_db)
+        return found
+
+    async def save(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        await self.repository.save(key, resultado)
+        self.lru.put(key, resultado)
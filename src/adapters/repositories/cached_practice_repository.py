@@ -0,0 +1,110 @@
+# src/adapters/repositories/cached_practice_repository.py
+# Decorador de lectura a través de caché para `find_by_id`, que es lo que consultan los clientes
+# mientras esperan el análisis. Las escrituras invalidan la entrada después del commit.
+import uuid
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+from src.config import settings
+from src.ports.cache.practice_cache import IPracticeCache
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import (
+    HistoryCursor, PracticeHistoryRow, LetterStatsRow, CompletionOutcome, PracticeCompletion, DeletionOutcome,
+    PracticeExportFilter, PracticeExportRow
+)
+from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import EstadoAnalisis
+
+
+class CachedPracticeRepository(IAsyncPracticeRepository):
+
+    def __init__(self, repository: IAsyncPracticeRepository, cache: IPracticeCache):
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _ttl_for(practica: Practica) -> Optional[float]:
+        # Una práctica solo cambia al salir de PENDIENTE; en estado final su contenido ya no varía
+        return settings.get_practice_cache_ttl(final=practica.estado_analisis != EstadoAnalisis.PENDIENTE)
+
+    async def save(self, practica: Practica) -> None:
+        await self.repository.save(practica)
+
+    async def save_many(self, practicas: List[Practica]) -> None:
+        await self.repository.save_many(practicas)
+
+    async def save_with_job(self, practica: Practica, trabajo: Optional[TrabajoAnalisis]) -> None:
+        await self.repository.save_with_job(practica, trabajo)
+
+    async def save_many_with_jobs(self, practicas: List[Practica], trabajos: List[TrabajoAnalisis]) -> None:
+        await self.repository.save_many_with_jobs(practicas, trabajos)
+
+    async def find_by_id(self, practice_id: uuid.UUID) -> Optional[Practica]:
+        practica = await self.cache.get(practice_id)
+        if practica is not None:
+            return practica
+
+        practica = await self.repository.find_by_id(practice_id)
+        if practica is not None:
+            await self.cache.set(practica, self._ttl_for(practica))
+        return practica
+
+    async def find_by_user_id(self, user_id: uuid.UUID) -> List[Practica]:
+        return await self.repository.find_by_user_id(user_id)
+
+    async def find_history_page(
+        self, user_id: uuid.UUID, limit: int, cursor: Optional[HistoryCursor] = None
+    ) -> List[PracticeHistoryRow]:
+        return await self.repository.find_history_page(user_id, limit, cursor)
+
+    def stream_export(
+        self, user_id: uuid.UUID, filtro: PracticeExportFilter, batch_size: int
+    ) -> AsyncIterator[List[PracticeExportRow]]:
+        return self.repository.stream_export(user_id, filtro, batch_size)
+
+    async def update(self, practica: Practica) -> None:
+        await self.repository.update(practica)
+        await self.cache.invalidate(practica.practice_id)
+
+    async def complete_if_pending(self, practice_id: uuid.UUID, analisis: Analisis) -> PracticeCompletion:
+        completion = await self.repository.complete_if_pending(practice_id, analisis)
+        if completion.outcome == CompletionOutcome.COMPLETED:
+            await self.cache.invalidate(practice_id)
+        return completion
+
+    async def complete_many_if_pending(
+        self, resultados: Sequence[Tuple[uuid.UUID, Analisis]]
+    ) -> List[PracticeCompletion]:
+        completions = await self.repository.complete_many_if_pending(resultados)
+        for completion in completions:
+            if completion.outcome == CompletionOutcome.COMPLETED:
+                await self.cache.invalidate(completion.practica.practice_id)
+        return completions
+
+    async def fail_if_pending(self, practice_id: uuid.UUID) -> CompletionOutcome:
+        outcome = await self.repository.fail_if_pending(practice_id)
+        if outcome == CompletionOutcome.COMPLETED:
+            await self.cache.invalidate(practice_id)
+        return outcome
+
+    async def delete(self, practice_id: uuid.UUID, user_id: uuid.UUID) -> DeletionOutcome:
+        outcome = await self.repository.delete(practice_id, user_id)
+        if outcome == DeletionOutcome.DELETED:
+            await self.cache.invalidate(practice_id)
+        return outcome
+
+    async def purge_user_batch(self, user_id: uuid.UUID, limit: int) -> List[uuid.UUID]:
+        practice_ids = await self.repository.purge_user_batch(user_id, limit)
+        for practice_id in practice_ids:
+            await self.cache.invalidate(practice_id)
+        return practice_ids
+
+    async def get_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        return await self.repository.get_letter_stats(user_id)
+
+    async def rebuild_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        return await self.repository.rebuild_letter_stats(user_id)
+
+    async def find_letter_stats_user_ids(self, after: Optional[uuid.UUID], limit: int) -> List[uuid.UUID]:
+        return await self.repository.find_letter_stats_user_ids(after, limit)
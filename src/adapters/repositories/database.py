@@ -1,21 +1,56 @@
 # src/adapters/repositories/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+from src.adapters.observability.instrumentation import instrument_engine
 from src.config import settings
 
 # Importamos la Base desde nuestro nuevo archivo centralizado.
 from .base import Base 
 
+
+def enable_sqlite_foreign_keys(engine: Engine) -> None:
+    """
+    SQLite no aplica las claves foráneas (ni ON DELETE CASCADE) salvo que se active en cada conexión.
+    Para un motor asíncrono se pasa `async_engine.sync_engine`.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 # Creamos el "motor" que conecta SQLAlchemy con la base de datos
 engine = create_engine(settings.get_db_url())
+# El análisis y el trabajo de una práctica se eliminan en cascada con ella
+enable_sqlite_foreign_keys(engine)
+# Duración de cada sentencia y estado del pool en /metrics
+instrument_engine(engine, "sync")
 
 # SessionLocal es una fábrica de sesiones. Cada instancia será una sesión de base de datos.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# --- Motor asíncrono (opcional) ---
+# Solo se crea con DB_ASYNC=true para no exigir aiomysql/aiosqlite en despliegues síncronos.
+async_engine = None
+AsyncSessionLocal = None
+if settings.db_async:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(settings.get_async_db_url())
+    enable_sqlite_foreign_keys(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine, "async")
+    # expire_on_commit=False: tras el commit no hay lazy loading posible en una sesión asíncrona
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 # --- Dependencia de FastAPI para obtener una sesión de BD ---
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,18 +1,23 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, LargeBinary, Index, Enum as SQLAlchemyEnum
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.mysql import CHAR
-from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
+from src.domain.value_objects.enums import EstadoAnalisis, EstadoTrabajo, LetraPermitida
 from src.adapters.repositories.base import Base
+from src.adapters.repositories.types import BinaryUUID
 import datetime
 
 class PracticeDB(Base):
     __tablename__ = "practices"
     
-    # IMPORTANTE: Esto permite diferenciar 'a' de 'A' (Case Sensitive)
-    __table_args__ = {'mysql_collate': 'utf8mb4_bin'}
+    __table_args__ = (
+        # Historial: filtra por usuario y ordena por (fecha_carga, practice_id) sin filesort
+        Index("ix_practices_user_fecha", "user_id", "fecha_carga", "practice_id"),
+        # IMPORTANTE: Esto permite diferenciar 'a' de 'A' (Case Sensitive)
+        {'mysql_collate': 'utf8mb4_bin'},
+    )
 
-    practice_id = Column(CHAR(36), primary_key=True)
-    user_id = Column(CHAR(36), index=True, nullable=False) # Referencia lógica, no clave foránea
+    practice_id = Column(BinaryUUID, primary_key=True)
+    user_id = Column(BinaryUUID, nullable=False) # Referencia lógica, no clave foránea
     
     # Usamos la definición robusta del Enum para evitar problemas de compatibilidad
     letra_plantilla = Column(
@@ -28,17 +33,24 @@ class PracticeDB(Base):
         default=EstadoAnalisis.PENDIENTE
     )
     
-    analisis = relationship("AnalisisDB", back_populates="practice", uselist=False, cascade="all, delete-orphan")
+    # passive_deletes: el análisis lo elimina la base de datos (ON DELETE CASCADE), sin cargarlo antes
+    analisis = relationship(
+        "AnalisisDB", back_populates="practice", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
 
 class AnalisisDB(Base):
     __tablename__ = "analyses"
 
-    # La tabla hija también debe ser binaria para poder conectarse con la madre
-    __table_args__ = {'mysql_collate': 'utf8mb4_bin'}
+    __table_args__ = (
+        # La relación con la práctica es uno a uno
+        Index("uq_analyses_practice_id", "practice_id", unique=True),
+        # La tabla hija también debe ser binaria para poder conectarse con la madre
+        {'mysql_collate': 'utf8mb4_bin'},
+    )
 
-    analisis_id = Column(CHAR(36), primary_key=True)
+    analisis_id = Column(BinaryUUID, primary_key=True)
     
-    practice_id = Column(CHAR(36), ForeignKey("practices.practice_id"), nullable=False)
+    practice_id = Column(BinaryUUID, ForeignKey("practices.practice_id", ondelete="CASCADE"), nullable=False)
     
     puntuacion_general = Column(Integer)
     puntuacion_proporcion = Column(Integer)
@@ -48,4 +60,108 @@ class AnalisisDB(Base):
     fortalezas = Column(String(255))
     areas_mejora = Column(String(255))
     
-    practice = relationship("PracticeDB", back_populates="analisis")
\ No newline at end of file
+    practice = relationship("PracticeDB", back_populates="analisis")
+
+class AnalysisJobDB(Base):
+    __tablename__ = "analysis_jobs"
+
+    __table_args__ = (
+        # Índice para que los workers encuentren rápido el siguiente trabajo disponible
+        Index("ix_analysis_jobs_estado_disponible", "estado", "disponible_en"),
+        {'mysql_collate': 'utf8mb4_bin'},
+    )
+
+    job_id = Column(BinaryUUID, primary_key=True)
+
+    # Si se elimina la práctica, su trabajo pendiente deja de tener sentido
+    practice_id = Column(BinaryUUID, ForeignKey("practices.practice_id", ondelete="CASCADE"), nullable=False, index=True)
+
+    letra = Column(
+        SQLAlchemyEnum(LetraPermitida, native_enum=False, values_callable=lambda obj: [e.value for e in obj]),
+        nullable=False
+    )
+
+    # Clave de la imagen en el almacenamiento de archivos (IFileStorage)
+    imagen_key = Column(String(255))
+    # Imagen en línea de los trabajos encolados antes de existir el almacenamiento de archivos.
+    # Se podrá eliminar cuando no quede ninguno (ver migración 0006).
+    imagen = Column(LargeBinary().with_variant(MEDIUMBLOB, "mysql"))
+    nombre_archivo = Column(String(255))
+    content_type = Column(String(100))
+
+    estado = Column(
+        SQLAlchemyEnum(EstadoTrabajo, native_enum=False, values_callable=lambda obj: [e.value for e in obj]),
+        nullable=False,
+        default=EstadoTrabajo.PENDIENTE
+    )
+    intentos = Column(Integer, nullable=False, default=0)
+    ultimo_error = Column(String(500))
+    disponible_en = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+    bloqueado_en = Column(DateTime)
+    fecha_creacion = Column(DateTime, default=datetime.datetime.utcnow)
+
+class PracticeLetterStatsDB(Base):
+    """
+    Resumen del progreso por (usuario, letra), mantenido de forma incremental por el repositorio
+    de prácticas: se actualiza al completar un análisis y se recalcula al eliminar una práctica.
+    Solo cuenta prácticas con análisis (estado COMPLETADO).
+    """
+    __tablename__ = "practice_letter_stats"
+
+    __table_args__ = (
+        {'mysql_collate': 'utf8mb4_bin'},
+    )
+
+    user_id = Column(BinaryUUID, primary_key=True)
+    letra_plantilla = Column(
+        SQLAlchemyEnum(LetraPermitida, native_enum=False, values_callable=lambda obj: [e.value for e in obj]),
+        primary_key=True
+    )
+
+    intentos = Column(Integer, nullable=False)
+
+    suma_general = Column(Integer, nullable=False)
+    min_general = Column(Integer, nullable=False)
+    max_general = Column(Integer, nullable=False)
+    suma_proporcion = Column(Integer, nullable=False)
+    min_proporcion = Column(Integer, nullable=False)
+    max_proporcion = Column(Integer, nullable=False)
+    suma_inclinacion = Column(Integer, nullable=False)
+    min_inclinacion = Column(Integer, nullable=False)
+    max_inclinacion = Column(Integer, nullable=False)
+    suma_espaciado = Column(Integer, nullable=False)
+    min_espaciado = Column(Integer, nullable=False)
+    max_espaciado = Column(Integer, nullable=False)
+    suma_consistencia = Column(Integer, nullable=False)
+    min_consistencia = Column(Integer, nullable=False)
+    max_consistencia = Column(Integer, nullable=False)
+
+    # Último intento de esa letra
+    ultima_practice_id = Column(BinaryUUID, nullable=False)
+    ultima_fecha = Column(DateTime, nullable=False)
+    ultima_puntuacion_general = Column(Integer, nullable=False)
+
+
+class AnalysisResultDB(Base):
+    """Resultados del servicio de análisis por (hash de la imagen, letra, versión del modelo)."""
+    __tablename__ = "analysis_results"
+
+    __table_args__ = (
+        {'mysql_collate': 'utf8mb4_bin'},
+    )
+
+    sha256 = Column(String(64), primary_key=True)
+    letra = Column(
+        SQLAlchemyEnum(LetraPermitida, native_enum=False, values_callable=lambda obj: [e.value for e in obj]),
+        primary_key=True
+    )
+    model_version = Column(String(32), primary_key=True)
+
+    puntuacion_general = Column(Integer, nullable=False)
+    puntuacion_proporcion = Column(Integer, nullable=False)
+    puntuacion_inclinacion = Column(Integer, nullable=False)
+    puntuacion_espaciado = Column(Integer, nullable=False)
+    puntuacion_consistencia = Column(Integer, nullable=False)
+    fortalezas = Column(String(255), nullable=False)
+    areas_mejora = Column(String(255), nullable=False)
+    fecha_creacion = Column(DateTime, default=datetime.datetime.utcnow)
@@ -0,0 +1,200 @@
+# src/adapters/repositories/letter_stats.py
+# Sentencias que mantienen `practice_letter_stats`. Las ejecutan los repositorios de prácticas
+# (síncrono y asíncrono) dentro de la misma transacción que completa o elimina la práctica.
+import uuid
+from typing import Dict, List, Optional
+
+from sqlalchemy import CompoundSelect, Delete, Insert, Select, case, delete, func, insert, select, union
+from sqlalchemy.dialects import mysql, sqlite
+
+from src.domain.entities.practica import Practica
+from src.domain.value_objects.enums import LetraPermitida
+from src.ports.repositories.read_models import LetterStatsRow, ScoreAggregate
+from .db_models import PracticeDB, AnalisisDB, PracticeLetterStatsDB
+
+# Puntuaciones agregadas: columna `puntuacion_<nombre>` del análisis -> `suma_/min_/max_<nombre>` del resumen
+SCORE_NAMES = ("general", "proporcion", "inclinacion", "espaciado", "consistencia")
+
+_stats = PracticeLetterStatsDB.__table__
+
+
+def _letter_stats_delta(practicas: List[Practica]) -> dict:
+    """Aporte al resumen de varias prácticas recién completadas de un mismo (usuario, letra)."""
+    latest = max(practicas, key=lambda p: (p.fecha_carga, p.practice_id))
+    values = {
+        "user_id": latest.user_id,
+        "letra_plantilla": latest.letra_plantilla,
+        "intentos": len(practicas),
+        "ultima_practice_id": latest.practice_id,
+        "ultima_fecha": latest.fecha_carga,
+        "ultima_puntuacion_general": latest.analisis.puntuacion_general,
+    }
+    for name in SCORE_NAMES:
+        scores = [getattr(p.analisis, f"puntuacion_{name}") for p in practicas]
+        values[f"suma_{name}"] = sum(scores)
+        values[f"min_{name}"] = min(scores)
+        values[f"max_{name}"] = max(scores)
+    return values
+
+
+def letter_stats_upsert(dialect_name: str, practicas: List[Practica]) -> Insert:
+    """
+    Suma los análisis recién completados de `practicas` al resumen de cada (usuario, letra),
+    creando la fila si es el primer intento. Es atómica frente a otros análisis concurrentes.
+    Las prácticas se agrupan por (usuario, letra): una fila por grupo, en orden de clave para que
+    dos lotes concurrentes bloqueen las filas del resumen en el mismo orden.
+    """
+    groups: Dict[tuple, List[Practica]] = {}
+    for practica in practicas:
+        groups.setdefault((practica.user_id, practica.letra_plantilla.value), []).append(practica)
+    rows = [_letter_stats_delta(groups[key]) for key in sorted(groups)]
+
+    if dialect_name == "mysql":
+        stmt = mysql.insert(_stats).values(rows)
+        new = stmt.inserted
+        least, greatest = func.least, func.greatest
+    elif dialect_name == "sqlite":
+        stmt = sqlite.insert(_stats).values(rows)
+        new = stmt.excluded
+        # En SQLite min()/max() con varios argumentos son funciones escalares
+        least, greatest = func.min, func.max
+    else:
+        raise ValueError(f"Dialecto no soportado para el resumen por letra: '{dialect_name}'.")
+
+    is_latest = new.ultima_fecha >= _stats.c.ultima_fecha
+    # Lista ordenada: MySQL evalúa las asignaciones en orden, así que ultima_fecha va la última
+    # para que las columnas anteriores todavía la comparen con el valor previo
+    assignments = [("intentos", _stats.c.intentos + new.intentos)]
+    for name in SCORE_NAMES:
+        assignments += [
+            (f"suma_{name}", _stats.c[f"suma_{name}"] + new[f"suma_{name}"]),
+            (f"min_{name}", least(_stats.c[f"min_{name}"], new[f"min_{name}"])),
+            (f"max_{name}", greatest(_stats.c[f"max_{name}"], new[f"max_{name}"])),
+        ]
+    for column in ("ultima_practice_id", "ultima_puntuacion_general", "ultima_fecha"):
+        assignments.append((column, case((is_latest, new[column]), else_=_stats.c[column])))
+
+    if dialect_name == "mysql":
+        return stmt.on_duplicate_key_update(assignments)
+    return stmt.on_conflict_do_update(
+        index_elements=[_stats.c.user_id, _stats.c.letra_plantilla], set_=dict(assignments)
+    )
+
+
+def letter_stats_lock(user_id: uuid.UUID, letra: LetraPermitida) -> Select:
+    """Bloquea la fila del resumen para que ningún análisis concurrente se sume durante el recálculo."""
+    return (
+        select(_stats.c.intentos)
+        .where(_stats.c.user_id == user_id, _stats.c.letra_plantilla == letra)
+        .with_for_update()
+    )
+
+
+def letter_stats_aggregate_query(user_id: uuid.UUID, letra: LetraPermitida) -> Select:
+    """Agregados calculados desde cero sobre las prácticas completadas de (usuario, letra)."""
+    columns = [func.count().label("intentos")]
+    for name in SCORE_NAMES:
+        score = AnalisisDB.__table__.c[f"puntuacion_{name}"]
+        columns += [
+            func.sum(score).label(f"suma_{name}"),
+            func.min(score).label(f"min_{name}"),
+            func.max(score).label(f"max_{name}"),
+        ]
+    # Lectura con bloqueo: en InnoDB lee la última versión confirmada y no la instantánea de la transacción
+    return (
+        select(*columns)
+        .select_from(PracticeDB)
+        .join(AnalisisDB, AnalisisDB.practice_id == PracticeDB.practice_id)
+        .where(PracticeDB.user_id == user_id, PracticeDB.letra_plantilla == letra)
+        .with_for_update(read=True)
+    )
+
+
+def letter_stats_latest_query(user_id: uuid.UUID, letra: LetraPermitida) -> Select:
+    return (
+        select(PracticeDB.practice_id, PracticeDB.fecha_carga, AnalisisDB.puntuacion_general)
+        .join(AnalisisDB, AnalisisDB.practice_id == PracticeDB.practice_id)
+        .where(PracticeDB.user_id == user_id, PracticeDB.letra_plantilla == letra)
+        .order_by(PracticeDB.fecha_carga.desc(), PracticeDB.practice_id.desc())
+        .limit(1)
+        .with_for_update(read=True)
+    )
+
+
+def letter_stats_replace(user_id: uuid.UUID, letra: LetraPermitida, aggregate, latest) -> List:
+    """
+    Sentencias que sustituyen el resumen de (usuario, letra) por los agregados recalculados.
+    Si ya no quedan prácticas completadas, la fila simplemente se elimina.
+    """
+    statements: List = [
+        delete(_stats).where(_stats.c.user_id == user_id, _stats.c.letra_plantilla == letra)
+    ]
+    if aggregate.intentos and latest is not None:
+        values = {
+            "user_id": user_id,
+            "letra_plantilla": letra,
+            "intentos": aggregate.intentos,
+            "ultima_practice_id": latest.practice_id,
+            "ultima_fecha": latest.fecha_carga,
+            "ultima_puntuacion_general": latest.puntuacion_general,
+        }
+        for name in SCORE_NAMES:
+            for prefix in ("suma", "min", "max"):
+                values[f"{prefix}_{name}"] = getattr(aggregate, f"{prefix}_{name}")
+        statements.append(insert(_stats).values(**values))
+    return statements
+
+
+def letter_stats_letters_query(user_id: uuid.UUID) -> CompoundSelect:
+    """
+    Letras cuyo resumen hay que recalcular al reconstruir el del usuario: las que tienen prácticas
+    completadas y las que tienen una fila de resumen (que puede haberse quedado sin prácticas).
+    """
+    return union(
+        select(PracticeDB.letra_plantilla)
+        .join(AnalisisDB, AnalisisDB.practice_id == PracticeDB.practice_id)
+        .where(PracticeDB.user_id == user_id),
+        select(_stats.c.letra_plantilla).where(_stats.c.user_id == user_id),
+    ).order_by("letra_plantilla")
+
+
+def letter_stats_user_ids_query(after: Optional[uuid.UUID], limit: int) -> Select:
+    """Usuarios con prácticas completadas o con resumen, en orden de ID y por páginas a partir de `after`."""
+    completed = (
+        select(PracticeDB.user_id)
+        .join(AnalisisDB, AnalisisDB.practice_id == PracticeDB.practice_id)
+    )
+    summarized = select(_stats.c.user_id)
+    if after is not None:
+        completed = completed.where(PracticeDB.user_id > after)
+        summarized = summarized.where(_stats.c.user_id > after)
+    user_ids = union(completed, summarized).subquery()
+    return select(user_ids.c.user_id).order_by(user_ids.c.user_id).limit(limit)
+
+
+def letter_stats_delete_user(user_id: uuid.UUID) -> Delete:
+    """Elimina todo el resumen del usuario; lo usa el purgado de su historial."""
+    return delete(_stats).where(_stats.c.user_id == user_id)
+
+
+def letter_stats_by_user_query(user_id: uuid.UUID) -> Select:
+    return select(_stats).where(_stats.c.user_id == user_id).order_by(_stats.c.letra_plantilla)
+
+
+def letter_stats_row_from_result(row) -> LetterStatsRow:
+    scores = {
+        name: ScoreAggregate(
+            suma=row._mapping[f"suma_{name}"],
+            minimo=row._mapping[f"min_{name}"],
+            maximo=row._mapping[f"max_{name}"],
+        )
+        for name in SCORE_NAMES
+    }
+    return LetterStatsRow(
+        letra_plantilla=row.letra_plantilla,
+        intentos=row.intentos,
+        ultima_practice_id=row.ultima_practice_id,
+        ultima_fecha=row.ultima_fecha,
+        ultima_puntuacion_general=row.ultima_puntuacion_general,
+        **scores,
+    )
@@ -0,0 +1,121 @@
+# src/adapters/repositories/mappers.py
+# Conversión entre entidades de dominio y modelos SQLAlchemy.
+# Se comparte entre los repositorios síncronos y asíncronos.
+import uuid
+from typing import Optional
+
+from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from .db_models import PracticeDB, AnalisisDB, AnalysisJobDB
+
+
+def practice_db_to_entity(practice_db: PracticeDB) -> Optional[Practica]:
+    if not practice_db:
+        return None
+
+    analisis_entity = None
+    if practice_db.analisis:
+        analisis_db = practice_db.analisis
+        analisis_entity = Analisis(
+            analisis_id=analisis_db.analisis_id,
+            puntuacion_general=analisis_db.puntuacion_general,
+            puntuacion_proporcion=analisis_db.puntuacion_proporcion,
+            puntuacion_inclinacion=analisis_db.puntuacion_inclinacion,
+            puntuacion_espaciado=analisis_db.puntuacion_espaciado,
+            puntuacion_consistencia=analisis_db.puntuacion_consistencia,
+            fortalezas=analisis_db.fortalezas,
+            areas_mejora=analisis_db.areas_mejora,
+        )
+
+    return Practica(
+        practice_id=practice_db.practice_id,
+        user_id=practice_db.user_id,
+        letra_plantilla=practice_db.letra_plantilla,
+        url_imagen=practice_db.url_imagen,
+        fecha_carga=practice_db.fecha_carga,
+        estado_analisis=practice_db.estado_analisis,
+        analisis=analisis_entity,
+    )
+
+
+def practice_entity_to_db(practica: Practica) -> PracticeDB:
+    practice_db = PracticeDB(
+        practice_id=practica.practice_id,
+        user_id=practica.user_id,
+        letra_plantilla=practica.letra_plantilla,
+        url_imagen=practica.url_imagen,
+        fecha_carga=practica.fecha_carga,
+        estado_analisis=practica.estado_analisis,
+    )
+    # Una práctica nueva trae análisis cuando se completa con un resultado reutilizado
+    if practica.analisis:
+        practice_db.analisis = analisis_entity_to_db(practica.practice_id, practica.analisis)
+    return practice_db
+
+
+def analisis_entity_to_db(practice_id: uuid.UUID, analisis: Analisis) -> AnalisisDB:
+    return AnalisisDB(
+        analisis_id=analisis.analisis_id,
+        practice_id=practice_id,
+        puntuacion_general=analisis.puntuacion_general,
+        puntuacion_proporcion=analisis.puntuacion_proporcion,
+        puntuacion_inclinacion=analisis.puntuacion_inclinacion,
+        puntuacion_espaciado=analisis.puntuacion_espaciado,
+        puntuacion_consistencia=analisis.puntuacion_consistencia,
+        fortalezas=analisis.fortalezas,
+        areas_mejora=analisis.areas_mejora,
+    )
+
+
+def apply_practice_changes(practice_db: PracticeDB, practica: Practica) -> None:
+    """Copia el estado y el análisis de la entidad sobre el modelo ya cargado (con `analisis` precargado)."""
+    practice_db.estado_analisis = practica.estado_analisis
+
+    # Si hay un análisis, créalo o actualízalo
+    if practica.analisis:
+        if practice_db.analisis:
+            # Actualiza el análisis existente
+            practice_db.analisis.puntuacion_general = practica.analisis.puntuacion_general
+            practice_db.analisis.puntuacion_proporcion = practica.analisis.puntuacion_proporcion
+            practice_db.analisis.puntuacion_inclinacion = practica.analisis.puntuacion_inclinacion
+            practice_db.analisis.puntuacion_espaciado = practica.analisis.puntuacion_espaciado
+            practice_db.analisis.puntuacion_consistencia = practica.analisis.puntuacion_consistencia
+            practice_db.analisis.fortalezas = practica.analisis.fortalezas
+            practice_db.analisis.areas_mejora = practica.analisis.areas_mejora
+        else:
+            # Crea un nuevo análisis
+            practice_db.analisis = analisis_entity_to_db(practica.practice_id, practica.analisis)
+
+
+def job_db_to_entity(job_db: AnalysisJobDB) -> TrabajoAnalisis:
+    return TrabajoAnalisis(
+        job_id=job_db.job_id,
+        practice_id=job_db.practice_id,
+        letra=job_db.letra,
+        imagen_key=job_db.imagen_key,
+        imagen=job_db.imagen,
+        nombre_archivo=job_db.nombre_archivo,
+        content_type=job_db.content_type,
+        estado=job_db.estado,
+        intentos=job_db.intentos,
+        ultimo_error=job_db.ultimo_error,
+        disponible_en=job_db.disponible_en,
+        fecha_creacion=job_db.fecha_creacion,
+    )
+
+
+def job_entity_to_db(trabajo: TrabajoAnalisis) -> AnalysisJobDB:
+    return AnalysisJobDB(
+        job_id=trabajo.job_id,
+        practice_id=trabajo.practice_id,
+        letra=trabajo.letra,
+        imagen_key=trabajo.imagen_key,
+        imagen=trabajo.imagen,
+        nombre_archivo=trabajo.nombre_archivo,
+        content_type=trabajo.content_type,
+        estado=trabajo.estado,
+        intentos=trabajo.intentos,
+        disponible_en=trabajo.disponible_en,
+        fecha_creacion=trabajo.fecha_creacion,
+    )
@@ -0,0 +1,113 @@
+# src/adapters/repositories/mysql_analysis_job_repository.py
+from typing import List, Optional
+import datetime
+import uuid
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from src.ports.repositories.analysis_job_repository import IAnalysisJobRepository
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import EstadoTrabajo
+from src.adapters.observability.instrumentation import instrument_repository
+from .db_models import AnalysisJobDB
+from .mappers import job_db_to_entity, job_entity_to_db
+
+@instrument_repository("jobs")
+class MySQLAnalysisJobRepository(IAnalysisJobRepository):
+    """Cola de trabajos de análisis respaldada por la tabla `analysis_jobs`."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, trabajo: TrabajoAnalisis) -> None:
+        self.db.add(self._map_entity_to_db_model(trabajo))
+        self.db.commit()
+
+    def enqueue_many(self, trabajos: List[TrabajoAnalisis]) -> None:
+        self.db.add_all([self._map_entity_to_db_model(t) for t in trabajos])
+        self.db.commit()
+
+    def claim_next(self, visibility_timeout: int) -> Optional[TrabajoAnalisis]:
+        now = datetime.datetime.utcnow()
+        # Un trabajo "en proceso" cuyo worker murió (reinicio, caída del pod) vuelve a estar disponible
+        abandonado_antes_de = now - datetime.timedelta(seconds=visibility_timeout)
+
+        job_db = (
+            self.db.query(AnalysisJobDB)
+            .filter(
+                or_(
+                    and_(AnalysisJobDB.estado == EstadoTrabajo.PENDIENTE, AnalysisJobDB.disponible_en <= now),
+                    and_(AnalysisJobDB.estado == EstadoTrabajo.EN_PROCESO, AnalysisJobDB.bloqueado_en <= abandonado_antes_de),
+                )
+            )
+            .order_by(AnalysisJobDB.disponible_en)
+            # SKIP LOCKED evita que dos workers reserven el mismo trabajo
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if not job_db:
+            self.db.rollback()
+            return None
+
+        # UPDATE condicional: `intentos` actúa como versión, así solo un worker gana la reserva
+        # aunque el motor no soporte SKIP LOCKED (p. ej. SQLite)
+        intentos_previos = job_db.intentos or 0
+        reservado = (
+            self.db.query(AnalysisJobDB)
+            .filter(AnalysisJobDB.job_id == job_db.job_id, AnalysisJobDB.intentos == intentos_previos)
+            .update(
+                {
+                    AnalysisJobDB.estado: EstadoTrabajo.EN_PROCESO,
+                    AnalysisJobDB.bloqueado_en: now,
+                    AnalysisJobDB.intentos: intentos_previos + 1,
+                },
+                synchronize_session=False,
+            )
+        )
+        if not reservado:
+            self.db.rollback()
+            return None
+
+        trabajo = self._map_db_model_to_entity(job_db)
+        trabajo.estado = EstadoTrabajo.EN_PROCESO
+        trabajo.intentos = intentos_previos + 1
+        self.db.commit()
+        return trabajo
+
+    def complete(self, job_id: uuid.UUID) -> None:
+        # Los trabajos terminados se eliminan para no acumular imágenes en la tabla
+        self.db.query(AnalysisJobDB).filter(AnalysisJobDB.job_id == job_id).delete(synchronize_session=False)
+        self.db.commit()
+
+    def reschedule(
+        self, job_id: uuid.UUID, error: str, disponible_en: datetime.datetime, consume_attempt: bool = True
+    ) -> None:
+        values = {
+            AnalysisJobDB.estado: EstadoTrabajo.PENDIENTE,
+            AnalysisJobDB.ultimo_error: error[:500],
+            AnalysisJobDB.disponible_en: disponible_en,
+            AnalysisJobDB.bloqueado_en: None,
+        }
+        if not consume_attempt:
+            # claim_next ya sumó el intento; se descuenta
+            values[AnalysisJobDB.intentos] = AnalysisJobDB.intentos - 1
+        self.db.query(AnalysisJobDB).filter(AnalysisJobDB.job_id == job_id).update(values, synchronize_session=False)
+        self.db.commit()
+
+    def mark_failed(self, job_id: uuid.UUID, error: str) -> None:
+        self.db.query(AnalysisJobDB).filter(AnalysisJobDB.job_id == job_id).update(
+            {
+                AnalysisJobDB.estado: EstadoTrabajo.ERROR,
+                AnalysisJobDB.ultimo_error: error[:500],
+                AnalysisJobDB.bloqueado_en: None,
+            },
+            synchronize_session=False,
+        )
+        self.db.commit()
+
+    # --- MÉTODOS PRIVADOS DE MAPEO ---
+
+    def _map_db_model_to_entity(self, job_db: AnalysisJobDB) -> TrabajoAnalisis:
+        return job_db_to_entity(job_db)
+
+    def _map_entity_to_db_model(self, trabajo: TrabajoAnalisis) -> AnalysisJobDB:
+        return job_entity_to_db(trabajo)
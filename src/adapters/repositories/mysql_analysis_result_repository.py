@@ -0,0 +1,30 @@
+# src/adapters/repositories/mysql_analysis_result_repository.py
+from typing import Dict, Optional, Sequence
+from sqlalchemy.orm import Session
+from src.ports.repositories.analysis_result_repository import IAnalysisResultRepository
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+from src.adapters.observability.instrumentation import instrument_repository
+from .queries import (
+    analysis_result_query, analysis_results_query, analysis_results_by_key, analysis_result_insert, analysis_result_to_dto
+)
+
+@instrument_repository("analysis_results")
+class MySQLAnalysisResultRepository(IAnalysisResultRepository):
+    """Caché persistente de resultados de análisis en la tabla `analysis_results`."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        result_db = self.db.execute(analysis_result_query(key)).scalars().first()
+        return analysis_result_to_dto(result_db) if result_db else None
+
+    def find_many(self, keys: Sequence[AnalysisResultKey]) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+        if not keys:
+            return {}
+        return analysis_results_by_key(keys, self.db.execute(analysis_results_query(keys)).scalars().all())
+
+    def save(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        self.db.execute(analysis_result_insert(self.db.get_bind().dialect.name, key, resultado))
+        self.db.commit()
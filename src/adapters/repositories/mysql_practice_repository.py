@@ -1,16 +1,37 @@
 # src/adapters/repositories/mysql_practice_repository.py
-from typing import Optional, List
+from typing import Iterator, Optional, List, Sequence, Tuple
 import uuid
 from sqlalchemy.orm import Session, joinedload
 from src.ports.repositories.practice_repository import IPracticeRepository
+from src.ports.repositories.read_models import (
+    HistoryCursor, PracticeHistoryRow, LetterStatsRow, CompletionOutcome, PracticeCompletion, DeletionOutcome,
+    PracticeExportFilter, PracticeExportRow
+)
+from src.adapters.observability.instrumentation import instrument_repository
 
 # Modelos del dominio
 from src.domain.entities.practica import Practica
 from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
 
 # Modelos de la base de datos (SQLAlchemy)
-from .db_models import PracticeDB, AnalisisDB
+from .db_models import PracticeDB
+from .mappers import practice_db_to_entity, practice_entity_to_db, apply_practice_changes, job_entity_to_db
+from .queries import (
+    history_page_query, history_row_from_result, complete_pending_practice, completed_practice_query,
+    practice_state_query, completed_practice_from_row, analysis_insert, analysis_values,
+    practices_for_completion_query, complete_pending_practices, classify_completions, fail_pending_practice,
+    delete_owned_practice, owned_practice_for_delete_query, user_practice_ids_query, delete_practices,
+    export_query, export_row_from_result
+)
+from .letter_stats import (
+    letter_stats_upsert, letter_stats_lock, letter_stats_aggregate_query, letter_stats_latest_query,
+    letter_stats_replace, letter_stats_by_user_query, letter_stats_row_from_result, letter_stats_delete_user,
+    letter_stats_letters_query, letter_stats_user_ids_query
+)
 
+@instrument_repository("practices")
 class MySQLPracticeRepository(IPracticeRepository):
     
     def __init__(self, db: Session):
@@ -21,11 +42,29 @@ class MySQLPracticeRepository(IPracticeRepository):
         self.db.add(practice_db)
         self.db.commit()
 
+    def save_many(self, practicas: List[Practica]) -> None:
+        self.db.add_all([self._map_entity_to_db_model(p) for p in practicas])
+        self.db.commit()
+
+    def save_with_job(self, practica: Practica, trabajo: Optional[TrabajoAnalisis]) -> None:
+        self.save_many_with_jobs([practica], [trabajo] if trabajo is not None else [])
+
+    def save_many_with_jobs(self, practicas: List[Practica], trabajos: List[TrabajoAnalisis]) -> None:
+        self.db.add_all([self._map_entity_to_db_model(p) for p in practicas])
+        # analysis_jobs y el resumen referencian las prácticas: se insertan antes que ellos
+        self.db.flush()
+        completed = [p for p in practicas if p.analisis is not None]
+        if completed:
+            self.db.execute(letter_stats_upsert(self.db.get_bind().dialect.name, completed))
+        if trabajos:
+            self.db.add_all([job_entity_to_db(t) for t in trabajos])
+        self.db.commit()
+
     def find_by_id(self, practice_id: uuid.UUID) -> Optional[Practica]:
         practice_db = (
             self.db.query(PracticeDB)
             .options(joinedload(PracticeDB.analisis)) # Carga ansiosa para incluir el análisis
-            .filter(PracticeDB.practice_id == str(practice_id))
+            .filter(PracticeDB.practice_id == practice_id)
             .first()
         )
         return self._map_db_model_to_entity(practice_db) if practice_db else None
@@ -34,92 +73,157 @@ class MySQLPracticeRepository(IPracticeRepository):
         practices_db = (
             self.db.query(PracticeDB)
             .options(joinedload(PracticeDB.analisis))
-            .filter(PracticeDB.user_id == str(user_id))
+            .filter(PracticeDB.user_id == user_id)
             .order_by(PracticeDB.fecha_carga.desc())
             .all()
         )
         return [self._map_db_model_to_entity(p) for p in practices_db if p]
 
+    def find_history_page(
+        self, user_id: uuid.UUID, limit: int, cursor: Optional[HistoryCursor] = None
+    ) -> List[PracticeHistoryRow]:
+        rows = self.db.execute(history_page_query(user_id, limit, cursor)).all()
+        return [history_row_from_result(row) for row in rows]
+
+    def stream_export(
+        self, user_id: uuid.UUID, filtro: PracticeExportFilter, batch_size: int
+    ) -> Iterator[List[PracticeExportRow]]:
+        # yield_per activa stream_results: PyMySQL usa un cursor sin buffer (SSCursor)
+        result = self.db.execute(export_query(user_id, filtro).execution_options(yield_per=batch_size))
+        try:
+            for partition in result.partitions():
+                yield [export_row_from_result(row) for row in partition]
+        finally:
+            result.close()
+
     def update(self, practica: Practica) -> None:
         practice_db = (
             self.db.query(PracticeDB)
             .options(joinedload(PracticeDB.analisis))
-            .filter(PracticeDB.practice_id == str(practica.practice_id))
+            .filter(PracticeDB.practice_id == practica.practice_id)
             .first()
         )
         if practice_db:
-            # Actualiza los campos de la práctica
-            practice_db.estado_analisis = practica.estado_analisis
-            
-            # Si hay un análisis, créalo o actualízalo
-            if practica.analisis:
-                if practice_db.analisis:
-                    # Actualiza el análisis existente
-                    practice_db.analisis.puntuacion_general = practica.analisis.puntuacion_general
-                    practice_db.analisis.puntuacion_proporcion = practica.analisis.puntuacion_proporcion
-                    practice_db.analisis.puntuacion_inclinacion = practica.analisis.puntuacion_inclinacion
-                    practice_db.analisis.puntuacion_espaciado = practica.analisis.puntuacion_espaciado
-                    practice_db.analisis.puntuacion_consistencia = practica.analisis.puntuacion_consistencia
-                    practice_db.analisis.fortalezas = practica.analisis.fortalezas
-                    practice_db.analisis.areas_mejora = practica.analisis.areas_mejora
-                else:
-                    # Crea un nuevo análisis
-                    practice_db.analisis = AnalisisDB(
-                        analisis_id=str(practica.analisis.analisis_id),
-                        practice_id=str(practica.practice_id),
-                        puntuacion_general=practica.analisis.puntuacion_general,
-                        puntuacion_proporcion=practica.analisis.puntuacion_proporcion,
-                        puntuacion_inclinacion=practica.analisis.puntuacion_inclinacion,
-                        puntuacion_espaciado=practica.analisis.puntuacion_espaciado,
-                        puntuacion_consistencia=practica.analisis.puntuacion_consistencia,
-                        fortalezas=practica.analisis.fortalezas,
-                        areas_mejora=practica.analisis.areas_mejora,
-                    )
-            
+            # Si esta actualización completa el análisis, se suma al resumen por letra en la misma
+            # transacción. El upsert va después del flush del ORM: así, igual que complete_if_pending()
+            # y delete(), se bloquea primero la práctica y no hay interbloqueos entre los caminos.
+            completes = practice_db.analisis is None and practica.analisis is not None
+            apply_practice_changes(practice_db, practica)
+            if completes:
+                self.db.flush()
+                self.db.execute(letter_stats_upsert(self.db.get_bind().dialect.name, [practica]))
             self.db.commit()
 
-    def delete(self, practice_id: uuid.UUID) -> None:
-        practice_db = self.db.query(PracticeDB).filter(PracticeDB.practice_id == str(practice_id)).first()
-        if practice_db:
-            self.db.delete(practice_db)
+    def complete_if_pending(self, practice_id: uuid.UUID, analisis: Analisis) -> PracticeCompletion:
+        dialect = self.db.get_bind().dialect
+        # El UPDATE condicional bloquea la fila de la práctica; a partir de aquí ninguna otra
+        # escritura puede completarla, así que el resumen y el análisis se escriben sin más lecturas
+        result = self.db.execute(complete_pending_practice(practice_id, returning=dialect.update_returning))
+        if dialect.update_returning:
+            row = result.first()
+        else:
+            # MySQL no tiene UPDATE ... RETURNING: se leen las columnas de la fila ya bloqueada
+            row = self.db.execute(completed_practice_query(practice_id)).first() if result.rowcount else None
+
+        if row is None:
+            estado = self.db.execute(practice_state_query(practice_id)).scalar()
+            self.db.rollback()
+            return PracticeCompletion(CompletionOutcome.NOT_FOUND if estado is None else CompletionOutcome.NOT_PENDING)
+
+        practica = completed_practice_from_row(practice_id, row, analisis)
+        self.db.execute(letter_stats_upsert(dialect.name, [practica]))
+        self.db.execute(analysis_insert(), analysis_values(practice_id, analisis))
+        self.db.commit()
+        return PracticeCompletion(CompletionOutcome.COMPLETED, practica)
+
+    def complete_many_if_pending(
+        self, resultados: Sequence[Tuple[uuid.UUID, Analisis]]
+    ) -> List[PracticeCompletion]:
+        if not resultados:
+            return []
+        # Se bloquean primero todas las prácticas del lote (luego las filas del resumen, igual
+        # que complete_if_pending) y se decide cada elemento con lo leído
+        practice_ids = list({practice_id for practice_id, _ in resultados})
+        rows = self.db.execute(practices_for_completion_query(practice_ids)).all()
+        completions = classify_completions(resultados, rows)
+
+        completed = [c.practica for c in completions if c.outcome == CompletionOutcome.COMPLETED]
+        if completed:
+            dialect_name = self.db.get_bind().dialect.name
+            self.db.execute(complete_pending_practices([p.practice_id for p in completed]))
+            self.db.execute(letter_stats_upsert(dialect_name, completed))
+            self.db.execute(analysis_insert(), [analysis_values(p.practice_id, p.analisis) for p in completed])
+        self.db.commit()
+        return completions
+
+    def fail_if_pending(self, practice_id: uuid.UUID) -> CompletionOutcome:
+        result = self.db.execute(fail_pending_practice(practice_id))
+        if result.rowcount:
             self.db.commit()
+            return CompletionOutcome.COMPLETED
+        estado = self.db.execute(practice_state_query(practice_id)).scalar()
+        self.db.rollback()
+        return CompletionOutcome.NOT_FOUND if estado is None else CompletionOutcome.NOT_PENDING
+
+    def delete(self, practice_id: uuid.UUID, user_id: uuid.UUID) -> DeletionOutcome:
+        dialect = self.db.get_bind().dialect
+        if dialect.delete_returning:
+            row = self.db.execute(delete_owned_practice(practice_id, user_id, returning=True)).first()
+        else:
+            # MySQL no tiene DELETE ... RETURNING: se bloquea la fila del usuario por clave primaria
+            # y se elimina con la misma condición
+            row = self.db.execute(owned_practice_for_delete_query(practice_id, user_id)).first()
+            if row is not None:
+                self.db.execute(delete_owned_practice(practice_id, user_id, returning=False))
+
+        if row is None:
+            exists = self.db.execute(practice_state_query(practice_id)).first() is not None
+            self.db.rollback()
+            return DeletionOutcome.FORBIDDEN if exists else DeletionOutcome.NOT_FOUND
+
+        # El resumen se bloquea después de la práctica, en el mismo orden que complete_if_pending()
+        if row.estado_analisis == EstadoAnalisis.COMPLETADO:
+            self.db.execute(letter_stats_lock(user_id, row.letra_plantilla))
+            self._recompute_letter_stats(user_id, row.letra_plantilla)
+        self.db.commit()
+        return DeletionOutcome.DELETED
+
+    def purge_user_batch(self, user_id: uuid.UUID, limit: int) -> List[uuid.UUID]:
+        practice_ids = list(self.db.execute(user_practice_ids_query(user_id, limit)).scalars())
+        if practice_ids:
+            self.db.execute(delete_practices(user_id, practice_ids))
+        if len(practice_ids) < limit:
+            self.db.execute(letter_stats_delete_user(user_id))
+        self.db.commit()
+        return practice_ids
+
+    def get_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        rows = self.db.execute(letter_stats_by_user_query(user_id)).all()
+        return [letter_stats_row_from_result(row) for row in rows]
+
+    def rebuild_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        letras = list(self.db.execute(letter_stats_letters_query(user_id)).scalars())
+        # Mismo bloqueo que al eliminar una práctica, letra a letra y en orden
+        for letra in letras:
+            self.db.execute(letter_stats_lock(user_id, letra))
+            self._recompute_letter_stats(user_id, letra)
+        self.db.commit()
+        return self.get_letter_stats(user_id)
+
+    def find_letter_stats_user_ids(self, after: Optional[uuid.UUID], limit: int) -> List[uuid.UUID]:
+        return list(self.db.execute(letter_stats_user_ids_query(after, limit)).scalars())
+
+    def _recompute_letter_stats(self, user_id: uuid.UUID, letra: LetraPermitida) -> None:
+        # Mínimos, máximos y último intento no se pueden "restar": se recalculan desde las prácticas
+        aggregate = self.db.execute(letter_stats_aggregate_query(user_id, letra)).one()
+        latest = self.db.execute(letter_stats_latest_query(user_id, letra)).first()
+        for stmt in letter_stats_replace(user_id, letra, aggregate, latest):
+            self.db.execute(stmt)
             
     # --- MÉTODOS PRIVADOS DE MAPEO ---
 
     def _map_db_model_to_entity(self, practice_db: PracticeDB) -> Optional[Practica]:
-        if not practice_db:
-            return None
-            
-        analisis_entity = None
-        if practice_db.analisis:
-            analisis_db = practice_db.analisis
-            analisis_entity = Analisis(
-                analisis_id=uuid.UUID(analisis_db.analisis_id),
-                puntuacion_general=analisis_db.puntuacion_general,
-                puntuacion_proporcion=analisis_db.puntuacion_proporcion,
-                puntuacion_inclinacion=analisis_db.puntuacion_inclinacion,
-                puntuacion_espaciado=analisis_db.puntuacion_espaciado,
-                puntuacion_consistencia=analisis_db.puntuacion_consistencia,
-                fortalezas=analisis_db.fortalezas,
-                areas_mejora=analisis_db.areas_mejora,
-            )
-            
-        return Practica(
-            practice_id=uuid.UUID(practice_db.practice_id),
-            user_id=uuid.UUID(practice_db.user_id),
-            letra_plantilla=practice_db.letra_plantilla,
-            url_imagen=practice_db.url_imagen,
-            fecha_carga=practice_db.fecha_carga,
-            estado_analisis=practice_db.estado_analisis,
-            analisis=analisis_entity,
-        )
+        return practice_db_to_entity(practice_db)
 
     def _map_entity_to_db_model(self, practica: Practica) -> PracticeDB:
-        return PracticeDB(
-            practice_id=str(practica.practice_id),
-            user_id=str(practica.user_id),
-            letra_plantilla=practica.letra_plantilla,
-            url_imagen=practica.url_imagen,
-            fecha_carga=practica.fecha_carga,
-            estado_analisis=practica.estado_analisis,
-        )
\ No newline at end of file
+        return practice_entity_to_db(practica)
@@ -0,0 +1,76 @@
+# src/adapters/repositories/providers.py
+# Punto único donde se decide qué implementación de los repositorios se usa
+# (AsyncSession nativa o PyMySQL en el threadpool) según `settings.db_async`,
+# y si las lecturas por ID pasan por la caché de prácticas.
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, NamedTuple
+
+from starlette.concurrency import run_in_threadpool
+
+from src.config import settings
+from src.adapters.cache import AnalysisResultLRU, build_practice_cache
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.async_analysis_job_repository import IAsyncAnalysisJobRepository
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from . import database
+from .mysql_practice_repository import MySQLPracticeRepository
+from .mysql_analysis_job_repository import MySQLAnalysisJobRepository
+from .mysql_analysis_result_repository import MySQLAnalysisResultRepository
+from .threaded_repositories import (
+    ThreadedPracticeRepository, ThreadedAnalysisJobRepository, ThreadedAnalysisResultRepository
+)
+from .cached_practice_repository import CachedPracticeRepository
+from .cached_analysis_result_repository import CachedAnalysisResultRepository
+
+# Una caché por proceso, compartida por todas las peticiones y los workers de análisis
+practice_cache = build_practice_cache()
+analysis_result_cache = AnalysisResultLRU(max_entries=settings.analysis_result_cache_max_entries)
+
+
+def _with_cache(repository: IAsyncPracticeRepository) -> IAsyncPracticeRepository:
+    if practice_cache is None:
+        return repository
+    return CachedPracticeRepository(repository, practice_cache)
+
+
+class Repositories(NamedTuple):
+    """Repositorios que comparten una misma sesión de base de datos."""
+    practices: IAsyncPracticeRepository
+    jobs: IAsyncAnalysisJobRepository
+    analysis_results: IAsyncAnalysisResultRepository
+
+
+@asynccontextmanager
+async def open_repositories() -> AsyncIterator[Repositories]:
+    if settings.db_async:
+        from .async_mysql_practice_repository import AsyncMySQLPracticeRepository
+        from .async_mysql_analysis_job_repository import AsyncMySQLAnalysisJobRepository
+        from .async_mysql_analysis_result_repository import AsyncMySQLAnalysisResultRepository
+
+        async with database.AsyncSessionLocal() as session:
+            yield Repositories(
+                practices=_with_cache(AsyncMySQLPracticeRepository(session)),
+                jobs=AsyncMySQLAnalysisJobRepository(session),
+                analysis_results=CachedAnalysisResultRepository(
+                    AsyncMySQLAnalysisResultRepository(session), analysis_result_cache
+                ),
+            )
+        return
+
+    db = database.SessionLocal()
+    try:
+        yield Repositories(
+            practices=_with_cache(ThreadedPracticeRepository(MySQLPracticeRepository(db))),
+            jobs=ThreadedAnalysisJobRepository(MySQLAnalysisJobRepository(db)),
+            analysis_results=CachedAnalysisResultRepository(
+                ThreadedAnalysisResultRepository(MySQLAnalysisResultRepository(db)), analysis_result_cache
+            ),
+        )
+    finally:
+        await run_in_threadpool(db.close)
+
+
+# --- Dependencia de FastAPI ---
+async def get_repositories() -> AsyncIterator[Repositories]:
+    async with open_repositories() as repositories:
+        yield repositories
@@ -0,0 +1,299 @@
+# src/adapters/repositories/queries.py
+# Sentencias SQLAlchemy 2.0 compartidas por los repositorios síncronos y asíncronos.
+import datetime
+import uuid
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Delete, Insert, Select, Update, and_, delete, insert, or_, select, update
+from sqlalchemy.dialects import mysql, sqlite
+
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.practica import Practica
+from src.domain.value_objects.enums import EstadoAnalisis
+from src.ports.repositories.read_models import (
+    AnalysisResultKey, CompletionOutcome, HistoryCursor, PracticeCompletion, PracticeHistoryRow,
+    PracticeExportFilter, PracticeExportRow
+)
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+from .db_models import PracticeDB, AnalisisDB, AnalysisResultDB
+
+
+def history_page_query(user_id: uuid.UUID, limit: int, cursor: Optional[HistoryCursor] = None) -> Select:
+    """
+    Página del historial con paginación por keyset sobre (fecha_carga, practice_id).
+    Solo proyecta las columnas del historial: no se hidratan modelos ORM ni entidades.
+    """
+    stmt = (
+        select(
+            PracticeDB.practice_id,
+            PracticeDB.letra_plantilla,
+            PracticeDB.fecha_carga,
+            AnalisisDB.puntuacion_general,
+        )
+        .outerjoin(AnalisisDB, AnalisisDB.practice_id == PracticeDB.practice_id)
+        .where(PracticeDB.user_id == user_id)
+        .order_by(PracticeDB.fecha_carga.desc(), PracticeDB.practice_id.desc())
+        .limit(limit)
+    )
+    if cursor is not None:
+        # Equivale a (fecha_carga, practice_id) < (cursor.fecha_carga, cursor.practice_id),
+        # escrito con OR para que MySQL use el índice en cualquier versión
+        stmt = stmt.where(
+            or_(
+                PracticeDB.fecha_carga < cursor.fecha_carga,
+                and_(
+                    PracticeDB.fecha_carga == cursor.fecha_carga,
+                    PracticeDB.practice_id < cursor.practice_id,
+                ),
+            )
+        )
+    return stmt
+
+
+def history_row_from_result(row) -> PracticeHistoryRow:
+    return PracticeHistoryRow(
+        practice_id=row.practice_id,
+        letra_plantilla=row.letra_plantilla,
+        fecha_carga=row.fecha_carga,
+        puntuacion_general=row.puntuacion_general,
+    )
+
+
+def export_query(user_id: uuid.UUID, filtro: PracticeExportFilter) -> Select:
+    """
+    Historial completo con el análisis de cada práctica, en el orden del índice (user_id, fecha_carga,
+    practice_id): el rango de fechas se resuelve con el índice y no hace falta ordenar en memoria.
+    """
+    stmt = (
+        select(
+            PracticeDB.practice_id,
+            PracticeDB.letra_plantilla,
+            PracticeDB.fecha_carga,
+            PracticeDB.estado_analisis,
+            AnalisisDB.puntuacion_general,
+            AnalisisDB.puntuacion_proporcion,
+            AnalisisDB.puntuacion_inclinacion,
+            AnalisisDB.puntuacion_espaciado,
+            AnalisisDB.puntuacion_consistencia,
+            AnalisisDB.fortalezas,
+            AnalisisDB.areas_mejora,
+        )
+        .outerjoin(AnalisisDB, AnalisisDB.practice_id == PracticeDB.practice_id)
+        .where(PracticeDB.user_id == user_id)
+        .order_by(PracticeDB.fecha_carga.desc(), PracticeDB.practice_id.desc())
+    )
+    if filtro.letra is not None:
+        stmt = stmt.where(PracticeDB.letra_plantilla == filtro.letra)
+    if filtro.desde is not None:
+        stmt = stmt.where(PracticeDB.fecha_carga >= filtro.desde)
+    if filtro.hasta is not None:
+        stmt = stmt.where(PracticeDB.fecha_carga < filtro.hasta)
+    return stmt
+
+
+def export_row_from_result(row) -> PracticeExportRow:
+    return PracticeExportRow(**row._mapping)
+
+
+_practices = PracticeDB.__table__
+# Columnas con las que se reconstruye la práctica completada sin volver a leerla con su análisis
+_completion_columns = (_practices.c.user_id, _practices.c.letra_plantilla, _practices.c.url_imagen, _practices.c.fecha_carga)
+
+
+def complete_pending_practice(practice_id: uuid.UUID, returning: bool) -> Update:
+    """
+    UPDATE condicional PENDIENTE -> COMPLETADO. Si afecta a una fila, esta escritura es la que
+    completa la práctica; si no, la práctica no existe o ya salió de PENDIENTE. Con `returning`
+    (SQLite, no MySQL) devuelve además las columnas que hacen falta para reconstruirla.
+    """
+    stmt = (
+        update(_practices)
+        .where(_practices.c.practice_id == practice_id, _practices.c.estado_analisis == EstadoAnalisis.PENDIENTE)
+        .values(estado_analisis=EstadoAnalisis.COMPLETADO)
+    )
+    return stmt.returning(*_completion_columns) if returning else stmt
+
+
+def fail_pending_practice(practice_id: uuid.UUID) -> Update:
+    """
+    UPDATE condicional PENDIENTE -> ERROR. Igual que `complete_pending_practice`: si no afecta a ninguna
+    fila, la práctica no existe o el resultado del análisis llegó antes.
+    """
+    return (
+        update(_practices)
+        .where(_practices.c.practice_id == practice_id, _practices.c.estado_analisis == EstadoAnalisis.PENDIENTE)
+        .values(estado_analisis=EstadoAnalisis.ERROR)
+    )
+
+
+def completed_practice_query(practice_id: uuid.UUID) -> Select:
+    """Lectura por clave primaria, sin JOIN, de la fila que el UPDATE condicional acaba de bloquear."""
+    return select(*_completion_columns).where(_practices.c.practice_id == practice_id)
+
+
+def practice_state_query(practice_id: uuid.UUID) -> Select:
+    """Estado actual de la práctica; solo se consulta cuando el UPDATE condicional no afectó a ninguna fila."""
+    return select(_practices.c.estado_analisis).where(_practices.c.practice_id == practice_id)
+
+
+def completed_practice_from_row(practice_id: uuid.UUID, row, analisis: Analisis) -> Practica:
+    return Practica(
+        practice_id=practice_id,
+        user_id=row.user_id,
+        letra_plantilla=row.letra_plantilla,
+        url_imagen=row.url_imagen,
+        fecha_carga=row.fecha_carga,
+        estado_analisis=EstadoAnalisis.COMPLETADO,
+        analisis=analisis,
+    )
+
+
+def analysis_insert() -> Insert:
+    """INSERT del análisis; se ejecuta con una fila de `analysis_values` o con una lista (lotes)."""
+    return insert(AnalisisDB.__table__)
+
+
+def analysis_values(practice_id: uuid.UUID, analisis: Analisis) -> dict:
+    return {
+        "analisis_id": analisis.analisis_id,
+        "practice_id": practice_id,
+        "puntuacion_general": analisis.puntuacion_general,
+        "puntuacion_proporcion": analisis.puntuacion_proporcion,
+        "puntuacion_inclinacion": analisis.puntuacion_inclinacion,
+        "puntuacion_espaciado": analisis.puntuacion_espaciado,
+        "puntuacion_consistencia": analisis.puntuacion_consistencia,
+        "fortalezas": analisis.fortalezas,
+        "areas_mejora": analisis.areas_mejora,
+    }
+
+
+def practices_for_completion_query(practice_ids: Sequence[uuid.UUID]) -> Select:
+    """Bloquea las prácticas de un lote (FOR UPDATE) y lee lo necesario para decidir y completar cada una."""
+    return (
+        select(_practices.c.practice_id, _practices.c.estado_analisis, *_completion_columns)
+        .where(_practices.c.practice_id.in_(practice_ids))
+        .with_for_update()
+    )
+
+
+def complete_pending_practices(practice_ids: Sequence[uuid.UUID]) -> Update:
+    return (
+        update(_practices)
+        .where(_practices.c.practice_id.in_(practice_ids), _practices.c.estado_analisis == EstadoAnalisis.PENDIENTE)
+        .values(estado_analisis=EstadoAnalisis.COMPLETADO)
+    )
+
+
+def classify_completions(resultados: Sequence[Tuple[uuid.UUID, Analisis]], rows) -> List[PracticeCompletion]:
+    """
+    Resultado de cada elemento de un lote a partir de las filas bloqueadas, en el orden del lote.
+    Si una práctica aparece varias veces, solo la primera aparición la completa.
+    """
+    rows_by_id = {row.practice_id: row for row in rows}
+    completed_ids = set()
+    completions: List[PracticeCompletion] = []
+    for practice_id, analisis in resultados:
+        row = rows_by_id.get(practice_id)
+        if row is None:
+            completions.append(PracticeCompletion(CompletionOutcome.NOT_FOUND))
+        elif row.estado_analisis != EstadoAnalisis.PENDIENTE or practice_id in completed_ids:
+            completions.append(PracticeCompletion(CompletionOutcome.NOT_PENDING))
+        else:
+            completed_ids.add(practice_id)
+            completions.append(
+                PracticeCompletion(CompletionOutcome.COMPLETED, completed_practice_from_row(practice_id, row, analisis))
+            )
+    return completions
+
+
+# Columnas que necesita el repositorio para mantener el resumen por letra tras eliminar una práctica
+_deletion_columns = (_practices.c.letra_plantilla, _practices.c.estado_analisis)
+
+
+def delete_owned_practice(practice_id: uuid.UUID, user_id: uuid.UUID, returning: bool) -> Delete:
+    """
+    DELETE que solo afecta a la práctica si pertenece a `user_id`. Con `returning` (SQLite, no MySQL)
+    devuelve la letra y el estado de la fila eliminada. El análisis y el trabajo se eliminan en cascada.
+    """
+    stmt = delete(_practices).where(_practices.c.practice_id == practice_id, _practices.c.user_id == user_id)
+    return stmt.returning(*_deletion_columns) if returning else stmt
+
+
+def owned_practice_for_delete_query(practice_id: uuid.UUID, user_id: uuid.UUID) -> Select:
+    """Lectura por clave primaria con bloqueo de la práctica del usuario, para MySQL (sin DELETE ... RETURNING)."""
+    return (
+        select(*_deletion_columns)
+        .where(_practices.c.practice_id == practice_id, _practices.c.user_id == user_id)
+        .with_for_update()
+    )
+
+
+def user_practice_ids_query(user_id: uuid.UUID, limit: int) -> Select:
+    """Hasta `limit` IDs de prácticas del usuario, leídos por el índice (user_id, fecha_carga, practice_id)."""
+    return select(_practices.c.practice_id).where(_practices.c.user_id == user_id).limit(limit)
+
+
+def delete_practices(user_id: uuid.UUID, practice_ids: Sequence[uuid.UUID]) -> Delete:
+    return delete(_practices).where(_practices.c.practice_id.in_(practice_ids), _practices.c.user_id == user_id)
+
+
+def analysis_result_query(key: AnalysisResultKey) -> Select:
+    return select(AnalysisResultDB).where(
+        AnalysisResultDB.sha256 == key.sha256,
+        AnalysisResultDB.letra == key.letra,
+        AnalysisResultDB.model_version == key.model_version,
+    )
+
+
+def analysis_results_query(keys: Sequence[AnalysisResultKey]) -> Select:
+    """
+    Resultados de varias claves en una consulta por la clave primaria. Filtra cada columna con IN,
+    así que puede devolver combinaciones que no se pidieron: se descartan con `analysis_results_by_key`.
+    """
+    return select(AnalysisResultDB).where(
+        AnalysisResultDB.sha256.in_({key.sha256 for key in keys}),
+        AnalysisResultDB.letra.in_({key.letra for key in keys}),
+        AnalysisResultDB.model_version.in_({key.model_version for key in keys}),
+    )
+
+
+def analysis_results_by_key(
+    keys: Sequence[AnalysisResultKey], results_db: Sequence[AnalysisResultDB]
+) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+    wanted = set(keys)
+    found = {}
+    for result_db in results_db:
+        key = AnalysisResultKey(result_db.sha256, result_db.letra, result_db.model_version)
+        if key in wanted:
+            found[key] = analysis_result_to_dto(result_db)
+    return found
+
+
+def analysis_result_insert(dialect_name: str, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> Insert:
+    """INSERT que no falla si otro worker ya guardó el mismo resultado (mismo contenido, misma clave)."""
+    values = dict(
+        sha256=key.sha256,
+        letra=key.letra,
+        model_version=key.model_version,
+        fecha_creacion=datetime.datetime.utcnow(),
+        **resultado.model_dump(),
+    )
+    table = AnalysisResultDB.__table__
+    if dialect_name == "mysql":
+        stmt = mysql.insert(table).values(**values)
+        return stmt.on_duplicate_key_update(sha256=table.c.sha256)
+    if dialect_name == "sqlite":
+        return sqlite.insert(table).values(**values).on_conflict_do_nothing()
+    raise ValueError(f"Dialecto no soportado para la caché de resultados: '{dialect_name}'.")
+
+
+def analysis_result_to_dto(result_db: AnalysisResultDB) -> UpdateAnalysisRequestDTO:
+    return UpdateAnalysisRequestDTO(
+        puntuacion_general=result_db.puntuacion_general,
+        puntuacion_proporcion=result_db.puntuacion_proporcion,
+        puntuacion_inclinacion=result_db.puntuacion_inclinacion,
+        puntuacion_espaciado=result_db.puntuacion_espaciado,
+        puntuacion_consistencia=result_db.puntuacion_consistencia,
+        fortalezas=result_db.fortalezas,
+        areas_mejora=result_db.areas_mejora,
+    )
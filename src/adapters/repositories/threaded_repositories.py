@@ -0,0 +1,134 @@
+# src/adapters/repositories/threaded_repositories.py
+# Adaptadores que exponen los repositorios síncronos (PyMySQL) con la interfaz asíncrona.
+# Cada llamada se ejecuta en el threadpool de Starlette, así el event loop nunca se bloquea
+# aunque el servicio funcione con DB_ASYNC=false.
+import datetime
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from src.ports.repositories.practice_repository import IPracticeRepository
+from src.ports.repositories.analysis_job_repository import IAnalysisJobRepository
+from src.ports.repositories.analysis_result_repository import IAnalysisResultRepository
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.async_analysis_job_repository import IAsyncAnalysisJobRepository
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from src.ports.repositories.read_models import (
+    AnalysisResultKey, HistoryCursor, PracticeHistoryRow, LetterStatsRow, CompletionOutcome, PracticeCompletion,
+    DeletionOutcome, PracticeExportFilter, PracticeExportRow
+)
+from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+
+
+class ThreadedPracticeRepository(IAsyncPracticeRepository):
+
+    def __init__(self, repository: IPracticeRepository):
+        self.repository = repository
+
+    async def save(self, practica: Practica) -> None:
+        await run_in_threadpool(self.repository.save, practica)
+
+    async def save_many(self, practicas: List[Practica]) -> None:
+        await run_in_threadpool(self.repository.save_many, practicas)
+
+    async def save_with_job(self, practica: Practica, trabajo: Optional[TrabajoAnalisis]) -> None:
+        await run_in_threadpool(self.repository.save_with_job, practica, trabajo)
+
+    async def save_many_with_jobs(self, practicas: List[Practica], trabajos: List[TrabajoAnalisis]) -> None:
+        await run_in_threadpool(self.repository.save_many_with_jobs, practicas, trabajos)
+
+    async def find_by_id(self, practice_id: uuid.UUID) -> Optional[Practica]:
+        return await run_in_threadpool(self.repository.find_by_id, practice_id)
+
+    async def find_by_user_id(self, user_id: uuid.UUID) -> List[Practica]:
+        return await run_in_threadpool(self.repository.find_by_user_id, user_id)
+
+    async def find_history_page(
+        self, user_id: uuid.UUID, limit: int, cursor: Optional[HistoryCursor] = None
+    ) -> List[PracticeHistoryRow]:
+        return await run_in_threadpool(self.repository.find_history_page, user_id, limit, cursor)
+
+    async def stream_export(
+        self, user_id: uuid.UUID, filtro: PracticeExportFilter, batch_size: int
+    ) -> AsyncIterator[List[PracticeExportRow]]:
+        # Cada bloque se lee en el threadpool; si el cliente corta la descarga, se cierra el cursor
+        partitions = self.repository.stream_export(user_id, filtro, batch_size)
+        try:
+            async for partition in iterate_in_threadpool(partitions):
+                yield partition
+        finally:
+            await run_in_threadpool(partitions.close)
+
+    async def update(self, practica: Practica) -> None:
+        await run_in_threadpool(self.repository.update, practica)
+
+    async def complete_if_pending(self, practice_id: uuid.UUID, analisis: Analisis) -> PracticeCompletion:
+        return await run_in_threadpool(self.repository.complete_if_pending, practice_id, analisis)
+
+    async def complete_many_if_pending(
+        self, resultados: Sequence[Tuple[uuid.UUID, Analisis]]
+    ) -> List[PracticeCompletion]:
+        return await run_in_threadpool(self.repository.complete_many_if_pending, resultados)
+
+    async def fail_if_pending(self, practice_id: uuid.UUID) -> CompletionOutcome:
+        return await run_in_threadpool(self.repository.fail_if_pending, practice_id)
+
+    async def delete(self, practice_id: uuid.UUID, user_id: uuid.UUID) -> DeletionOutcome:
+        return await run_in_threadpool(self.repository.delete, practice_id, user_id)
+
+    async def purge_user_batch(self, user_id: uuid.UUID, limit: int) -> List[uuid.UUID]:
+        return await run_in_threadpool(self.repository.purge_user_batch, user_id, limit)
+
+    async def get_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        return await run_in_threadpool(self.repository.get_letter_stats, user_id)
+
+    async def rebuild_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        return await run_in_threadpool(self.repository.rebuild_letter_stats, user_id)
+
+    async def find_letter_stats_user_ids(self, after: Optional[uuid.UUID], limit: int) -> List[uuid.UUID]:
+        return await run_in_threadpool(self.repository.find_letter_stats_user_ids, after, limit)
+
+
+class ThreadedAnalysisJobRepository(IAsyncAnalysisJobRepository):
+
+    def __init__(self, repository: IAnalysisJobRepository):
+        self.repository = repository
+
+    async def enqueue(self, trabajo: TrabajoAnalisis) -> None:
+        await run_in_threadpool(self.repository.enqueue, trabajo)
+
+    async def enqueue_many(self, trabajos: List[TrabajoAnalisis]) -> None:
+        await run_in_threadpool(self.repository.enqueue_many, trabajos)
+
+    async def claim_next(self, visibility_timeout: int) -> Optional[TrabajoAnalisis]:
+        return await run_in_threadpool(self.repository.claim_next, visibility_timeout)
+
+    async def complete(self, job_id: uuid.UUID) -> None:
+        await run_in_threadpool(self.repository.complete, job_id)
+
+    async def reschedule(
+        self, job_id: uuid.UUID, error: str, disponible_en: datetime.datetime, consume_attempt: bool = True
+    ) -> None:
+        await run_in_threadpool(self.repository.reschedule, job_id, error, disponible_en, consume_attempt)
+
+    async def mark_failed(self, job_id: uuid.UUID, error: str) -> None:
+        await run_in_threadpool(self.repository.mark_failed, job_id, error)
+
+
+class ThreadedAnalysisResultRepository(IAsyncAnalysisResultRepository):
+
+    def __init__(self, repository: IAnalysisResultRepository):
+        self.repository = repository
+
+    async def find(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        return await run_in_threadpool(self.repository.find, key)
+
+    async def find_many(self, keys: Sequence[AnalysisResultKey]) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+        return await run_in_threadpool(self.repository.find_many, keys)
+
+    async def save(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        await run_in_threadpool(self.repository.save, key, resultado)
@@ -0,0 +1,31 @@
+# src/adapters/repositories/types.py
+import uuid
+from typing import Optional, Union
+
+from sqlalchemy import BINARY
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID almacenado como BINARY(16) en lugar de CHAR(36).
+
+    Reduce cada clave a 16 bytes (frente a hasta 144 con utf8mb4) y devuelve `uuid.UUID`
+    directamente, así los repositorios no convierten entre `str` y `UUID` en cada fila.
+    Acepta `uuid.UUID` o su representación en texto como parámetro.
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Union[uuid.UUID, str]], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[uuid.UUID]:
+        if value is None:
+            return None
+        return uuid.UUID(bytes=bytes(value))
@@ -0,0 +1,29 @@
+from src.config import settings
+from src.ports.storage.file_storage import IFileStorage
+from .local_file_storage import LocalFileStorage
+
+# Ruta en la que la API sirve las imágenes del almacenamiento local
+LOCAL_MEDIA_PATH = "/media"
+
+
+def build_file_storage() -> IFileStorage:
+    """Crea el almacenamiento de imágenes según `settings.file_storage_backend` ("local" o "s3")."""
+    backend = settings.file_storage_backend.lower()
+    if backend == "local":
+        return LocalFileStorage(
+            root_dir=settings.file_storage_local_dir,
+            base_url=settings.file_storage_public_base_url or LOCAL_MEDIA_PATH,
+        )
+    if backend == "s3":
+        if not settings.s3_bucket:
+            raise ValueError("FILE_STORAGE_BACKEND=s3 requiere S3_BUCKET.")
+        from .s3_file_storage import S3FileStorage
+        return S3FileStorage(
+            bucket=settings.s3_bucket,
+            public_base_url=settings.file_storage_public_base_url,
+            endpoint_url=settings.s3_endpoint_url,
+            region=settings.s3_region,
+        )
+    raise ValueError(f"FILE_STORAGE_BACKEND desconocido: '{settings.file_storage_backend}'.")
+
+__all__ = ["LocalFileStorage", "LOCAL_MEDIA_PATH", "build_file_storage"]
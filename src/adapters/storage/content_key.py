@@ -0,0 +1,17 @@
+# src/adapters/storage/content_key.py
+import mimetypes
+from typing import Optional
+
+# mimetypes devuelve '.jpe' para image/jpeg en algunas plataformas
+_PREFERRED_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+
+
+def content_key(sha256: str, content_type: Optional[str], prefix: str = "images/") -> str:
+    """
+    Clave del objeto: `images/ab/abcdef....png`. El subdirectorio con los dos primeros caracteres del hash
+    evita directorios con millones de entradas. La extensión permite servir el objeto con su tipo correcto.
+    """
+    extension = ""
+    if content_type:
+        extension = _PREFERRED_EXTENSIONS.get(content_type) or mimetypes.guess_extension(content_type) or ""
+    return f"{prefix}{sha256[:2]}/{sha256}{extension}"
@@ -0,0 +1,89 @@
+# src/adapters/storage/local_file_storage.py
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.ports.storage.file_storage import IFileStorage, StoredFile
+from .content_key import content_key
+
+
+def _write_chunk(file: BinaryIO, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    file.write(chunk)
+
+
+def _copy_file(source: BinaryIO, target: BinaryIO, hasher, chunk_size: int) -> int:
+    source.seek(0)
+    size = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return size
+        _write_chunk(target, hasher, chunk)
+        size += len(chunk)
+
+
+def _discard(tmp) -> None:
+    """Cierra el temporal y lo borra si no se llegó a publicar."""
+    if not tmp.closed:
+        tmp.close()
+    if os.path.exists(tmp.name):
+        os.remove(tmp.name)
+
+
+class LocalFileStorage(IFileStorage):
+    """
+    Guarda las imágenes en un directorio local; la API las sirve en `/media`.
+    Cada subida se escribe primero en un temporal y se publica con un rename atómico,
+    así nunca se sirve un archivo a medio escribir.
+    """
+
+    def __init__(self, root_dir: str, base_url: str):
+        self.root = Path(root_dir)
+        self.base_url = base_url.rstrip("/")
+        self._tmp_dir = self.root / ".tmp"
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    async def save_file(
+        self, file: BinaryIO, content_type: Optional[str] = None, chunk_size: int = 1024 * 1024
+    ) -> StoredFile:
+        hasher = hashlib.sha256()
+        tmp = await run_in_threadpool(tempfile.NamedTemporaryFile, dir=self._tmp_dir, delete=False)
+        try:
+            # La copia completa va en una sola llamada al threadpool, no en una por trozo
+            size = await run_in_threadpool(_copy_file, file, tmp, hasher, chunk_size)
+            await run_in_threadpool(tmp.close)
+
+            key = content_key(hasher.hexdigest(), content_type)
+            await run_in_threadpool(self._publish, tmp.name, key)
+        finally:
+            await run_in_threadpool(_discard, tmp)
+
+        return StoredFile(key=key, sha256=hasher.hexdigest(), size=size, url=self.url_for(key))
+
+    async def read(self, key: str) -> bytes:
+        path = self._path(key)
+        if not path.is_file():
+            raise FileNotFoundError(f"No existe la imagen '{key}'.")
+        return await run_in_threadpool(path.read_bytes)
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def _publish(self, tmp_path: str, key: str) -> None:
+        target = self._path(key)
+        if target.exists():
+            # Mismo contenido ya guardado: el temporal se descarta en save_file()
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise FileNotFoundError(f"Clave de imagen no válida: '{key}'.")
+        return path
@@ -0,0 +1,98 @@
+# src/adapters/storage/s3_file_storage.py
+# Almacenamiento en S3 o en cualquier servicio compatible (MinIO, LocalStack) mediante `endpoint_url`.
+# Requiere el paquete opcional `boto3`.
+import hashlib
+from typing import BinaryIO, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.ports.storage.file_storage import IFileStorage, StoredFile
+from .content_key import content_key
+
+# Los objetos no cambian nunca (la clave es el hash del contenido)
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _hash_file(file: BinaryIO, chunk_size: int):
+    file.seek(0)
+    hasher = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return hasher.hexdigest(), size
+        hasher.update(chunk)
+        size += len(chunk)
+
+
+class S3FileStorage(IFileStorage):
+    """
+    La clave depende del hash, que solo se conoce al terminar de leer la subida. `save_file` recibe el archivo
+    ya completo (el temporal de la subida), calcula el hash en una pasada y sube ese mismo archivo con
+    `upload_fileobj`, que usa multipart para archivos grandes. Si el objeto ya existe no se sube.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        public_base_url: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+    ):
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError as e:
+            raise ImportError(
+                "FILE_STORAGE_BACKEND=s3 requiere el paquete 'boto3' (pip install boto3)."
+            ) from e
+
+        self._client_error = ClientError
+        self._s3 = boto3.client("s3", endpoint_url=endpoint_url, region_name=region)
+        self.bucket = bucket
+        if public_base_url:
+            self.base_url = public_base_url.rstrip("/")
+        elif endpoint_url:
+            self.base_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        else:
+            self.base_url = f"https://{bucket}.s3.amazonaws.com"
+
+    async def save_file(
+        self, file: BinaryIO, content_type: Optional[str] = None, chunk_size: int = 1024 * 1024
+    ) -> StoredFile:
+        # El archivo ya está completo: se calcula el hash en una pasada y se sube ese mismo archivo,
+        # sin volcarlo a otro temporal
+        sha256, size = await run_in_threadpool(_hash_file, file, chunk_size)
+        key = content_key(sha256, content_type)
+        await self._upload_if_missing(file, key, content_type)
+        return StoredFile(key=key, sha256=sha256, size=size, url=self.url_for(key))
+
+    async def _upload_if_missing(self, file: BinaryIO, key: str, content_type: Optional[str]) -> None:
+        if await run_in_threadpool(self._exists, key):
+            return
+        file.seek(0)
+        extra_args = {"CacheControl": _IMMUTABLE_CACHE_CONTROL}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        await run_in_threadpool(self._s3.upload_fileobj, file, self.bucket, key, ExtraArgs=extra_args)
+
+    async def read(self, key: str) -> bytes:
+        try:
+            response = await run_in_threadpool(self._s3.get_object, Bucket=self.bucket, Key=key)
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"No existe la imagen '{key}'.") from e
+            raise
+        return await run_in_threadpool(response["Body"].read)
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self._s3.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
@@ -0,0 +1,4 @@
+from .analysis_worker import AnalysisWorkerPool
+
+__all__ = ["AnalysisWorkerPool"]
+
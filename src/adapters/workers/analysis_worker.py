@@ -0,0 +1,226 @@
+# src/adapters/workers/analysis_worker.py
+import asyncio
+import datetime
+import hashlib
+import logging
+from typing import AsyncContextManager, Callable, List, Optional
+
+from src.adapters.clients import (
+    AnalysisServiceClient,
+    AnalysisServiceError,
+    AnalysisServiceUnavailableError,
+    build_analysis_request_dto,
+)
+from src.adapters.imaging import ImagePreprocessor
+from src.adapters.observability import log_context
+from src.adapters.repositories.providers import Repositories
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.ports.storage.file_storage import IFileStorage
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+from src.use_cases.fail_practice_analysis import FailPracticeAnalysisUseCase
+from src.use_cases.update_practice_analysis import UpdatePracticeAnalysisUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisWorkerPool:
+    """
+    Pool de workers que consume la tabla `analysis_jobs` y envía cada práctica al
+    servicio de análisis. Los trabajos viven en la base de datos, así que los que
+    estaban pendientes o a medias se retoman tras un reinicio.
+    """
+
+    def __init__(
+        self,
+        client: AnalysisServiceClient,
+        repositories_factory: Callable[[], AsyncContextManager[Repositories]],
+        file_storage: IFileStorage,
+        workers: int = 4,
+        max_concurrency: int = 4,
+        poll_interval: float = 2.0,
+        max_attempts: int = 3,
+        retry_backoff: float = 5.0,
+        visibility_timeout: int = 120,
+        model_version: str = "1",
+        preprocessor: Optional[ImagePreprocessor] = None,
+    ) -> None:
+        self.client = client
+        self.repositories_factory = repositories_factory
+        self.file_storage = file_storage
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+        self.visibility_timeout = visibility_timeout
+        self.model_version = model_version
+        self.preprocessor = preprocessor
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._run(index), name=f"analysis-worker-{index}")
+            for index in range(self.workers)
+        ]
+        logger.info("%d workers de análisis iniciados", self.workers)
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        # Los trabajos interrumpidos quedan "en proceso" y se retoman al vencer su visibility timeout
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Workers de análisis detenidos")
+
+    def notify(self) -> None:
+        """Despierta a los workers sin esperar al siguiente sondeo (p. ej. tras encolar un trabajo)."""
+        self._wakeup.set()
+
+    # --- Bucle de los workers ---
+
+    async def _run(self, index: int) -> None:
+        while not self._stopping.is_set():
+            # Con el circuito abierto no se reservan trabajos: solo fallarían y volverían a la cola
+            retry_after = self.client.retry_after()
+            if retry_after > 0:
+                await self._sleep_unless_stopping(retry_after)
+                continue
+
+            # El hueco de concurrencia se ocupa antes de reservar: un trabajo ya reservado no debe esperar
+            # al semáforo mientras corre su visibility timeout, o otro worker lo volvería a reservar
+            async with self._semaphore:
+                try:
+                    trabajo = await self._claim_next()
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception("Error al reservar trabajo", extra={"worker": index})
+                    trabajo = None
+
+                if trabajo is not None:
+                    # Los logs del trabajo llevan el practice_id de la práctica, igual que los de la petición que la creó
+                    with log_context(request_id=f"job-{trabajo.job_id}", practice_id=trabajo.practice_id):
+                        await self._process(trabajo)
+
+            # La espera de trabajo nuevo se hace fuera del semáforo, para no bloquear a los demás workers
+            if trabajo is None:
+                await self._wait_for_work()
+
+    async def _wait_for_work(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _sleep_unless_stopping(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _process(self, trabajo: TrabajoAnalisis) -> None:
+        logger.info("Analizando práctica", extra={"intento": trabajo.intentos, "letra": trabajo.letra.value, "sampled": True})
+        try:
+            image_bytes = await self._load_image(trabajo)
+            result_key = AnalysisResultKey(hashlib.sha256(image_bytes).hexdigest(), trabajo.letra, self.model_version)
+
+            # Una imagen idéntica puede haberse analizado mientras este trabajo esperaba en la cola
+            analysis_dto = await self._find_cached_result(result_key)
+            if analysis_dto is not None:
+                await self._apply_result(trabajo, analysis_dto)
+                logger.info("Práctica completada con un resultado reutilizado", extra={"sampled": True})
+                return
+
+            # La clave del resultado es el hash de la imagen subida; al servicio se envía la preprocesada
+            filename, content_type = trabajo.nombre_archivo, trabajo.content_type
+            if self.preprocessor is not None:
+                image_bytes, filename, content_type = await self.preprocessor.prepare(image_bytes, filename, content_type)
+
+            analysis_payload = await self.client.analyze_letter(
+                letter_char=trabajo.letra.value,
+                image_bytes=image_bytes,
+                filename=filename,
+                content_type=content_type,
+            )
+            analysis_dto = build_analysis_request_dto(analysis_payload)
+            await self._apply_result(trabajo, analysis_dto, result_key)
+            logger.info("Práctica actualizada con resultados del análisis", extra={"sampled": True})
+        except AnalysisServiceUnavailableError as exc:
+            await self._postpone(trabajo, str(exc), exc.retry_after)
+        except AnalysisServiceError as exc:
+            await self._handle_failure(trabajo, str(exc))
+        except Exception as exc:  # noqa: BLE001
+            await self._handle_failure(trabajo, f"{type(exc).__name__}: {exc}")
+
+    async def _load_image(self, trabajo: TrabajoAnalisis) -> bytes:
+        # Los trabajos encolados por versiones anteriores traen la imagen en la propia fila
+        if trabajo.imagen is not None:
+            return trabajo.imagen
+        return await self.file_storage.read(trabajo.imagen_key)
+
+    # --- Operaciones de base de datos ---
+
+    async def _claim_next(self) -> Optional[TrabajoAnalisis]:
+        async with self.repositories_factory() as repos:
+            return await repos.jobs.claim_next(self.visibility_timeout)
+
+    async def _find_cached_result(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        async with self.repositories_factory() as repos:
+            return await repos.analysis_results.find(key)
+
+    async def _apply_result(
+        self,
+        trabajo: TrabajoAnalisis,
+        analysis_dto: UpdateAnalysisRequestDTO,
+        result_key: Optional[AnalysisResultKey] = None,
+    ) -> None:
+        async with self.repositories_factory() as repos:
+            # Resultado nuevo: se guarda para las próximas subidas de la misma imagen
+            if result_key is not None:
+                await repos.analysis_results.save(result_key, analysis_dto)
+            try:
+                await UpdatePracticeAnalysisUseCase(repos.practices).execute(
+                    practice_id=trabajo.practice_id, analysis_data=analysis_dto
+                )
+            except FileNotFoundError:
+                logger.info("La práctica ya no existe; se descarta el resultado")
+            except ValueError:
+                logger.info("La práctica ya estaba completada")
+            await repos.jobs.complete(trabajo.job_id)
+
+    async def _postpone(self, trabajo: TrabajoAnalisis, error: str, retry_after: Optional[float]) -> None:
+        # La petición no llegó a enviarse (circuito abierto o bulkhead lleno): no gasta intento
+        delay = max(retry_after or 0.0, self.poll_interval)
+        disponible_en = datetime.datetime.utcnow() + datetime.timedelta(seconds=delay)
+        async with self.repositories_factory() as repos:
+            await repos.jobs.reschedule(trabajo.job_id, error, disponible_en, consume_attempt=False)
+        logger.warning("Práctica aplazada %.0fs sin gastar intento: %s", delay, error)
+
+    async def _handle_failure(self, trabajo: TrabajoAnalisis, error: str) -> None:
+        async with self.repositories_factory() as repos:
+            if trabajo.intentos < self.max_attempts:
+                # Backoff exponencial: 5 s, 10 s, 20 s...
+                delay = self.retry_backoff * (2 ** (trabajo.intentos - 1))
+                disponible_en = datetime.datetime.utcnow() + datetime.timedelta(seconds=delay)
+                await repos.jobs.reschedule(trabajo.job_id, error, disponible_en)
+                logger.warning(
+                    "Fallo al analizar la práctica, reintento en %.0fs: %s", delay, error, extra={"intento": trabajo.intentos}
+                )
+                return
+
+            await repos.jobs.mark_failed(trabajo.job_id, error)
+            try:
+                await FailPracticeAnalysisUseCase(repos.practices).execute(trabajo.practice_id)
+            except FileNotFoundError:
+                logger.info("La práctica ya no existe; no se marca como ERROR")
+                return
+            except ValueError:
+                # El resultado llegó por otra vía (p. ej. PUT /practices/{id}/analysis) antes de rendirse
+                logger.info("La práctica ya no estaba pendiente; se conserva su estado")
+                return
+            logger.error("Práctica marcada como ERROR tras %d intentos: %s", trabajo.intentos, error)
@@ -1,4 +1,5 @@
 # src/config.py
+import hashlib
 from typing import Optional
 from pydantic_settings import BaseSettings
 from urllib.parse import quote_plus
@@ -11,22 +12,182 @@ class Settings(BaseSettings):
     db_password: str
     db_name: str
     db_port: int
+    # Usa SQLAlchemy AsyncSession + aiomysql en lugar de PyMySQL en el threadpool
+    db_async: bool = False
+    # URLs completas opcionales; tienen prioridad sobre los campos anteriores
+    # (p. ej. DATABASE_URL=sqlite:///./trace.db y ASYNC_DATABASE_URL=sqlite+aiosqlite:///./trace.db para pruebas)
+    database_url: Optional[str] = None
+    async_database_url: Optional[str] = None
+
+    # Logging estructurado (una línea JSON por evento, escrita desde un hilo aparte)
+    log_level: str = "INFO"
+    log_format: str = "json"            # json o text (legible, para desarrollo local)
+    # Niveles por logger, p. ej. "src.adapters.clients=DEBUG,sqlalchemy.engine=WARNING"
+    log_levels: Optional[str] = None
+    # Fracción de peticiones cuyos eventos INFO de alto volumen se registran (los WARNING/ERROR siempre)
+    log_sample_rate: float = 1.0
 
     # JWT Authentication
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # Caché de tokens ya verificados; una entrada nunca dura más que el `exp` del token (0 = desactivada)
+    jwt_cache_max_entries: int = 10000
+    jwt_cache_ttl: float = 300.0
+
+    # Autenticación de servicio a servicio (endpoints internos que llama analysis-service).
+    # Uno o varios tokens separados por comas, para poder rotarlos sin cortar el servicio.
+    # Sin ningún token configurado, esos endpoints responden 503.
+    service_auth_tokens: Optional[str] = None
 
     # External Services
+    # Una URL o varias réplicas separadas por comas (el cliente reparte la carga entre ellas)
     analysis_service_base_url: Optional[str] = None
     analysis_service_timeout: int = 30
+    # Balanceo entre réplicas: "least_outstanding" (menos peticiones en curso) o "ewma" (menor latencia)
+    analysis_lb_strategy: str = "least_outstanding"
+
+    # Pool HTTP compartido hacia analysis-service
+    analysis_http_max_connections: int = 100
+    analysis_http_max_keepalive_connections: int = 20
+    analysis_http_keepalive_expiry: float = 30.0
+    analysis_http2: bool = False
+
+    # Resiliencia del cliente de analysis-service
+    # Bulkhead: llamadas simultáneas y segundos que una llamada espera hueco antes de fallar
+    analysis_client_max_concurrency: int = 16
+    analysis_client_queue_timeout: float = 5.0
+    # Reintentos inmediatos (con jitter) solo para fallos que es seguro repetir
+    analysis_client_max_retries: int = 2
+    analysis_client_retry_base_delay: float = 0.2
+    analysis_client_retry_max_delay: float = 2.0
+    # Circuit breaker por réplica: fallos seguidos que la expulsan y segundos fuera antes de probar de nuevo
+    analysis_breaker_failure_threshold: int = 5
+    analysis_breaker_recovery_timeout: float = 30.0
+    analysis_breaker_half_open_max_calls: int = 1
+
+    # Historial paginado
+    history_page_size_default: int = 50
+    history_page_size_max: int = 200
+    # Exportación del historial: filas por bloque leído del cursor del servidor y enviado al cliente
+    export_batch_size: int = 500
+
+    # Caché de GET /practices/{id}: "memory" (LRU por proceso), "redis" (compartida) o "none"
+    practice_cache_backend: str = "memory"
+    practice_cache_max_entries: int = 10000
+    practice_cache_redis_url: Optional[str] = None
+    # Segundos para prácticas PENDIENTE; corto porque con varios procesos otro puede completarla
+    practice_cache_ttl: float = 2.0
+    # Segundos para prácticas en estado final (0 = sin expiración; solo se aplica tal cual con redis)
+    practice_cache_final_ttl: float = 3600.0
+    # Tope de ambos TTL con "memory": cada proceso invalida solo su copia, así que una práctica eliminada
+    # o purgada desde otro proceso se seguiría sirviendo hasta que caduque
+    practice_cache_memory_max_ttl: float = 5.0
+
+    # Caché de resultados de análisis por (hash de la imagen, letra, versión del modelo).
+    # Cambiar la versión al actualizar el modelo de analysis-service invalida los resultados anteriores.
+    analysis_model_version: str = "1"
+    analysis_result_cache_max_entries: int = 10000
+
+    # Preprocesado de la imagen antes del análisis (requiere `pip install Pillow`): orientación EXIF,
+    # escala de grises, recorte al trazo, reducción a IMAGE_PREPROCESS_MAX_SIZE y recodificación.
+    # Se ejecuta en un pool de IMAGE_PREPROCESS_WORKERS procesos
+    image_preprocessing_enabled: bool = False
+    image_preprocess_max_size: int = 512
+    # PNG, WEBP o JPEG; la calidad solo se aplica a WEBP y JPEG
+    image_preprocess_format: str = "PNG"
+    image_preprocess_quality: int = 85
+    image_preprocess_crop: bool = True
+    image_preprocess_crop_margin: float = 0.1
+    image_preprocess_workers: int = 2
+    # Imágenes en el pool o esperando hueco a la vez (por defecto, el doble de procesos)
+    image_preprocess_max_pending: Optional[int] = None
+
+    # Almacenamiento de imágenes: "local" (servido en /media) o "s3" (S3, MinIO, LocalStack...)
+    file_storage_backend: str = "local"
+    file_storage_local_dir: str = "./media"
+    # URL pública de los objetos; por defecto /media en local y la URL del bucket en S3
+    file_storage_public_base_url: Optional[str] = None
+    # Tamaño de los trozos con los que se copia la subida al almacenamiento
+    file_storage_chunk_size: int = 1024 * 1024
+    s3_bucket: Optional[str] = None
+    s3_endpoint_url: Optional[str] = None
+    s3_region: Optional[str] = None
+
+    # Serialización de las respuestas de lectura (historial y detalle): "pydantic" (pydantic-core),
+    # "orjson" (requiere el paquete opcional orjson) o "standard" (el codificador por defecto de FastAPI)
+    json_renderer: str = "pydantic"
+    # Compresión gzip de las respuestas, si el cliente la acepta (Accept-Encoding) y superan el tamaño mínimo
+    response_gzip_enabled: bool = True
+    response_gzip_minimum_size: int = 1024
+    response_gzip_level: int = 6
+
+    # Límites de las subidas, en bytes. El del cuerpo se comprueba mientras se recibe (antes de tocar
+    # el almacenamiento o la base de datos); el de cada imagen, al validarla
+    upload_max_bytes: int = 10 * 1024 * 1024
+    upload_batch_max_bytes: int = 100 * 1024 * 1024
+
+    # Subida por lotes (una hoja completa de abecedario son 62 caracteres)
+    batch_max_items: int = 100
+    # Resultados de análisis por petición en la ingesta por lotes de analysis-service
+    analysis_ingest_max_items: int = 500
+    # Purgado del historial de un usuario (baja de la cuenta): prácticas eliminadas por transacción
+    # y pausa entre lotes, en segundos, para no acaparar los bloqueos ni la replicación
+    purge_batch_size: int = 1000
+    purge_batch_pause: float = 0.1
+
+    # Analysis Job Queue
+    analysis_workers: int = 4
+    analysis_max_concurrency: int = 4
+    analysis_job_poll_interval: float = 2.0
+    analysis_job_max_attempts: int = 3
+    analysis_job_retry_backoff: float = 5.0
+    # Debe ser mayor que analysis_service_timeout para no reprocesar trabajos en curso
+    analysis_job_visibility_timeout: int = 120
+
+    def get_analysis_result_version(self) -> str:
+        """
+        Versión con la que se guardan y reutilizan los resultados de análisis. Con preprocesado incluye
+        un resumen de sus parámetros: cambiarlos cambia lo que ve el modelo y no se reutilizan resultados
+        calculados sobre otra imagen.
+        """
+        if not self.image_preprocessing_enabled:
+            return self.analysis_model_version
+        params = "|".join(
+            str(value) for value in (
+                self.image_preprocess_max_size,
+                self.image_preprocess_format.upper(),
+                self.image_preprocess_quality,
+                self.image_preprocess_crop,
+                self.image_preprocess_crop_margin,
+            )
+        )
+        return f"{self.analysis_model_version}+pp{hashlib.sha256(params.encode()).hexdigest()[:8]}"
+
+    def get_practice_cache_ttl(self, final: bool) -> Optional[float]:
+        """Segundos que se guarda una práctica en la caché (None = sin expiración), según su estado."""
+        ttl = (self.practice_cache_final_ttl or None) if final else self.practice_cache_ttl
+        if self.practice_cache_backend.lower() == "memory":
+            return min(ttl if ttl is not None else float("inf"), self.practice_cache_memory_max_ttl)
+        return ttl
 
     def get_db_url(self) -> str:
         """Genera la URL de conexión para SQLAlchemy."""
+        if self.database_url:
+            return self.database_url
+        return self._build_mysql_url("pymysql")
+
+    def get_async_db_url(self) -> str:
+        """Genera la URL de conexión para el motor asíncrono de SQLAlchemy."""
+        if self.async_database_url:
+            return self.async_database_url
+        return self._build_mysql_url("aiomysql")
+
+    def _build_mysql_url(self, driver: str) -> str:
         # Codificamos usuario y contraseña para manejar caracteres especiales
         encoded_user = quote_plus(self.db_user)
         encoded_password = quote_plus(self.db_password)
-        return f"mysql+pymysql://{encoded_user}:{encoded_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        return f"mysql+{driver}://{encoded_user}:{encoded_password}@{self.db_host}:{self.db_port}/{self.db_name}"
     
     class Config:
         env_file = ".env"
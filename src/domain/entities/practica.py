@@ -18,4 +18,9 @@ class Practica(BaseModel):
         if self.estado_analisis != EstadoAnalisis.PENDIENTE:
             raise ValueError("Solo se puede completar una práctica pendiente.")
         self.analisis = analisis_resultado
-        self.estado_analisis = EstadoAnalisis.COMPLETADO
\ No newline at end of file
+        self.estado_analisis = EstadoAnalisis.COMPLETADO
+
+    def marcar_como_fallida(self):
+        if self.estado_analisis != EstadoAnalisis.PENDIENTE:
+            raise ValueError("Solo se puede marcar como fallida una práctica pendiente.")
+        self.estado_analisis = EstadoAnalisis.ERROR
\ No newline at end of file
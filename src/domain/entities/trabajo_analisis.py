@@ -0,0 +1,22 @@
+import uuid
+import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+from ..value_objects.enums import EstadoTrabajo, LetraPermitida
+
+class TrabajoAnalisis(BaseModel):
+    """Trabajo pendiente de enviar una práctica al servicio de análisis."""
+    job_id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    practice_id: uuid.UUID
+    letra: LetraPermitida
+    # Clave de la imagen en el almacenamiento de archivos
+    imagen_key: Optional[str] = None
+    # Solo trabajos encolados por versiones anteriores, que guardaban la imagen en la propia fila
+    imagen: Optional[bytes] = None
+    nombre_archivo: Optional[str] = None
+    content_type: Optional[str] = None
+    estado: EstadoTrabajo = EstadoTrabajo.PENDIENTE
+    intentos: int = 0
+    ultimo_error: Optional[str] = None
+    disponible_en: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    fecha_creacion: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
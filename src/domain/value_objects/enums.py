@@ -9,6 +9,13 @@ class EstadoAnalisis(str, Enum):
     ERROR = "error"
 
 
+# Estados de un trabajo en la cola de análisis
+class EstadoTrabajo(str, Enum):
+    PENDIENTE = "pendiente"
+    EN_PROCESO = "en_proceso"
+    ERROR = "error"
+
+
 # Genera una lista de todos los caracteres permitidos
 caracteres_permitidos = list(string.ascii_lowercase) + list(string.ascii_uppercase) + list(string.digits)
 
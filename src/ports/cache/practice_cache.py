@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+import uuid
+from src.domain.entities.practica import Practica
+
+class IPracticeCache(ABC):
+    """Caché de prácticas por ID, delante de `IAsyncPracticeRepository.find_by_id`."""
+
+    @abstractmethod
+    async def get(self, practice_id: uuid.UUID) -> Optional[Practica]:
+        pass
+
+    @abstractmethod
+    async def set(self, practica: Practica, ttl: Optional[float]) -> None:
+        """Guarda la práctica durante `ttl` segundos (`None` = sin expiración)."""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, practice_id: uuid.UUID) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        """Libera las conexiones del backend, si las hay."""
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+import datetime
+import uuid
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+
+class IAnalysisJobRepository(ABC):
+    @abstractmethod
+    def enqueue(self, trabajo: TrabajoAnalisis) -> None:
+        pass
+
+    @abstractmethod
+    def enqueue_many(self, trabajos: List[TrabajoAnalisis]) -> None:
+        pass
+
+    @abstractmethod
+    def claim_next(self, visibility_timeout: int) -> Optional[TrabajoAnalisis]:
+        """Reserva el siguiente trabajo disponible (o uno abandonado) y lo marca en proceso."""
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: uuid.UUID) -> None:
+        pass
+
+    @abstractmethod
+    def reschedule(
+        self, job_id: uuid.UUID, error: str, disponible_en: datetime.datetime, consume_attempt: bool = True
+    ) -> None:
+        """
+        Devuelve el trabajo a la cola hasta `disponible_en`. Con `consume_attempt=False` el intento
+        en curso no cuenta (p. ej. si ni siquiera se llegó a llamar al servicio).
+        """
+        pass
+
+    @abstractmethod
+    def mark_failed(self, job_id: uuid.UUID, error: str) -> None:
+        pass
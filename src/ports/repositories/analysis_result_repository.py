@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+from .read_models import AnalysisResultKey
+
+class IAnalysisResultRepository(ABC):
+    """Resultados del servicio de análisis ya calculados, para no repetir la llamada con la misma imagen."""
+
+    @abstractmethod
+    def find(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        pass
+
+    @abstractmethod
+    def find_many(self, keys: Sequence[AnalysisResultKey]) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+        """Busca varias claves en una sola consulta; el diccionario solo incluye las que tienen resultado."""
+        pass
+
+    @abstractmethod
+    def save(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        """Guarda el resultado; si ya existe uno para la misma clave, se conserva el existente."""
+        pass
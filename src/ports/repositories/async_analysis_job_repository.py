@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+import datetime
+import uuid
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+
+class IAsyncAnalysisJobRepository(ABC):
+    """Versión asíncrona de `IAnalysisJobRepository`."""
+
+    @abstractmethod
+    async def enqueue(self, trabajo: TrabajoAnalisis) -> None:
+        pass
+
+    @abstractmethod
+    async def enqueue_many(self, trabajos: List[TrabajoAnalisis]) -> None:
+        pass
+
+    @abstractmethod
+    async def claim_next(self, visibility_timeout: int) -> Optional[TrabajoAnalisis]:
+        """Reserva el siguiente trabajo disponible (o uno abandonado) y lo marca en proceso."""
+        pass
+
+    @abstractmethod
+    async def complete(self, job_id: uuid.UUID) -> None:
+        pass
+
+    @abstractmethod
+    async def reschedule(
+        self, job_id: uuid.UUID, error: str, disponible_en: datetime.datetime, consume_attempt: bool = True
+    ) -> None:
+        """
+        Devuelve el trabajo a la cola hasta `disponible_en`. Con `consume_attempt=False` el intento
+        en curso no cuenta (p. ej. si ni siquiera se llegó a llamar al servicio).
+        """
+        pass
+
+    @abstractmethod
+    async def mark_failed(self, job_id: uuid.UUID, error: str) -> None:
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+from .read_models import AnalysisResultKey
+
+class IAsyncAnalysisResultRepository(ABC):
+    """Versión asíncrona de `IAnalysisResultRepository`."""
+
+    @abstractmethod
+    async def find(self, key: AnalysisResultKey) -> Optional[UpdateAnalysisRequestDTO]:
+        pass
+
+    @abstractmethod
+    async def find_many(self, keys: Sequence[AnalysisResultKey]) -> Dict[AnalysisResultKey, UpdateAnalysisRequestDTO]:
+        """Busca varias claves en una sola consulta; el diccionario solo incluye las que tienen resultado."""
+        pass
+
+    @abstractmethod
+    async def save(self, key: AnalysisResultKey, resultado: UpdateAnalysisRequestDTO) -> None:
+        """Guarda el resultado; si ya existe uno para la misma clave, se conserva el existente."""
+        pass
@@ -1,13 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterator, Optional, List, Sequence, Tuple
 import uuid
 from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from .read_models import (
+    HistoryCursor, PracticeHistoryRow, LetterStatsRow, CompletionOutcome, PracticeCompletion, DeletionOutcome,
+    PracticeExportFilter, PracticeExportRow
+)
 
 class IPracticeRepository(ABC):
     @abstractmethod
     def save(self, practica: Practica) -> None:
         pass
 
+    @abstractmethod
+    def save_many(self, practicas: List[Practica]) -> None:
+        """Guarda varias prácticas en una única transacción."""
+        pass
+
+    @abstractmethod
+    def save_with_job(self, practica: Practica, trabajo: Optional[TrabajoAnalisis]) -> None:
+        """
+        Guarda una práctica nueva y su trabajo de análisis en una única transacción, así nunca queda
+        una práctica PENDIENTE sin trabajo. Si la práctica ya llega completada (resultado reutilizado),
+        `trabajo` es None y su análisis se guarda y se suma al resumen por letra en la misma transacción.
+        """
+        pass
+
+    @abstractmethod
+    def save_many_with_jobs(self, practicas: List[Practica], trabajos: List[TrabajoAnalisis]) -> None:
+        """Versión por lotes de `save_with_job`: todas las prácticas y todos los trabajos en una transacción."""
+        pass
+
     @abstractmethod
     def find_by_id(self, practice_id: uuid.UUID) -> Optional[Practica]:
         pass
@@ -16,6 +41,92 @@ class IPracticeRepository(ABC):
     def find_by_user_id(self, user_id: uuid.UUID) -> List[Practica]:
         pass
     
+    @abstractmethod
+    def find_history_page(
+        self, user_id: uuid.UUID, limit: int, cursor: Optional[HistoryCursor] = None
+    ) -> List[PracticeHistoryRow]:
+        """
+        Devuelve hasta `limit` filas del historial ordenadas por (fecha_carga, practice_id) descendente,
+        empezando después de `cursor`. Solo lee las columnas que necesita el historial.
+        """
+        pass
+
+    @abstractmethod
+    def stream_export(
+        self, user_id: uuid.UUID, filtro: PracticeExportFilter, batch_size: int
+    ) -> Iterator[List[PracticeExportRow]]:
+        """
+        Recorre el historial completo del usuario, de la práctica más reciente a la más antigua, con un
+        cursor del lado del servidor: entrega bloques de hasta `batch_size` filas a medida que llegan,
+        sin cargar el resultado entero en memoria. Es un iterador que mantiene ocupada la
+        conexión mientras se consume.
+        """
+        pass
+
     @abstractmethod
     def update(self, practica: Practica) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def complete_if_pending(self, practice_id: uuid.UUID, analisis: Analisis) -> PracticeCompletion:
+        """
+        Completa la práctica con `analisis` solo si sigue PENDIENTE, en una única transacción que
+        también guarda el análisis y lo suma al resumen por letra. Si dos escrituras compiten
+        (p. ej. un reintento del servicio de IA), solo una obtiene COMPLETED.
+        """
+        pass
+
+    @abstractmethod
+    def complete_many_if_pending(
+        self, resultados: Sequence[Tuple[uuid.UUID, Analisis]]
+    ) -> List[PracticeCompletion]:
+        """
+        Versión por lotes de `complete_if_pending`: aplica todos los resultados en una transacción
+        y devuelve el resultado de cada elemento en el mismo orden.
+        """
+        pass
+
+    @abstractmethod
+    def fail_if_pending(self, practice_id: uuid.UUID) -> CompletionOutcome:
+        """
+        Marca la práctica como ERROR solo si sigue PENDIENTE, con la comprobación en la propia sentencia
+        UPDATE. Si el resultado del análisis llega a la vez, solo una de las dos escrituras obtiene COMPLETED.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, practice_id: uuid.UUID, user_id: uuid.UUID) -> DeletionOutcome:
+        """
+        Elimina la práctica solo si pertenece a `user_id`, con la comprobación en la propia sentencia
+        DELETE. Su análisis y su trabajo pendiente se eliminan en cascada.
+        """
+        pass
+
+    @abstractmethod
+    def purge_user_batch(self, user_id: uuid.UUID, limit: int) -> List[uuid.UUID]:
+        """
+        Elimina hasta `limit` prácticas del usuario en una transacción corta y devuelve sus IDs.
+        Cuando devuelve menos de `limit` ya no le quedan prácticas y también se elimina su resumen por letra.
+        """
+        pass
+
+    @abstractmethod
+    def get_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        """Resumen por letra de los análisis completados del usuario, mantenido por update() y delete()."""
+        pass
+
+    @abstractmethod
+    def rebuild_letter_stats(self, user_id: uuid.UUID) -> List[LetterStatsRow]:
+        """
+        Recalcula desde cero, a partir de `analyses`, el resumen por letra del usuario y lo devuelve.
+        Es idempotente: repetirlo sin cambios en las prácticas deja el mismo resumen.
+        """
+        pass
+
+    @abstractmethod
+    def find_letter_stats_user_ids(self, after: Optional[uuid.UUID], limit: int) -> List[uuid.UUID]:
+        """
+        Hasta `limit` usuarios con prácticas completadas o con resumen por letra, en orden de ID y
+        posteriores a `after` (el último de la página anterior; None para empezar).
+        """
+        pass
@@ -0,0 +1,91 @@
+# src/ports/repositories/read_models.py
+# Proyecciones de solo lectura que devuelven los repositorios cuando una consulta
+# no necesita hidratar las entidades completas del dominio.
+import uuid
+import datetime
+from enum import Enum
+from typing import NamedTuple, Optional
+from src.domain.entities.practica import Practica
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+
+
+class HistoryCursor(NamedTuple):
+    """Posición (fecha_carga, practice_id) de la última fila de una página del historial."""
+    fecha_carga: datetime.datetime
+    practice_id: uuid.UUID
+
+
+class PracticeHistoryRow(NamedTuple):
+    practice_id: uuid.UUID
+    letra_plantilla: LetraPermitida
+    fecha_carga: datetime.datetime
+    puntuacion_general: Optional[int]
+
+
+class ScoreAggregate(NamedTuple):
+    suma: int
+    minimo: int
+    maximo: int
+
+
+class LetterStatsRow(NamedTuple):
+    """Resumen de los análisis completados de un usuario para una letra."""
+    letra_plantilla: LetraPermitida
+    intentos: int
+    general: ScoreAggregate
+    proporcion: ScoreAggregate
+    inclinacion: ScoreAggregate
+    espaciado: ScoreAggregate
+    consistencia: ScoreAggregate
+    ultima_practice_id: uuid.UUID
+    ultima_fecha: datetime.datetime
+    ultima_puntuacion_general: int
+
+
+class AnalysisResultKey(NamedTuple):
+    """Identifica un resultado reutilizable: la misma imagen, para la misma letra, con la misma versión del modelo."""
+    sha256: str
+    letra: LetraPermitida
+    model_version: str
+
+
+class CompletionOutcome(str, Enum):
+    """Resultado de `complete_if_pending` y `fail_if_pending`; COMPLETED indica que esta escritura hizo la transición."""
+    COMPLETED = "completed"
+    NOT_PENDING = "not_pending"    # Otra escritura la completó o la marcó como fallida antes
+    NOT_FOUND = "not_found"
+
+
+class PracticeCompletion(NamedTuple):
+    outcome: CompletionOutcome
+    # Estado final de la práctica; solo cuando outcome es COMPLETED
+    practica: Optional[Practica] = None
+
+
+class DeletionOutcome(str, Enum):
+    """Resultado de `delete`."""
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"        # La práctica existe pero pertenece a otro usuario
+
+
+class PracticeExportFilter(NamedTuple):
+    """Filtros de la exportación del historial; las fechas son UTC sin zona, como `fecha_carga`."""
+    letra: Optional[LetraPermitida] = None
+    desde: Optional[datetime.datetime] = None    # Incluida
+    hasta: Optional[datetime.datetime] = None    # Excluida
+
+
+class PracticeExportRow(NamedTuple):
+    """Una práctica del historial exportado, con su análisis si ya lo tiene."""
+    practice_id: uuid.UUID
+    letra_plantilla: LetraPermitida
+    fecha_carga: datetime.datetime
+    estado_analisis: EstadoAnalisis
+    puntuacion_general: Optional[int]
+    puntuacion_proporcion: Optional[int]
+    puntuacion_inclinacion: Optional[int]
+    puntuacion_espaciado: Optional[int]
+    puntuacion_consistencia: Optional[int]
+    fortalezas: Optional[str]
+    areas_mejora: Optional[str]
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO, NamedTuple, Optional
+
+
+class StoredFile(NamedTuple):
+    """Objeto guardado. La clave depende solo del contenido, así que subir la misma imagen dos veces da la misma clave."""
+    key: str
+    sha256: str
+    size: int
+    url: str
+
+
+class IFileStorage(ABC):
+    """Almacenamiento de las imágenes de las prácticas, direccionado por contenido (SHA-256)."""
+
+    @abstractmethod
+    async def save_file(
+        self, file: BinaryIO, content_type: Optional[str] = None, chunk_size: int = 1024 * 1024
+    ) -> StoredFile:
+        """
+        Guarda un archivo ya recibido (p. ej. el temporal de una subida multipart) desde su principio.
+        El backend lee directamente del archivo, sin pasar por una copia intermedia.
+        Si ya existe un objeto con el mismo contenido, no se vuelve a escribir.
+        """
+        pass
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes:
+        """
+        Raises:
+            FileNotFoundError: Si no existe ningún objeto con esa clave.
+        """
+        pass
+
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        pass
+
+    async def aclose(self) -> None:
+        """Libera los clientes del backend, si los hay."""
+        pass
@@ -1,40 +1,80 @@
 import uuid
+from typing import Optional
 from fastapi import UploadFile
-from src.ports.repositories.practice_repository import IPracticeRepository
-# Más adelante añadiremos puertos para guardar archivos y publicar eventos
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.ports.storage.file_storage import IFileStorage
 from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
 from src.domain.value_objects.enums import LetraPermitida
+from src.config import settings
 from .dtos import CreatePracticeResponseDTO
 
+MENSAJE_EN_COLA = "Práctica recibida y en cola para análisis."
+MENSAJE_REUTILIZADO = "Práctica analizada con el resultado de una imagen idéntica."
+
+
 class CreatePracticeUseCase:
-    def __init__(self, practice_repository: IPracticeRepository):
+    def __init__(
+        self,
+        practice_repository: IAsyncPracticeRepository,
+        file_storage: IFileStorage,
+        result_repository: IAsyncAnalysisResultRepository,
+    ):
         self.practice_repository = practice_repository
-        # self.file_storage = file_storage
-        # self.event_publisher = event_publisher
+        self.file_storage = file_storage
+        self.result_repository = result_repository
+
+    async def execute(
+        self, user_id: uuid.UUID, letra: LetraPermitida, imagen: UploadFile, content_type: Optional[str] = None
+    ) -> CreatePracticeResponseDTO:
+        # `content_type` es el tipo detectado en el contenido; si no se da, se usa el declarado en la subida
+        content_type = content_type or imagen.content_type
 
-    def execute(self, user_id: uuid.UUID, letra: LetraPermitida, imagen: UploadFile) -> CreatePracticeResponseDTO:
-        # 1. Lógica para guardar la imagen en un bucket S3 (o localmente)
-        # Por ahora, simularemos la URL
-        image_url = f"https://s3.bucket.name/images/{user_id}/{uuid.uuid4()}.jpg"
+        # 1. Guardar la imagen en el almacenamiento directamente desde el temporal de la subida; la clave
+        #    es el hash de su contenido, así que una imagen repetida se guarda una sola vez
+        stored = await self.file_storage.save_file(imagen.file, content_type, settings.file_storage_chunk_size)
         
         # 2. Crear la entidad de dominio
         nueva_practica = Practica(
             user_id=user_id,
             letra_plantilla=letra,
-            url_imagen=image_url
+            url_imagen=stored.url
         )
 
-        # 3. Guardar en la base de datos a través del repositorio
-        self.practice_repository.save(nueva_practica)
+        # 3. Si esta misma imagen ya se analizó para esta letra, la práctica se guarda ya completada
+        resultado = await self.result_repository.find(
+            AnalysisResultKey(stored.sha256, letra, settings.get_analysis_result_version())
+        )
+        if resultado is not None:
+            nueva_practica.marcar_como_completada(Analisis(**resultado.model_dump()))
+            await self.practice_repository.save_with_job(nueva_practica, None)
+            return CreatePracticeResponseDTO(
+                practice_id=str(nueva_practica.practice_id),
+                user_id=str(user_id),
+                estado_analisis=nueva_practica.estado_analisis,
+                mensaje=MENSAJE_REUTILIZADO
+            )
 
-        # 4. Lógica para publicar un evento al servicio de IA
-        # self.event_publisher.publish("practica_creada", nueva_practica.dict())
-        print(f"EVENTO: Publicar 'practica_creada' para practice_id: {nueva_practica.practice_id}")
+        # 4. Guardar la práctica y su trabajo de análisis en una única transacción; los workers
+        #    leerán la imagen del almacenamiento en segundo plano
+        await self.practice_repository.save_with_job(
+            nueva_practica,
+            TrabajoAnalisis(
+                practice_id=nueva_practica.practice_id,
+                letra=letra,
+                imagen_key=stored.key,
+                nombre_archivo=imagen.filename,
+                content_type=content_type,
+            ),
+        )
         
         # 5. Devolver una respuesta
         return CreatePracticeResponseDTO(
             practice_id=str(nueva_practica.practice_id),
             user_id=str(user_id),
             estado_analisis=nueva_practica.estado_analisis,
-            mensaje="Práctica recibida y en cola para análisis."
-        )
\ No newline at end of file
+            mensaje=MENSAJE_EN_COLA
+        )
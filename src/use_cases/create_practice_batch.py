@@ -0,0 +1,103 @@
+# src/use_cases/create_practice_batch.py
+import asyncio
+import uuid
+from typing import List, NamedTuple, Optional
+from fastapi import UploadFile
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.async_analysis_result_repository import IAsyncAnalysisResultRepository
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.ports.storage.file_storage import IFileStorage
+from src.domain.entities.practica import Practica
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import LetraPermitida
+from src.config import settings
+from .create_practice import MENSAJE_EN_COLA, MENSAJE_REUTILIZADO
+from .dtos import CreatePracticeResponseDTO
+
+
+class PracticeBatchItem(NamedTuple):
+    letra: LetraPermitida
+    imagen: UploadFile
+    # Tipo detectado en el contenido; si no se da, se usa el declarado en la subida
+    content_type: Optional[str] = None
+
+
+class CreatePracticeBatchUseCase:
+    """
+    Caso de uso para registrar varias prácticas de un mismo usuario de una sola vez
+    (por ejemplo, una hoja completa del abecedario).
+    """
+    def __init__(
+        self,
+        practice_repository: IAsyncPracticeRepository,
+        file_storage: IFileStorage,
+        result_repository: IAsyncAnalysisResultRepository,
+    ):
+        self.practice_repository = practice_repository
+        self.file_storage = file_storage
+        self.result_repository = result_repository
+
+    async def execute(self, user_id: uuid.UUID, items: List[PracticeBatchItem]) -> List[CreatePracticeResponseDTO]:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            user_id: El ID del usuario que sube las prácticas.
+            items: Los pares (letra, imagen) ya validados.
+
+        Returns:
+            Un DTO por práctica creada, en el mismo orden que `items`.
+        """
+        if not items:
+            return []
+
+        # 1. Guardar las imágenes en el almacenamiento, en paralelo y directamente desde los temporales de la subida
+        stored_files = await asyncio.gather(*(
+            self.file_storage.save_file(
+                item.imagen.file, item.content_type or item.imagen.content_type, settings.file_storage_chunk_size
+            )
+            for item in items
+        ))
+
+        # 2. Buscar en una sola consulta los resultados ya calculados para la misma imagen y letra
+        version = settings.get_analysis_result_version()
+        keys = [AnalysisResultKey(stored.sha256, item.letra, version) for item, stored in zip(items, stored_files)]
+        resultados = await self.result_repository.find_many(keys)
+
+        # 3. Crear todas las entidades de dominio: las imágenes ya analizadas se completan con el
+        #    resultado guardado y el resto lleva su trabajo de análisis
+        practicas = []
+        trabajos = []
+        for item, stored, key in zip(items, stored_files, keys):
+            practica = Practica(
+                user_id=user_id,
+                letra_plantilla=item.letra,
+                url_imagen=stored.url
+            )
+            resultado = resultados.get(key)
+            if resultado is not None:
+                practica.marcar_como_completada(Analisis(**resultado.model_dump()))
+            else:
+                trabajos.append(TrabajoAnalisis(
+                    practice_id=practica.practice_id,
+                    letra=item.letra,
+                    imagen_key=stored.key,
+                    nombre_archivo=item.imagen.filename,
+                    content_type=item.content_type or item.imagen.content_type,
+                ))
+            practicas.append(practica)
+
+        # 4. Guardar prácticas y trabajos en una única transacción. El pool de workers reparte
+        #    los trabajos respetando su límite de concurrencia
+        await self.practice_repository.save_many_with_jobs(practicas, trabajos)
+
+        return [
+            CreatePracticeResponseDTO(
+                practice_id=str(practica.practice_id),
+                user_id=str(user_id),
+                estado_analisis=practica.estado_analisis,
+                mensaje=MENSAJE_EN_COLA if practica.analisis is None else MENSAJE_REUTILIZADO
+            )
+            for practica in practicas
+        ]
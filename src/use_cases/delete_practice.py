@@ -1,33 +1,31 @@
 # src/use_cases/delete_practice.py
 import uuid
-from src.ports.repositories.practice_repository import IPracticeRepository
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import DeletionOutcome
 
 class DeletePracticeUseCase:
     """
     Caso de uso para eliminar una práctica.
     """
-    def __init__(self, practice_repository: IPracticeRepository):
+    def __init__(self, practice_repository: IAsyncPracticeRepository):
         self.practice_repository = practice_repository
 
-    def execute(self, practice_id: uuid.UUID) -> None:
+    async def execute(self, practice_id: uuid.UUID, user_id: uuid.UUID) -> None:
         """
         Ejecuta el caso de uso.
 
         Args:
             practice_id: El ID de la práctica a eliminar.
+            user_id: El usuario que la elimina; solo puede eliminar sus propias prácticas.
 
         Raises:
-            FileNotFoundError: Si la práctica no se encuentra (la capa del repositorio podría manejar esto,
-                             pero es buena práctica que el caso de uso sea explícito).
+            FileNotFoundError: Si la práctica no existe.
+            PermissionError: Si la práctica pertenece a otro usuario.
         """
-        # 1. (Opcional pero recomendado) Verificar que la práctica existe antes de intentar borrarla.
-        #    Esto permite devolver un error más significativo que una simple falla de base de datos.
-        practice_to_delete = self.practice_repository.find_by_id(practice_id)
-        if not practice_to_delete:
+        # La comprobación del propietario va en la propia sentencia DELETE: no hay una lectura
+        # previa que pueda quedar obsoleta entre la comprobación y el borrado
+        outcome = await self.practice_repository.delete(practice_id, user_id)
+        if outcome == DeletionOutcome.NOT_FOUND:
             raise FileNotFoundError("Práctica no encontrada para eliminar.")
-
-        # 2. Llamar al método de eliminación del repositorio
-        self.practice_repository.delete(practice_id)
-
-        # No se retorna nada en una operación de eliminación exitosa.
-        return
\ No newline at end of file
+        if outcome == DeletionOutcome.FORBIDDEN:
+            raise PermissionError("No tienes permiso para eliminar esta práctica.")
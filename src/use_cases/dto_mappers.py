@@ -0,0 +1,51 @@
+# src/use_cases/dto_mappers.py
+# Conversión de entidades y filas de lectura a DTOs de respuesta, compartida por los casos de uso.
+# Cada DTO se valida una sola vez, aquí; las rutas de lectura lo serializan sin volver a validarlo
+# contra `response_model` (ver `src/adapters/api/responses.py`).
+from typing import List, Sequence
+
+from pydantic import TypeAdapter
+
+from src.domain.entities.practica import Practica
+from src.ports.repositories.read_models import PracticeHistoryRow
+from src.use_cases.dtos import AnalisisDetailDTO, PracticeHistoryDTO, PracticeResultDTO
+
+# Una página del historial se valida en una sola llamada a pydantic-core, no fila a fila
+_HISTORY_ITEMS = TypeAdapter(List[PracticeHistoryDTO])
+
+
+def practice_result_dto(practica: Practica) -> PracticeResultDTO:
+    analisis_dto = None
+    if practica.analisis:
+        analisis = practica.analisis
+        analisis_dto = AnalisisDetailDTO(
+            puntuacion_general=analisis.puntuacion_general,
+            puntuacion_proporcion=analisis.puntuacion_proporcion,
+            puntuacion_inclinacion=analisis.puntuacion_inclinacion,
+            puntuacion_espaciado=analisis.puntuacion_espaciado,
+            puntuacion_consistencia=analisis.puntuacion_consistencia,
+            fortalezas=analisis.fortalezas,
+            areas_mejora=analisis.areas_mejora,
+        )
+
+    return PracticeResultDTO(
+        practice_id=str(practica.practice_id),
+        user_id=str(practica.user_id),
+        letra_plantilla=practica.letra_plantilla,
+        url_imagen=practica.url_imagen,
+        fecha_carga=practica.fecha_carga,
+        estado_analisis=practica.estado_analisis,
+        analisis=analisis_dto,
+    )
+
+
+def practice_history_dtos(rows: Sequence[PracticeHistoryRow]) -> List[PracticeHistoryDTO]:
+    return _HISTORY_ITEMS.validate_python([
+        {
+            "practice_id": str(row.practice_id),
+            "letra_plantilla": row.letra_plantilla,
+            "fecha_carga": row.fecha_carga,
+            "puntuacion_general": row.puntuacion_general,
+        }
+        for row in rows
+    ])
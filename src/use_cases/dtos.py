@@ -2,6 +2,7 @@
 from pydantic import BaseModel, Field
 import uuid
 import datetime
+from enum import Enum
 from typing import Optional, List
 from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
 
@@ -12,6 +13,21 @@ class CreatePracticeResponseDTO(BaseModel):
     estado_analisis: EstadoAnalisis
     mensaje: str
 
+# DTO con el resultado de cada elemento de una subida por lotes
+class BatchPracticeItemResultDTO(BaseModel):
+    indice: int
+    letra: str
+    practice_id: Optional[str] = None
+    estado_analisis: Optional[EstadoAnalisis] = None
+    error: Optional[str] = None
+
+# DTO para la respuesta al crear prácticas por lotes
+class BatchCreatePracticeResponseDTO(BaseModel):
+    total: int
+    aceptadas: int
+    rechazadas: int
+    resultados: List[BatchPracticeItemResultDTO]
+
 # DTO para el análisis, usado en las respuestas
 class AnalisisDetailDTO(BaseModel):
     puntuacion_general: int
@@ -32,6 +48,38 @@ class UpdateAnalysisRequestDTO(BaseModel):
     fortalezas: str = Field(..., max_length=255)
     areas_mejora: str = Field(..., max_length=255)
 
+# DTO con un resultado de análisis dentro de una ingesta por lotes (desde el servicio de IA)
+class AnalysisIngestItemDTO(UpdateAnalysisRequestDTO):
+    practice_id: uuid.UUID
+
+# DTO para la ingesta por lotes de resultados de análisis
+class AnalysisIngestRequestDTO(BaseModel):
+    resultados: List[AnalysisIngestItemDTO] = Field(..., min_length=1)
+
+# Qué pasó con cada resultado de una ingesta por lotes
+class ResultadoIngesta(str, Enum):
+    APLICADO = "aplicado"
+    NO_ENCONTRADA = "no_encontrada"
+    YA_COMPLETADA = "ya_completada"     # La práctica ya no estaba pendiente (completada o fallida)
+
+# DTO con el resultado de cada elemento de una ingesta por lotes
+class AnalysisIngestItemResultDTO(BaseModel):
+    practice_id: str
+    resultado: ResultadoIngesta
+
+# DTO para la respuesta de la ingesta por lotes
+class AnalysisIngestResponseDTO(BaseModel):
+    total: int
+    aplicados: int
+    no_encontradas: int
+    ya_completadas: int
+    resultados: List[AnalysisIngestItemResultDTO]
+
+# DTO para la respuesta al solicitar el purgado del historial de un usuario
+class PurgeUserPracticesResponseDTO(BaseModel):
+    user_id: str
+    mensaje: str
+
 # DTO para obtener el resultado de una práctica
 class PracticeResultDTO(BaseModel):
     practice_id: str
@@ -47,4 +95,28 @@ class PracticeHistoryDTO(BaseModel):
     practice_id: str
     letra_plantilla: LetraPermitida
     fecha_carga: datetime.datetime
-    puntuacion_general: Optional[int]
\ No newline at end of file
+    puntuacion_general: Optional[int]
+
+# DTO para una página del historial (paginación por cursor)
+class PracticeHistoryPageDTO(BaseModel):
+    items: List[PracticeHistoryDTO]
+    next_cursor: Optional[str] = None
+
+# DTO con el resumen de una puntuación en los intentos de una letra
+class ScoreStatsDTO(BaseModel):
+    promedio: float
+    minimo: int
+    maximo: int
+
+# DTO con el progreso de un usuario en una letra
+class LetterProgressDTO(BaseModel):
+    letra_plantilla: LetraPermitida
+    intentos: int
+    puntuacion_general: ScoreStatsDTO
+    puntuacion_proporcion: ScoreStatsDTO
+    puntuacion_inclinacion: ScoreStatsDTO
+    puntuacion_espaciado: ScoreStatsDTO
+    puntuacion_consistencia: ScoreStatsDTO
+    ultima_practice_id: str
+    ultima_fecha: datetime.datetime
+    ultima_puntuacion_general: int
@@ -0,0 +1,53 @@
+# src/use_cases/export_user_practices.py
+import datetime
+import uuid
+from typing import AsyncIterator, List, Optional
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import PracticeExportFilter, PracticeExportRow
+from src.domain.value_objects.enums import LetraPermitida
+
+
+def _to_utc_naive(fecha: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    # `fecha_carga` se guarda en UTC sin zona horaria
+    if fecha is None or fecha.tzinfo is None:
+        return fecha
+    return fecha.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def build_export_filter(
+    letra: Optional[LetraPermitida] = None,
+    desde: Optional[datetime.datetime] = None,
+    hasta: Optional[datetime.datetime] = None,
+) -> PracticeExportFilter:
+    """
+    Raises:
+        ValueError: Si el rango de fechas está vacío (`desde` no es anterior a `hasta`).
+    """
+    desde, hasta = _to_utc_naive(desde), _to_utc_naive(hasta)
+    if desde is not None and hasta is not None and desde >= hasta:
+        raise ValueError("El rango de fechas no es válido: 'desde' debe ser anterior a 'hasta'.")
+    return PracticeExportFilter(letra=letra, desde=desde, hasta=hasta)
+
+
+class ExportUserPracticesUseCase:
+    """
+    Caso de uso para exportar el historial completo de un usuario, con el análisis de cada práctica.
+    Entrega las filas por bloques según las lee la base de datos, así que la memoria no crece con el historial.
+    """
+    def __init__(self, practice_repository: IAsyncPracticeRepository, batch_size: int):
+        self.practice_repository = practice_repository
+        self.batch_size = batch_size
+
+    def execute(self, user_id: uuid.UUID, filtro: PracticeExportFilter) -> AsyncIterator[List[PracticeExportRow]]:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            user_id: El ID del usuario cuyo historial se exporta.
+            filtro: Letra y rango de fechas, construido con `build_export_filter`.
+
+        Returns:
+            Un iterador asíncrono de bloques de filas, de la práctica más reciente a la más antigua.
+            La conexión a la base de datos queda ocupada hasta que se consume o se cierra.
+        """
+        return self.practice_repository.stream_export(user_id, filtro, self.batch_size)
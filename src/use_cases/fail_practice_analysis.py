@@ -0,0 +1,32 @@
+# src/use_cases/fail_practice_analysis.py
+import uuid
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import CompletionOutcome
+
+class FailPracticeAnalysisUseCase:
+    """
+    Caso de uso para marcar una práctica como fallida cuando su análisis
+    no pudo completarse tras agotar los reintentos.
+    """
+    def __init__(self, practice_repository: IAsyncPracticeRepository):
+        self.practice_repository = practice_repository
+
+    async def execute(self, practice_id: uuid.UUID) -> None:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            practice_id: El ID de la práctica cuyo análisis falló.
+
+        Raises:
+            FileNotFoundError: Si la práctica con el ID dado no se encuentra.
+            ValueError: Si la práctica no está en estado PENDIENTE (p. ej. el resultado del análisis
+                llegó por PUT /practices/{id}/analysis mientras el worker se daba por vencido).
+        """
+        # Igual que al completarla: UPDATE condicional, sin una lectura previa que pueda quedar
+        # obsoleta y acabar escribiendo ERROR sobre una práctica ya COMPLETADA
+        outcome = await self.practice_repository.fail_if_pending(practice_id)
+        if outcome == CompletionOutcome.NOT_FOUND:
+            raise FileNotFoundError("La práctica no fue encontrada.")
+        if outcome == CompletionOutcome.NOT_PENDING:
+            raise ValueError("Solo se puede marcar como fallida una práctica pendiente.")
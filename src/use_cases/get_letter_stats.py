@@ -0,0 +1,50 @@
+# src/use_cases/get_letter_stats.py
+import uuid
+from typing import List
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import ScoreAggregate
+from src.use_cases.dtos import LetterProgressDTO, ScoreStatsDTO
+
+
+def _score_stats(aggregate: ScoreAggregate, intentos: int) -> ScoreStatsDTO:
+    return ScoreStatsDTO(
+        promedio=round(aggregate.suma / intentos, 2),
+        minimo=aggregate.minimo,
+        maximo=aggregate.maximo,
+    )
+
+
+class GetLetterStatsUseCase:
+    """
+    Caso de uso para obtener el progreso de un usuario por letra.
+    Lee el resumen precalculado: una fila por letra practicada, sin recorrer el historial.
+    """
+    def __init__(self, practice_repository: IAsyncPracticeRepository):
+        self.practice_repository = practice_repository
+
+    async def execute(self, user_id: uuid.UUID) -> List[LetterProgressDTO]:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            user_id: El ID del usuario.
+
+        Returns:
+            Un DTO por cada letra con al menos un análisis completado.
+        """
+        rows = await self.practice_repository.get_letter_stats(user_id)
+        return [
+            LetterProgressDTO(
+                letra_plantilla=row.letra_plantilla,
+                intentos=row.intentos,
+                puntuacion_general=_score_stats(row.general, row.intentos),
+                puntuacion_proporcion=_score_stats(row.proporcion, row.intentos),
+                puntuacion_inclinacion=_score_stats(row.inclinacion, row.intentos),
+                puntuacion_espaciado=_score_stats(row.espaciado, row.intentos),
+                puntuacion_consistencia=_score_stats(row.consistencia, row.intentos),
+                ultima_practice_id=str(row.ultima_practice_id),
+                ultima_fecha=row.ultima_fecha,
+                ultima_puntuacion_general=row.ultima_puntuacion_general,
+            )
+            for row in rows
+        ]
@@ -0,0 +1,55 @@
+# src/use_cases/ingest_analysis_results.py
+from typing import List
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import CompletionOutcome
+from src.use_cases.dtos import (
+    AnalysisIngestItemDTO, AnalysisIngestItemResultDTO, AnalysisIngestResponseDTO, ResultadoIngesta
+)
+from src.domain.entities.analisis import Analisis
+
+_RESULTADOS = {
+    CompletionOutcome.COMPLETED: ResultadoIngesta.APLICADO,
+    CompletionOutcome.NOT_FOUND: ResultadoIngesta.NO_ENCONTRADA,
+    CompletionOutcome.NOT_PENDING: ResultadoIngesta.YA_COMPLETADA,
+}
+
+
+class IngestAnalysisResultsUseCase:
+    """
+    Caso de uso para registrar muchos resultados de análisis de una vez.
+    Usado por el servicio de IA al vaciar su cola: una transacción por lote en lugar de una por resultado.
+    """
+    def __init__(self, practice_repository: IAsyncPracticeRepository):
+        self.practice_repository = practice_repository
+
+    async def execute(self, items: List[AnalysisIngestItemDTO]) -> AnalysisIngestResponseDTO:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            items: Los resultados a registrar, cada uno con el ID de su práctica.
+
+        Returns:
+            Un DTO con el resultado de cada elemento, en el mismo orden, y los totales.
+            Un resultado para una práctica inexistente o que ya no está pendiente no hace fallar al resto.
+        """
+        resultados = [
+            (
+                item.practice_id,
+                Analisis(**item.model_dump(exclude={"practice_id"})),
+            )
+            for item in items
+        ]
+        completions = await self.practice_repository.complete_many_if_pending(resultados)
+
+        item_results = [
+            AnalysisIngestItemResultDTO(practice_id=str(item.practice_id), resultado=_RESULTADOS[completion.outcome])
+            for item, completion in zip(items, completions)
+        ]
+        return AnalysisIngestResponseDTO(
+            total=len(item_results),
+            aplicados=sum(r.resultado == ResultadoIngesta.APLICADO for r in item_results),
+            no_encontradas=sum(r.resultado == ResultadoIngesta.NO_ENCONTRADA for r in item_results),
+            ya_completadas=sum(r.resultado == ResultadoIngesta.YA_COMPLETADA for r in item_results),
+            resultados=item_results,
+        )
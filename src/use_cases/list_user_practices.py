@@ -1,40 +1,71 @@
 # src/use_cases/list_user_practices.py
+import base64
+import binascii
+import datetime
 import uuid
-from typing import List
-from src.ports.repositories.practice_repository import IPracticeRepository
-from src.use_cases.dtos import PracticeHistoryDTO
+from typing import Optional
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import HistoryCursor
+from src.use_cases.dtos import PracticeHistoryPageDTO
+from src.use_cases.dto_mappers import practice_history_dtos
+
+
+def encode_history_cursor(cursor: HistoryCursor) -> str:
+    raw = f"{cursor.fecha_carga.isoformat()}|{cursor.practice_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_history_cursor(token: str) -> HistoryCursor:
+    """
+    Raises:
+        ValueError: Si el cursor no tiene el formato esperado.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        fecha_str, practice_id_str = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        return HistoryCursor(
+            fecha_carga=datetime.datetime.fromisoformat(fecha_str),
+            practice_id=uuid.UUID(practice_id_str),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("El cursor de paginación no es válido.") from exc
+
 
 class ListUserPracticesUseCase:
     """
-    Caso de uso para listar el historial de prácticas de un usuario.
+    Caso de uso para listar el historial de prácticas de un usuario, por páginas.
     """
-    def __init__(self, practice_repository: IPracticeRepository):
+    def __init__(self, practice_repository: IAsyncPracticeRepository):
         self.practice_repository = practice_repository
 
-    def execute(self, user_id: uuid.UUID) -> List[PracticeHistoryDTO]:
+    async def execute(self, user_id: uuid.UUID, limit: int, cursor: Optional[str] = None) -> PracticeHistoryPageDTO:
         """
         Ejecuta el caso de uso.
 
         Args:
             user_id: El ID del usuario cuyo historial se quiere obtener.
+            limit: Número máximo de elementos de la página.
+            cursor: Cursor opaco devuelto por la página anterior, o None para la primera.
+
+        Raises:
+            ValueError: Si el cursor no es válido.
 
         Returns:
-            Una lista de DTOs simplificados para mostrar en el historial.
+            La página de DTOs simplificados y el cursor de la siguiente página (None si es la última).
         """
-        # 1. Obtener todas las entidades de práctica para el usuario
-        user_practices = self.practice_repository.find_by_user_id(user_id)
-
-        # 2. Mapear cada entidad a su DTO correspondiente
-        history_list = []
-        for practice in user_practices:
-            puntuacion = practice.analisis.puntuacion_general if practice.analisis else None
-            
-            history_dto = PracticeHistoryDTO(
-                practice_id=str(practice.practice_id),
-                letra_plantilla=practice.letra_plantilla,
-                fecha_carga=practice.fecha_carga,
-                puntuacion_general=puntuacion
-            )
-            history_list.append(history_dto)
-            
-        return history_list
\ No newline at end of file
+        after = decode_history_cursor(cursor) if cursor else None
+
+        # 1. Pedir una fila de más para saber si existe otra página
+        rows = await self.practice_repository.find_history_page(user_id, limit + 1, after)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # 2. Mapear cada fila a su DTO correspondiente
+        history_list = practice_history_dtos(rows)
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_history_cursor(HistoryCursor(last.fecha_carga, last.practice_id))
+
+        return PracticeHistoryPageDTO(items=history_list, next_cursor=next_cursor)
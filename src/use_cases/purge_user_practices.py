@@ -0,0 +1,37 @@
+# src/use_cases/purge_user_practices.py
+import asyncio
+import uuid
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+
+
+class PurgeUserPracticesUseCase:
+    """
+    Caso de uso para eliminar todo el historial de un usuario (baja de la cuenta).
+    Borra por lotes de `batch_size` prácticas, cada uno en su propia transacción corta, con una pausa
+    entre lotes: así un usuario con decenas de miles de prácticas no bloquea la tabla durante minutos.
+    """
+    def __init__(self, practice_repository: IAsyncPracticeRepository, batch_size: int, pause: float):
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote del purgado debe ser al menos 1.")
+        self.practice_repository = practice_repository
+        self.batch_size = batch_size
+        self.pause = pause
+
+    async def execute(self, user_id: uuid.UUID) -> int:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            user_id: El usuario cuyo historial se elimina.
+
+        Returns:
+            El número de prácticas eliminadas. Si se interrumpe, se puede volver a ejecutar:
+            continúa con las prácticas que queden.
+        """
+        total = 0
+        while True:
+            deleted = await self.practice_repository.purge_user_batch(user_id, self.batch_size)
+            total += len(deleted)
+            if len(deleted) < self.batch_size:
+                return total
+            await asyncio.sleep(self.pause)
@@ -0,0 +1,47 @@
+# src/use_cases/rebuild_letter_stats.py
+import asyncio
+import uuid
+from typing import Optional
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+
+
+class RebuildLetterStatsUseCase:
+    """
+    Caso de uso para recalcular desde `analyses` el resumen por letra (`practice_letter_stats`).
+    Es el paso posterior al despliegue de la migración 0005: suma los análisis que completó la versión
+    anterior mientras tanto. Cada usuario se recalcula en su propia transacción y el resultado no depende
+    del resumen previo, así que se puede interrumpir y repetir.
+    """
+    def __init__(self, practice_repository: IAsyncPracticeRepository, batch_size: int, pause: float):
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote del recálculo debe ser al menos 1.")
+        self.practice_repository = practice_repository
+        self.batch_size = batch_size
+        self.pause = pause
+
+    async def execute(self, user_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            user_id: El usuario cuyo resumen se recalcula. Si es None, se recalculan todos, por lotes
+                de `batch_size` usuarios con una pausa entre lotes.
+
+        Returns:
+            El número de usuarios recalculados.
+        """
+        if user_id is not None:
+            await self.practice_repository.rebuild_letter_stats(user_id)
+            return 1
+
+        total = 0
+        after: Optional[uuid.UUID] = None
+        while True:
+            user_ids = await self.practice_repository.find_letter_stats_user_ids(after, self.batch_size)
+            for current in user_ids:
+                await self.practice_repository.rebuild_letter_stats(current)
+            total += len(user_ids)
+            if len(user_ids) < self.batch_size:
+                return total
+            after = user_ids[-1]
+            await asyncio.sleep(self.pause)
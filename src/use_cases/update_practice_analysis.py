@@ -1,7 +1,9 @@
 # src/use_cases/update_practice_analysis.py
 import uuid
-from src.ports.repositories.practice_repository import IPracticeRepository
-from src.use_cases.dtos import PracticeResultDTO, AnalisisDetailDTO, UpdateAnalysisRequestDTO
+from src.ports.repositories.async_practice_repository import IAsyncPracticeRepository
+from src.ports.repositories.read_models import CompletionOutcome
+from src.use_cases.dtos import PracticeResultDTO, UpdateAnalysisRequestDTO
+from src.use_cases.dto_mappers import practice_result_dto
 from src.domain.entities.analisis import Analisis
 
 class UpdatePracticeAnalysisUseCase:
@@ -9,10 +11,10 @@ class UpdatePracticeAnalysisUseCase:
     Caso de uso para actualizar el análisis de una práctica.
     Usado por el servicio de IA para registrar los resultados del análisis.
     """
-    def __init__(self, practice_repository: IPracticeRepository):
+    def __init__(self, practice_repository: IAsyncPracticeRepository):
         self.practice_repository = practice_repository
 
-    def execute(self, practice_id: uuid.UUID, analysis_data: UpdateAnalysisRequestDTO) -> PracticeResultDTO:
+    async def execute(self, practice_id: uuid.UUID, analysis_data: UpdateAnalysisRequestDTO) -> PracticeResultDTO:
         """
         Ejecuta el caso de uso.
 
@@ -27,14 +29,7 @@ class UpdatePracticeAnalysisUseCase:
         Returns:
             Un DTO con los detalles completos de la práctica actualizada.
         """
-        # 1. Obtener la entidad de dominio desde el repositorio
-        practice_entity = self.practice_repository.find_by_id(practice_id)
-
-        # 2. Validar que la práctica exista
-        if not practice_entity:
-            raise FileNotFoundError("La práctica no fue encontrada.")
-
-        # 3. Crear la entidad de análisis a partir del DTO
+        # 1. Crear la entidad de análisis a partir del DTO
         analisis_entity = Analisis(
             puntuacion_general=analysis_data.puntuacion_general,
             puntuacion_proporcion=analysis_data.puntuacion_proporcion,
@@ -45,37 +40,15 @@ class UpdatePracticeAnalysisUseCase:
             areas_mejora=analysis_data.areas_mejora,
         )
 
-        # 4. Marcar la práctica como completada (esto valida el estado y lanza ValueError si ya está completada)
-        practice_entity.marcar_como_completada(analisis_entity)
-
-        # 5. Actualizar en el repositorio
-        self.practice_repository.update(practice_entity)
-
-        # 6. Obtener la práctica actualizada para retornar el DTO completo
-        updated_practice = self.practice_repository.find_by_id(practice_id)
-        if not updated_practice:
-            raise FileNotFoundError("Error al recuperar la práctica actualizada.")
-
-        # 7. Mapear la entidad de dominio a un DTO de respuesta
-        analisis_dto = None
-        if updated_practice.analisis:
-            analisis_dto = AnalisisDetailDTO(
-                puntuacion_general=updated_practice.analisis.puntuacion_general,
-                puntuacion_proporcion=updated_practice.analisis.puntuacion_proporcion,
-                puntuacion_inclinacion=updated_practice.analisis.puntuacion_inclinacion,
-                puntuacion_espaciado=updated_practice.analisis.puntuacion_espaciado,
-                puntuacion_consistencia=updated_practice.analisis.puntuacion_consistencia,
-                fortalezas=updated_practice.analisis.fortalezas,
-                areas_mejora=updated_practice.analisis.areas_mejora,
-            )
-
-        return PracticeResultDTO(
-            practice_id=str(updated_practice.practice_id),
-            user_id=str(updated_practice.user_id),
-            letra_plantilla=updated_practice.letra_plantilla,
-            url_imagen=updated_practice.url_imagen,
-            fecha_carga=updated_practice.fecha_carga,
-            estado_analisis=updated_practice.estado_analisis,
-            analisis=analisis_dto
-        )
+        # 2. Completar la práctica solo si sigue PENDIENTE. El repositorio lo hace con un UPDATE
+        #    condicional, así que dos escrituras simultáneas (p. ej. un reintento del servicio de IA)
+        #    no pueden completarla las dos
+        completion = await self.practice_repository.complete_if_pending(practice_id, analisis_entity)
+        if completion.outcome == CompletionOutcome.NOT_FOUND:
+            raise FileNotFoundError("La práctica no fue encontrada.")
+        if completion.outcome == CompletionOutcome.NOT_PENDING:
+            raise ValueError("Solo se puede completar una práctica pendiente.")
+        updated_practice = completion.practica
 
+        # 3. Mapear la entidad de dominio a un DTO de respuesta
+        return practice_result_dto(updated_practice)
@@ -0,0 +1,88 @@
+import gzip
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.api.compression import ResponseCompressionMiddleware
+from src.adapters.api.media import ImmutableStaticFiles
+from src.adapters.api.responses import build_renderer, dto_response
+from src.adapters.storage import LOCAL_MEDIA_PATH
+from src.config import settings
+from tools.check_json_parity import RENDERERS, first_difference, history_cases, reference_client, result_cases
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    """Cada caso del corpus de la herramienta con la respuesta de FastAPI sin cambios."""
+    rng = random.Random(0)
+    histories = history_cases(rng)
+    results = result_cases(rng, random_cases=200)
+    with reference_client(histories, results) as client:
+        cases = [(case, client.get(f"/history/{i}").content) for i, case in enumerate(histories)]
+        cases += [(case, client.get(f"/result/{i}").content) for i, case in enumerate(results)]
+    return cases
+
+
+@pytest.mark.parametrize("name", RENDERERS)
+def test_renderer_matches_fastapi_byte_for_byte(corpus, name):
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    render = build_renderer(name)
+
+    mismatches = []
+    for content, expected in corpus:
+        actual = render(content)
+        if actual != expected:
+            mismatches.append(first_difference(expected, actual))
+
+    assert mismatches == [], f"{len(mismatches)} de {len(corpus)} casos no coinciden; el primero en {mismatches[:1]}"
+
+
+@pytest.fixture
+def compressed_client(tmp_path):
+    """Misma compresión que `main.app`: umbral de la configuración y /media excluido."""
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "grande.png").write_bytes(b"\x89PNG" + b"\x00" * (settings.response_gzip_minimum_size * 4))
+    app = FastAPI()
+
+    @app.get("/json/{size}")
+    def json_of_size(size: int):
+        return dto_response({"texto": "x" * size})
+
+    app.mount(LOCAL_MEDIA_PATH, ImmutableStaticFiles(directory=str(tmp_path)), name="media")
+    app.add_middleware(
+        ResponseCompressionMiddleware,
+        minimum_size=settings.response_gzip_minimum_size,
+        compresslevel=settings.response_gzip_level,
+        exclude_prefixes=(LOCAL_MEDIA_PATH,),
+    )
+    with TestClient(app) as client:
+        yield client
+
+
+def get_raw(client, path):
+    # Sin descomprimir, para ver el cuerpo tal como sale del servidor
+    with client.stream("GET", path, headers={"Accept-Encoding": "gzip"}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_gzip_only_above_minimum_size(compressed_client):
+    # {"texto":"..."} añade 12 bytes al texto
+    small = settings.response_gzip_minimum_size - 13
+    response, body = get_raw(compressed_client, f"/json/{small}")
+    assert "content-encoding" not in response.headers
+    assert len(body) < settings.response_gzip_minimum_size
+
+    response, body = get_raw(compressed_client, f"/json/{settings.response_gzip_minimum_size}")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == build_renderer(settings.json_renderer)({"texto": "x" * settings.response_gzip_minimum_size})
+
+
+def test_gzip_never_on_media(compressed_client):
+    response, body = get_raw(compressed_client, f"{LOCAL_MEDIA_PATH}/images/grande.png")
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert body.startswith(b"\x89PNG")
@@ -0,0 +1,55 @@
+import time
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from src.adapters.api import security
+from src.adapters.cache import TokenVerificationCache
+from src.config import settings
+
+
+def make_token(user_id: uuid.UUID, exp: float) -> str:
+    return jwt.encode({"sub": str(user_id), "exp": int(exp)}, settings.secret_key, algorithm=settings.algorithm)
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    cache = TokenVerificationCache(max_entries=10, ttl=300)
+    monkeypatch.setattr(security, "token_cache", cache)
+    return cache
+
+
+def test_verified_token_is_served_from_cache(token_cache):
+    user_id = uuid.uuid4()
+    token = make_token(user_id, time.time() + 3600)
+
+    assert security.get_current_user_id(token) == user_id
+    assert security.get_current_user_id(token) == user_id
+    assert (token_cache.hits, token_cache.misses) == (1, 1)
+
+
+def test_cached_token_is_rejected_once_expired(token_cache):
+    user_id = uuid.uuid4()
+    exp = int(time.time()) + 1
+    token = make_token(user_id, exp)
+    assert security.get_current_user_id(token) == user_id
+
+    # El TTL de la caché (300 s) es mucho mayor que lo que le queda al token; jose lo da por
+    # caducado cuando el segundo actual supera `exp`
+    time.sleep(exp + 1 - time.time() + 0.05)
+
+    with pytest.raises(HTTPException) as excinfo:
+        security.get_current_user_id(token)
+    assert excinfo.value.status_code == 401
+    assert token_cache.hits == 0
+
+
+def test_invalid_signature_is_never_cached(token_cache):
+    token = jwt.encode({"sub": str(uuid.uuid4())}, "otra-clave", algorithm=settings.algorithm)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            security.get_current_user_id(token)
+    assert token_cache.stats()["entries"] == 0
@@ -0,0 +1,79 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.adapters.api.uploads import UploadRejectedError, UploadSizeLimitMiddleware, inspect_upload, sniff_image_type
+from tests.factories import PNG, make_upload
+
+JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00"
+WEBP = b"RIFF\x24\x00\x00\x00WEBPVP8 "
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(PNG, "image/png"), (JPEG, "image/jpeg"), (WEBP, "image/webp"), (b"GIF89a", None), (b"", None)],
+    ids=["png", "jpeg", "webp", "gif", "empty"],
+)
+def test_sniff_image_type(header, expected):
+    assert sniff_image_type(header) == expected
+
+
+@pytest.mark.anyio
+async def test_inspect_upload_uses_content_not_declared_type():
+    imagen = make_upload(PNG, content_type="image/jpeg")
+
+    assert await inspect_upload(imagen, max_bytes=len(PNG)) == "image/png"
+    # Deja el archivo al principio para guardarlo después
+    assert await imagen.read() == PNG
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("content", "max_bytes", "status_code"),
+    [(PNG, len(PNG) - 1, 413), (b"%PDF-1.7 no es una imagen", 1024, 415)],
+    ids=["too-large", "not-an-image"],
+)
+async def test_inspect_upload_rejects(content, max_bytes, status_code):
+    with pytest.raises(UploadRejectedError) as excinfo:
+        await inspect_upload(make_upload(content), max_bytes=max_bytes)
+    assert excinfo.value.status_code == status_code
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    received = []
+
+    @app.post("/upload")
+    @app.post("/other")
+    async def upload(request: Request):
+        body = await request.body()
+        received.append(len(body))
+        return {"size": len(body)}
+
+    app.add_middleware(UploadSizeLimitMiddleware, limits={"/upload": 10})
+    with TestClient(app) as test_client:
+        test_client.received = received
+        yield test_client
+
+
+def test_size_limit_allows_small_bodies(client):
+    assert client.post("/upload", content=b"x" * 10).json() == {"size": 10}
+    # Las rutas sin límite no se cuentan
+    assert client.post("/other", content=b"x" * 100).json() == {"size": 100}
+
+
+def test_size_limit_rejects_declared_length_without_reading(client):
+    response = client.post("/upload", content=b"x" * 11)
+
+    assert response.status_code == 413
+    assert "10 bytes" in response.json()["detail"]
+    assert client.received == []
+
+
+def test_size_limit_rejects_streamed_body(client):
+    # Sin Content-Length (chunked): se corta al superar el límite mientras se recibe
+    response = client.post("/upload", content=iter([b"x" * 6, b"x" * 6]))
+
+    assert response.status_code == 413
+    assert client.received == []
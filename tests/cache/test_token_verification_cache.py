@@ -0,0 +1,89 @@
+import uuid
+
+import pytest
+
+from src.adapters.cache import TokenVerificationCache
+from src.adapters.cache import token_verification_cache as module
+
+NOW = 1_700_000_000.0
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock(NOW)
+    monkeypatch.setattr(module, "time", clock)
+    return clock
+
+
+def test_hit_returns_user_id(clock):
+    cache = TokenVerificationCache(max_entries=10, ttl=60)
+    user_id = uuid.uuid4()
+    assert cache.get("token") is None
+
+    cache.put("token", user_id, exp=NOW + 3600)
+
+    assert cache.get("token") == user_id
+    assert cache.get("otro") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_entry_never_outlives_token_exp(clock):
+    cache = TokenVerificationCache(max_entries=10, ttl=300)
+    cache.put("token", uuid.uuid4(), exp=NOW + 10)
+
+    clock.now = NOW + 9.9
+    assert cache.get("token") is not None
+    clock.now = NOW + 10
+    assert cache.get("token") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TokenVerificationCache(max_entries=10, ttl=60)
+    cache.put("token", uuid.uuid4(), exp=NOW + 3600)
+    cache.put("sin-exp", uuid.uuid4(), exp=None)
+
+    clock.now = NOW + 60
+    assert cache.get("token") is None
+    assert cache.get("sin-exp") is None
+
+
+def test_expired_token_is_not_stored(clock):
+    cache = TokenVerificationCache(max_entries=10, ttl=60)
+    cache.put("token", uuid.uuid4(), exp=NOW - 1)
+    assert cache.get("token") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_at_max_entries(clock):
+    cache = TokenVerificationCache(max_entries=2, ttl=60)
+    users = {name: uuid.uuid4() for name in ("a", "b", "c")}
+    cache.put("a", users["a"], exp=None)
+    cache.put("b", users["b"], exp=None)
+    assert cache.get("a") == users["a"]
+
+    cache.put("c", users["c"], exp=None)
+
+    # "b" era la menos usada
+    assert cache.get("b") is None
+    assert cache.get("a") == users["a"]
+    assert cache.get("c") == users["c"]
+    assert cache.stats()["entries"] == 2
+
+
+@pytest.mark.parametrize(("max_entries", "ttl"), [(0, 60), (10, 0)])
+def test_disabled_cache_stores_nothing(clock, max_entries, ttl):
+    cache = TokenVerificationCache(max_entries=max_entries, ttl=ttl)
+    cache.put("token", uuid.uuid4(), exp=NOW + 3600)
+
+    assert not cache.enabled
+    assert cache.get("token") is None
+    assert cache.stats()["entries"] == 0
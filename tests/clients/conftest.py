@@ -0,0 +1,35 @@
+import httpx
+import pytest
+
+from src.adapters.clients import AnalysisServiceClient
+from tools import stub_analysis_service as stub
+
+STUB_URL = "http://stub/v1"
+
+
+@pytest.fixture
+def stub_mode():
+    """Modo del servidor de pruebas, sin latencia; se restaura al terminar."""
+    original, original_stats = stub.mode, dict(stub.stats)
+    stub.mode = stub.StubMode(latency=0.0, latency_jitter=0.0, failure_rate=0.0, failure_status=503)
+    stub.stats.update(requests=0, failures=0, in_flight=0, max_in_flight=0)
+    yield stub
+    stub.mode = original
+    stub.stats.update(original_stats)
+
+
+@pytest.fixture
+async def make_client(stub_mode):
+    """Crea clientes contra el servidor de pruebas en el mismo proceso, sin abrir puertos."""
+    clients = []
+
+    def factory(**kwargs) -> AnalysisServiceClient:
+        kwargs.setdefault("base_url", STUB_URL)
+        kwargs.setdefault("retry_base_delay", 0.0)
+        client = AnalysisServiceClient(transport=httpx.ASGITransport(app=stub.app), **kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from src.adapters.clients import AnalysisServiceError, AnalysisServiceUnavailableError, CircuitBreaker
+from tests.factories import PNG
+
+pytestmark = pytest.mark.anyio
+
+RECOVERY = 0.05
+
+
+async def analyze(client):
+    return await client.analyze_letter("a", PNG, "a.png", "image/png")
+
+
+async def test_successful_call(make_client, stub_mode):
+    client = make_client()
+
+    result = await analyze(client)
+
+    assert result["metricas_detalle"]["score_global"] == 50 + len(PNG) % 50
+    assert stub_mode.stats["requests"] == 1
+
+
+async def test_breaker_opens_after_threshold_and_fails_fast(make_client, stub_mode):
+    stub_mode.mode.failure_rate = 1.0
+    client = make_client(max_retries=0, breaker_failure_threshold=2, breaker_recovery_timeout=60)
+
+    for _ in range(2):
+        with pytest.raises(AnalysisServiceError) as excinfo:
+            await analyze(client)
+        assert excinfo.value.status == "503"
+
+    with pytest.raises(AnalysisServiceUnavailableError) as excinfo:
+        await analyze(client)
+    assert excinfo.value.retry_after > 0
+    # Con el circuito abierto la petición no llega a enviarse
+    assert stub_mode.stats["requests"] == 2
+    assert client.balancer.replicas[0].breaker.state == CircuitBreaker.OPEN
+
+
+async def test_client_error_in_half_open_keeps_probing(make_client, stub_mode):
+    stub_mode.mode.failure_rate = 1.0
+    client = make_client(max_retries=0, breaker_failure_threshold=1, breaker_recovery_timeout=RECOVERY)
+    breaker = client.balancer.replicas[0].breaker
+    with pytest.raises(AnalysisServiceError):
+        await analyze(client)
+    await asyncio.sleep(RECOVERY * 2)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    stub_mode.mode.failure_status = 400
+    with pytest.raises(AnalysisServiceError) as excinfo:
+        await analyze(client)
+
+    # Un 4xx no cierra el circuito ni reinicia los fallos, pero libera la llamada de prueba
+    assert excinfo.value.status == "400"
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.stats()["consecutive_failures"] == 1
+    assert breaker.half_open_calls == 0
+
+    stub_mode.mode.failure_rate = 0.0
+    await analyze(client)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize(
+    ("failure_status", "requests"),
+    [(503, 3), (429, 3), (500, 1), (400, 1)],
+)
+async def test_retries_only_retryable_errors(make_client, stub_mode, failure_status, requests):
+    stub_mode.mode.failure_rate = 1.0
+    stub_mode.mode.failure_status = failure_status
+    client = make_client(max_retries=2, breaker_failure_threshold=10)
+
+    with pytest.raises(AnalysisServiceError) as excinfo:
+        await analyze(client)
+
+    assert excinfo.value.status == str(failure_status)
+    assert stub_mode.stats["requests"] == requests
+    assert client.stats()["retries"] == requests - 1
+
+
+async def test_bulkhead_rejects_after_queue_timeout(make_client, stub_mode):
+    stub_mode.mode.latency = 0.3
+    client = make_client(max_concurrency=1, queue_timeout=0.05)
+
+    results = await asyncio.gather(analyze(client), analyze(client), return_exceptions=True)
+
+    rejected = [r for r in results if isinstance(r, AnalysisServiceUnavailableError)]
+    assert len(rejected) == 1
+    assert "saturado" in str(rejected[0])
+    assert stub_mode.stats["requests"] == 1
+    assert client.bulkhead.stats()["rejected_calls"] == 1
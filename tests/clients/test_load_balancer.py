@@ -0,0 +1,142 @@
+import asyncio
+import time
+from contextlib import ExitStack
+
+import pytest
+
+from src.adapters.clients import AnalysisServiceUnavailableError, CircuitBreaker, LoadBalancer, Replica
+from src.adapters.clients.load_balancer import EWMA, LEAST_OUTSTANDING, parse_base_urls
+from src.adapters.clients.resilience import CircuitOpenError
+from tests.factories import PNG
+
+RECOVERY = 0.05
+
+
+def make_replicas(*names, recovery_timeout=60.0):
+    return [
+        Replica(name, CircuitBreaker(failure_threshold=1, recovery_timeout=recovery_timeout, name=name))
+        for name in names
+    ]
+
+
+def hold(stack, replica, count):
+    """Deja `count` peticiones en curso en la réplica hasta cerrar `stack`."""
+    for _ in range(count):
+        stack.enter_context(replica.track())
+
+
+def test_parse_base_urls():
+    assert parse_base_urls(" http://a/v1/ , http://b/v1,http://a/v1 ") == ["http://a/v1", "http://b/v1"]
+    assert parse_base_urls(["http://a/"]) == ["http://a"]
+    assert parse_base_urls(None) == []
+
+
+def test_least_outstanding_picks_lowest_in_flight():
+    a, b, c = make_replicas("a", "b", "c")
+    balancer = LoadBalancer([a, b, c], LEAST_OUTSTANDING)
+    with ExitStack() as stack:
+        hold(stack, a, 2)
+        hold(stack, b, 1)
+        assert balancer.acquire() is c
+        hold(stack, c, 2)
+        assert balancer.acquire() is b
+
+
+def test_ties_are_spread_between_replicas():
+    replicas = make_replicas("a", "b")
+    balancer = LoadBalancer(replicas, LEAST_OUTSTANDING)
+
+    chosen = {balancer.acquire().base_url for _ in range(50)}
+
+    assert chosen == {"a", "b"}
+
+
+def test_ewma_prefers_faster_replica():
+    slow, fast, new = make_replicas("slow", "fast", "new")
+    balancer = LoadBalancer([slow, fast], EWMA)
+    with slow.track():
+        time.sleep(0.03)
+    with fast.track():
+        pass
+
+    assert fast.ewma_latency < slow.ewma_latency
+    assert all(balancer.acquire() is fast for _ in range(10))
+    # Una réplica sin medidas se prueba antes que las medidas
+    balancer.replicas.append(new)
+    assert balancer.acquire() is new
+
+
+def test_ewma_weights_latency_by_in_flight_requests():
+    slow, fast = make_replicas("slow", "fast")
+    balancer = LoadBalancer([slow, fast], EWMA)
+    with slow.track():
+        time.sleep(0.02)
+    with fast.track():
+        time.sleep(0.005)
+
+    with ExitStack() as stack:
+        hold(stack, fast, 10)
+        assert balancer.acquire() is slow
+
+
+def test_open_replica_is_skipped_and_excluded_is_last_resort():
+    a, b = make_replicas("a", "b")
+    balancer = LoadBalancer([a, b], LEAST_OUTSTANDING)
+    a.breaker.record_failure()
+
+    with ExitStack() as stack:
+        hold(stack, b, 5)
+        assert balancer.acquire() is b
+        # La réplica que acaba de fallar solo se repite si no queda otra disponible
+        assert balancer.acquire(exclude=[b]) is b
+
+
+def test_all_replicas_open_raises():
+    replicas = make_replicas("a", "b")
+    balancer = LoadBalancer(replicas)
+    for replica in replicas:
+        replica.breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        balancer.acquire()
+    assert 0 < excinfo.value.retry_after <= 60
+    assert balancer.retry_after() > 0
+
+
+@pytest.mark.anyio
+async def test_ejected_replica_returns_after_recovery():
+    a, b = make_replicas("a", "b", recovery_timeout=RECOVERY)
+    balancer = LoadBalancer([a, b], LEAST_OUTSTANDING)
+    a.breaker.record_failure()
+    await asyncio.sleep(RECOVERY * 2)
+
+    with ExitStack() as stack:
+        hold(stack, b, 1)
+        # Semiabierta: recibe una única llamada de prueba
+        assert balancer.acquire() is a
+        assert not a.is_available()
+        assert balancer.acquire() is b
+
+    a.breaker.record_success()
+    assert a.is_available()
+    assert a.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.anyio
+async def test_client_raises_unavailable_when_every_replica_is_open(make_client, stub_mode):
+    client = make_client(base_url="http://stub-a/v1,http://stub-b/v1")
+    for replica in client.balancer.replicas:
+        for _ in range(replica.breaker.failure_threshold):
+            replica.breaker.record_failure()
+
+    with pytest.raises(AnalysisServiceUnavailableError) as excinfo:
+        await client.analyze_letter("a", PNG)
+
+    assert excinfo.value.retry_after > 0
+    assert stub_mode.stats["requests"] == 0
+    assert client.stats()["retries"] == 0
+
+
+def test_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        LoadBalancer(make_replicas("a"), "round_robin")
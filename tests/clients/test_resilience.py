@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from src.adapters.clients.resilience import (
+    Bulkhead, BulkheadFullError, CircuitBreaker, CircuitOpenError, RetryPolicy,
+)
+
+RECOVERY = 0.05
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call()
+    assert 0 < excinfo.value.retry_after <= 60
+    assert breaker.stats()["rejected_calls"] == 1
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.anyio
+async def test_half_open_limits_probes():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=RECOVERY, half_open_max_calls=2)
+    breaker.record_failure()
+    await asyncio.sleep(RECOVERY * 2)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.before_call()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+@pytest.mark.anyio
+async def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=RECOVERY)
+    for _ in range(5):
+        breaker.record_failure()
+    await asyncio.sleep(RECOVERY * 2)
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["times_opened"] == 2
+
+
+@pytest.mark.anyio
+async def test_release_frees_probe_without_closing():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=RECOVERY)
+    breaker.record_failure()
+    await asyncio.sleep(RECOVERY * 2)
+    breaker.before_call()
+
+    breaker.release()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.stats()["consecutive_failures"] == 1
+    breaker.before_call()
+
+
+@pytest.mark.anyio
+async def test_bulkhead_rejects_after_queue_timeout():
+    bulkhead = Bulkhead(max_concurrency=1, queue_timeout=0.05)
+
+    async with bulkhead.slot():
+        assert bulkhead.stats()["active"] == 1
+        with pytest.raises(BulkheadFullError):
+            async with bulkhead.slot():
+                pass
+
+    assert bulkhead.stats() == {"max_concurrency": 1, "active": 0, "waiting": 0, "rejected_calls": 1}
+    async with bulkhead.slot():
+        pass
+
+
+@pytest.mark.anyio
+async def test_bulkhead_queued_call_gets_freed_slot():
+    bulkhead = Bulkhead(max_concurrency=1, queue_timeout=1.0)
+    order = []
+
+    async def call(name, hold):
+        async with bulkhead.slot():
+            order.append(name)
+            await asyncio.sleep(hold)
+
+    await asyncio.gather(call("primera", 0.05), call("segunda", 0))
+
+    assert order == ["primera", "segunda"]
+    assert bulkhead.stats()["rejected_calls"] == 0
+
+
+def test_retry_delay_has_full_jitter_and_cap():
+    policy = RetryPolicy(max_retries=5, base_delay=0.2, max_delay=1.0)
+
+    for retry, cap in [(1, 0.2), (2, 0.4), (3, 0.8), (5, 1.0)]:
+        delays = [policy.delay(retry) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert len(set(delays)) > 1
+    # Retry-After manda si es mayor, sin pasar de max_delay
+    assert policy.delay(1, retry_after=0.5) >= 0.5
+    assert policy.delay(1, retry_after=30) == 1.0
@@ -0,0 +1,120 @@
+# tests/conftest.py
+# Las pruebas usan SQLite con aiosqlite: cada prueba crea su propia base de datos en un archivo
+# temporal con el esquema de los modelos. Las pruebas asíncronas se ejecutan con el plugin de anyio.
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# `settings` se crea al importar `src`: sin MySQL ni .env, basta con estos valores
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("DB_PORT", "3306")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ["DATABASE_URL"] = "sqlite://"
+os.environ["DB_ASYNC"] = "false"
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.adapters.cache import AnalysisResultLRU  # noqa: E402
+from src.adapters.repositories import db_models  # noqa: E402,F401
+from src.adapters.repositories.async_mysql_analysis_job_repository import AsyncMySQLAnalysisJobRepository  # noqa: E402
+from src.adapters.repositories.async_mysql_analysis_result_repository import (  # noqa: E402
+    AsyncMySQLAnalysisResultRepository,
+)
+from src.adapters.repositories.async_mysql_practice_repository import AsyncMySQLPracticeRepository  # noqa: E402
+from src.adapters.repositories.base import Base  # noqa: E402
+from src.adapters.repositories.cached_analysis_result_repository import CachedAnalysisResultRepository  # noqa: E402
+from src.adapters.repositories.database import enable_sqlite_foreign_keys  # noqa: E402
+from src.adapters.repositories.mysql_analysis_job_repository import MySQLAnalysisJobRepository  # noqa: E402
+from src.adapters.repositories.mysql_analysis_result_repository import MySQLAnalysisResultRepository  # noqa: E402
+from src.adapters.repositories.mysql_practice_repository import MySQLPracticeRepository  # noqa: E402
+from src.adapters.repositories.providers import Repositories  # noqa: E402
+from src.adapters.repositories.threaded_repositories import (  # noqa: E402
+    ThreadedAnalysisJobRepository, ThreadedAnalysisResultRepository, ThreadedPracticeRepository,
+)
+from src.adapters.storage import LocalFileStorage  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "trace.db"
+
+
+@pytest.fixture
+async def async_engine(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    enable_sqlite_foreign_keys(engine.sync_engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    # Mismas opciones que `database.AsyncSessionLocal`
+    return async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def sync_session_factory(async_engine, db_path):
+    # Misma base de datos que el motor asíncrono (que ya creó el esquema), para el modo DB_ASYNC=false
+    engine = create_engine(f"sqlite:///{db_path}")
+    enable_sqlite_foreign_keys(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(params=["async", "threaded"])
+def repositories_factory(request, session_factory, sync_session_factory):
+    """
+    Igual que `providers.open_repositories`, sin la caché de prácticas: cada llamada abre una sesión nueva.
+    Se prueba con AsyncSession (DB_ASYNC=true) y con Session en el threadpool (DB_ASYNC=false).
+    """
+    lru = AnalysisResultLRU(max_entries=100)
+
+    @asynccontextmanager
+    async def open_repositories() -> AsyncIterator[Repositories]:
+        if request.param == "async":
+            async with session_factory() as session:
+                yield Repositories(
+                    practices=AsyncMySQLPracticeRepository(session),
+                    jobs=AsyncMySQLAnalysisJobRepository(session),
+                    analysis_results=CachedAnalysisResultRepository(AsyncMySQLAnalysisResultRepository(session), lru),
+                )
+            return
+
+        db = sync_session_factory()
+        try:
+            yield Repositories(
+                practices=ThreadedPracticeRepository(MySQLPracticeRepository(db)),
+                jobs=ThreadedAnalysisJobRepository(MySQLAnalysisJobRepository(db)),
+                analysis_results=CachedAnalysisResultRepository(
+                    ThreadedAnalysisResultRepository(MySQLAnalysisResultRepository(db)), lru
+                ),
+            )
+        finally:
+            db.close()
+
+    return open_repositories
+
+
+@pytest.fixture
+async def repositories(repositories_factory):
+    async with repositories_factory() as repositories:
+        yield repositories
+
+
+@pytest.fixture
+def file_storage(tmp_path):
+    return LocalFileStorage(root_dir=str(tmp_path / "media"), base_url="/media")
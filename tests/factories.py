@@ -0,0 +1,72 @@
+# tests/factories.py
+# Entidades y cargas de prueba con valores por defecto razonables.
+import datetime
+import io
+import uuid
+from typing import Optional
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from src.domain.entities.analisis import Analisis
+from src.domain.entities.practica import Practica
+from src.domain.entities.trabajo_analisis import TrabajoAnalisis
+from src.domain.value_objects.enums import LetraPermitida
+from src.use_cases.dtos import UpdateAnalysisRequestDTO
+
+# PNG de 1x1 píxel
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d4944415478da63f8cfc0f01f0005000201a5f5d8a40000000049454e44ae426082"
+)
+
+
+def make_practica(
+    user_id: Optional[uuid.UUID] = None,
+    letra: LetraPermitida = LetraPermitida.a,
+    fecha_carga: Optional[datetime.datetime] = None,
+    **kwargs,
+) -> Practica:
+    return Practica(
+        user_id=user_id or uuid.uuid4(),
+        letra_plantilla=letra,
+        url_imagen="/media/images/00/test.png",
+        fecha_carga=fecha_carga or datetime.datetime.utcnow(),
+        **kwargs,
+    )
+
+
+def make_trabajo(practica: Practica, imagen_key: str = "images/00/test.png", **kwargs) -> TrabajoAnalisis:
+    return TrabajoAnalisis(
+        practice_id=practica.practice_id,
+        letra=practica.letra_plantilla,
+        imagen_key=imagen_key,
+        nombre_archivo="test.png",
+        content_type="image/png",
+        **kwargs,
+    )
+
+
+def make_resultado(general: int = 80) -> UpdateAnalysisRequestDTO:
+    return UpdateAnalysisRequestDTO(
+        puntuacion_general=general,
+        puntuacion_proporcion=70,
+        puntuacion_inclinacion=60,
+        puntuacion_espaciado=50,
+        puntuacion_consistencia=90,
+        fortalezas="Trazo firme.",
+        areas_mejora="Inclinación.",
+    )
+
+
+def make_analisis(general: int = 80) -> Analisis:
+    return Analisis(**make_resultado(general).model_dump())
+
+
+def make_upload(content: bytes = PNG, filename: str = "a.png", content_type: str = "image/png") -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        size=len(content),
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
@@ -0,0 +1,57 @@
+import asyncio
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from src.adapters.imaging import ImagePreprocessor, PreprocessingOptions  # noqa: E402
+from tests.factories import PNG  # noqa: E402
+
+pytestmark = pytest.mark.anyio
+
+
+class FakePool(Executor):
+    """Pool que deja las tareas pendientes hasta que la prueba lo rompe."""
+
+    def __init__(self):
+        self.pending = []
+        self.shutdowns = 0
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.pending.append(future)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdowns += 1
+
+    def break_pool(self):
+        for future in self.pending:
+            future.set_exception(BrokenProcessPool("Un proceso hijo terminó de forma abrupta"))
+
+
+async def test_broken_pool_is_replaced_once(monkeypatch):
+    pools = []
+
+    def new_pool(self):
+        pools.append(FakePool())
+        return pools[-1]
+
+    monkeypatch.setattr(ImagePreprocessor, "_new_executor", new_pool)
+    preprocessor = ImagePreprocessor(PreprocessingOptions(), workers=2)
+    tasks = [asyncio.create_task(preprocessor.prepare(PNG, f"{i}.png", "image/png")) for i in range(2)]
+    while len(pools[0].pending) < 2:
+        await asyncio.sleep(0)
+
+    pools[0].break_pool()
+    results = await asyncio.gather(*tasks)
+
+    # Las dos imágenes del pool roto se envían sin preprocesar, pero solo una recrea el pool
+    assert [r.image_bytes for r in results] == [PNG, PNG]
+    assert len(pools) == 2
+    assert pools[0].shutdowns == 1
+    assert pools[1].shutdowns == 0
+    assert preprocessor._executor is pools[1]
+    assert preprocessor.stats()["failed"] == 2
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.adapters.observability.instrumentation import DB_QUERY_DURATION, db_operation_var, instrument_engine
+
+
+def query_count(*labels: str) -> int:
+    series = DB_QUERY_DURATION._series.get(labels)
+    return series[2] if series else 0
+
+
+def test_failed_statement_is_timed_and_clears_its_start():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test-errors")
+    token = db_operation_var.set("practices.find_by_id")
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM tabla_inexistente"))
+            assert connection.info["query_start"] == []
+    finally:
+        db_operation_var.reset(token)
+        engine.dispose()
+
+    assert query_count("test-errors", "practices.find_by_id", "SELECT", "ok") == 1
+    assert query_count("test-errors", "practices.find_by_id", "SELECT", "error") == 1
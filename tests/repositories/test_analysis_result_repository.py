@@ -0,0 +1,89 @@
+import hashlib
+
+import pytest
+
+from src.adapters.cache import AnalysisResultLRU
+from src.adapters.repositories.cached_analysis_result_repository import CachedAnalysisResultRepository
+from src.config import settings
+from src.domain.value_objects.enums import LetraPermitida
+from src.ports.repositories.read_models import AnalysisResultKey
+from tests.factories import PNG, make_resultado
+
+pytestmark = pytest.mark.anyio
+
+
+def make_key(content: bytes = PNG, letra: LetraPermitida = LetraPermitida.a, version: str = "1") -> AnalysisResultKey:
+    return AnalysisResultKey(hashlib.sha256(content).hexdigest(), letra, version)
+
+
+async def test_find_many_combines_memory_and_database(repositories):
+    memo = repositories.analysis_results
+    en_memoria, en_tabla, ausente = make_key(), make_key(letra=LetraPermitida.b), make_key(b"otra")
+    await memo.save(en_memoria, make_resultado(general=10))
+    # Guardado directamente en la tabla: no está en el nivel en memoria
+    await memo.repository.save(en_tabla, make_resultado(general=20))
+
+    found = await memo.find_many([en_memoria, en_tabla, ausente, en_memoria])
+
+    assert {key: r.puntuacion_general for key, r in found.items()} == {en_memoria: 10, en_tabla: 20}
+    assert (memo.lru.memory_hits, memo.lru.db_hits, memo.lru.misses) == (1, 1, 1)
+    # El resultado leído de la tabla queda en memoria
+    await memo.find_many([en_tabla])
+    assert memo.lru.memory_hits == 2
+
+
+async def test_find_many_only_returns_requested_combinations(repositories):
+    # El filtro por columnas con IN también encuentra (PNG, b) si se piden (PNG, a) y (otra, b)
+    await repositories.analysis_results.repository.save(make_key(letra=LetraPermitida.b), make_resultado())
+    keys = [make_key(letra=LetraPermitida.a), make_key(b"otra", letra=LetraPermitida.b)]
+
+    assert await repositories.analysis_results.repository.find_many(keys) == {}
+    assert await repositories.analysis_results.repository.find_many([]) == {}
+
+
+async def test_evicted_result_is_read_back_from_database(repositories):
+    memo = CachedAnalysisResultRepository(repositories.analysis_results.repository, AnalysisResultLRU(max_entries=1))
+    primera, segunda = make_key(), make_key(b"otra")
+    await memo.save(primera, make_resultado(general=30))
+    await memo.save(segunda, make_resultado(general=40))
+
+    assert memo.lru.stats()["entries"] == 1
+    assert (await memo.find(primera)).puntuacion_general == 30
+    assert (memo.lru.memory_hits, memo.lru.db_hits) == (0, 1)
+    # Ahora la expulsada es la segunda
+    assert memo.lru.get(segunda) is None
+
+
+async def test_other_model_version_misses(repositories):
+    memo = repositories.analysis_results
+    await memo.save(make_key(version="1"), make_resultado())
+
+    assert await memo.find(make_key(version="2")) is None
+    assert await memo.find_many([make_key(version="2")]) == {}
+
+
+def test_result_version_tracks_model_and_preprocessing(monkeypatch):
+    monkeypatch.setattr(settings, "analysis_model_version", "7")
+    monkeypatch.setattr(settings, "image_preprocessing_enabled", False)
+    assert settings.get_analysis_result_version() == "7"
+
+    monkeypatch.setattr(settings, "image_preprocessing_enabled", True)
+    preprocessed = settings.get_analysis_result_version()
+    assert preprocessed.startswith("7+pp")
+
+    # Cualquier parámetro que cambie la imagen enviada cambia la versión
+    versions = {preprocessed}
+    for name, value in [
+        ("image_preprocess_max_size", settings.image_preprocess_max_size + 1),
+        ("image_preprocess_format", "jpeg" if settings.image_preprocess_format.upper() != "JPEG" else "png"),
+        ("image_preprocess_quality", settings.image_preprocess_quality - 1),
+        ("image_preprocess_crop", not settings.image_preprocess_crop),
+        ("image_preprocess_crop_margin", settings.image_preprocess_crop_margin + 0.05),
+    ]:
+        with monkeypatch.context() as m:
+            m.setattr(settings, name, value)
+            versions.add(settings.get_analysis_result_version())
+    assert len(versions) == 6
+
+    monkeypatch.setattr(settings, "analysis_model_version", "8")
+    assert settings.get_analysis_result_version() not in versions
@@ -0,0 +1,41 @@
+import pytest
+
+from src.adapters.cache import InMemoryPracticeCache
+from src.adapters.repositories.cached_practice_repository import CachedPracticeRepository
+from src.config import settings
+from src.ports.repositories.read_models import DeletionOutcome
+from tests.factories import make_analisis, make_practica
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("final_ttl", [3600.0, 0.0])
+def test_memory_backend_caps_ttls(monkeypatch, final_ttl):
+    monkeypatch.setattr(settings, "practice_cache_backend", "memory")
+    monkeypatch.setattr(settings, "practice_cache_final_ttl", final_ttl)
+    monkeypatch.setattr(settings, "practice_cache_memory_max_ttl", 5.0)
+
+    assert settings.get_practice_cache_ttl(final=True) == 5.0
+    assert settings.get_practice_cache_ttl(final=False) == settings.practice_cache_ttl
+
+
+def test_shared_backend_keeps_final_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "practice_cache_backend", "redis")
+    monkeypatch.setattr(settings, "practice_cache_final_ttl", 3600.0)
+    assert settings.get_practice_cache_ttl(final=True) == 3600.0
+
+    monkeypatch.setattr(settings, "practice_cache_final_ttl", 0.0)
+    assert settings.get_practice_cache_ttl(final=True) is None
+
+
+async def test_delete_invalidates_cached_practice(repositories, monkeypatch):
+    monkeypatch.setattr(settings, "practice_cache_backend", "memory")
+    cache = InMemoryPracticeCache(max_entries=10)
+    cached = CachedPracticeRepository(repositories.practices, cache)
+    practica = make_practica()
+    await cached.save(practica)
+    await cached.complete_if_pending(practica.practice_id, make_analisis())
+
+    assert (await cached.find_by_id(practica.practice_id)) is not None
+    assert await cached.delete(practica.practice_id, practica.user_id) == DeletionOutcome.DELETED
+    assert await cached.find_by_id(practica.practice_id) is None
@@ -0,0 +1,158 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.dialects import mysql, sqlite
+
+from src.adapters.repositories.db_models import AnalisisDB, PracticeLetterStatsDB
+from src.adapters.repositories.letter_stats import letter_stats_upsert
+from src.domain.value_objects.enums import LetraPermitida
+from tests.factories import make_analisis, make_practica
+
+pytestmark = pytest.mark.anyio
+
+BASE = datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+
+async def complete(repositories, practica, general):
+    await repositories.practices.save(practica)
+    await repositories.practices.complete_if_pending(practica.practice_id, make_analisis(general=general))
+
+
+async def stats_by_letter(repositories, user_id):
+    return {row.letra_plantilla: row for row in await repositories.practices.get_letter_stats(user_id)}
+
+
+async def test_upsert_accumulates_each_completion(repositories):
+    user_id = uuid.uuid4()
+    primera = make_practica(user_id=user_id, fecha_carga=BASE)
+    await complete(repositories, primera, general=40)
+
+    row = (await stats_by_letter(repositories, user_id))[LetraPermitida.a]
+    assert (row.intentos, row.general.suma, row.general.minimo, row.general.maximo) == (1, 40, 40, 40)
+    assert (row.ultima_practice_id, row.ultima_fecha, row.ultima_puntuacion_general) == (primera.practice_id, BASE, 40)
+
+    # El segundo intento (ON CONFLICT / ON DUPLICATE KEY) se suma a la fila existente
+    segunda = make_practica(user_id=user_id, fecha_carga=BASE + datetime.timedelta(minutes=5))
+    await complete(repositories, segunda, general=80)
+
+    row = (await stats_by_letter(repositories, user_id))[LetraPermitida.a]
+    assert (row.intentos, row.general.suma, row.general.minimo, row.general.maximo) == (2, 120, 40, 80)
+    assert row.general.suma / row.intentos == 60
+    assert (row.ultima_practice_id, row.ultima_fecha, row.ultima_puntuacion_general) == (
+        segunda.practice_id, segunda.fecha_carga, 80
+    )
+
+    # Una práctica más antigua que se completa tarde cuenta, pero no pasa a ser el último intento
+    atrasada = make_practica(user_id=user_id, fecha_carga=BASE - datetime.timedelta(minutes=5))
+    await complete(repositories, atrasada, general=10)
+
+    row = (await stats_by_letter(repositories, user_id))[LetraPermitida.a]
+    assert (row.intentos, row.general.suma, row.general.minimo) == (3, 130, 10)
+    assert (row.ultima_practice_id, row.ultima_fecha) == (segunda.practice_id, segunda.fecha_carga)
+
+
+async def test_batch_upsert_groups_by_letter(repositories):
+    user_id = uuid.uuid4()
+    practicas = [
+        make_practica(user_id=user_id, fecha_carga=BASE),
+        make_practica(user_id=user_id, fecha_carga=BASE + datetime.timedelta(minutes=1)),
+        make_practica(user_id=user_id, letra=LetraPermitida.b, fecha_carga=BASE),
+    ]
+    await repositories.practices.save_many(practicas)
+
+    await repositories.practices.complete_many_if_pending([
+        (practica.practice_id, make_analisis(general=general)) for practica, general in zip(practicas, (30, 50, 70))
+    ])
+
+    stats = await stats_by_letter(repositories, user_id)
+    assert (stats[LetraPermitida.a].intentos, stats[LetraPermitida.a].general.suma) == (2, 80)
+    assert stats[LetraPermitida.a].ultima_practice_id == practicas[1].practice_id
+    assert (stats[LetraPermitida.b].intentos, stats[LetraPermitida.b].general.suma) == (1, 70)
+
+
+async def test_delete_recomputes_from_remaining_practices(repositories):
+    user_id = uuid.uuid4()
+    primera = make_practica(user_id=user_id, fecha_carga=BASE)
+    segunda = make_practica(user_id=user_id, fecha_carga=BASE + datetime.timedelta(minutes=5))
+    await complete(repositories, primera, general=40)
+    await complete(repositories, segunda, general=80)
+
+    # Al eliminar el último intento, máximo y último intento se recalculan desde las prácticas que quedan
+    await repositories.practices.delete(segunda.practice_id, user_id)
+
+    row = (await stats_by_letter(repositories, user_id))[LetraPermitida.a]
+    assert (row.intentos, row.general.suma, row.general.minimo, row.general.maximo) == (1, 40, 40, 40)
+    assert (row.ultima_practice_id, row.ultima_fecha, row.ultima_puntuacion_general) == (primera.practice_id, BASE, 40)
+
+    await repositories.practices.delete(primera.practice_id, user_id)
+    assert await repositories.practices.get_letter_stats(user_id) == []
+
+
+def test_upsert_statement_per_dialect():
+    practica = make_practica()
+    practica.marcar_como_completada(make_analisis())
+
+    mysql_sql = str(letter_stats_upsert("mysql", [practica]).compile(dialect=mysql.dialect()))
+    assert "ON DUPLICATE KEY UPDATE" in mysql_sql
+    # MySQL evalúa las asignaciones en orden: ultima_fecha se compara antes de sobrescribirla
+    assignments = mysql_sql.split("ON DUPLICATE KEY UPDATE", 1)[1]
+    assert assignments.rstrip().rsplit(",", 1)[-1].strip().startswith("ultima_fecha =")
+
+    sqlite_sql = str(letter_stats_upsert("sqlite", [practica]).compile(dialect=sqlite.dialect()))
+    assert "ON CONFLICT (user_id, letra_plantilla) DO UPDATE" in sqlite_sql
+
+    with pytest.raises(ValueError):
+        letter_stats_upsert("postgresql", [practica])
+
+
+async def test_rebuild_is_idempotent(repositories, session_factory):
+    user_id = uuid.uuid4()
+    primera = make_practica(user_id=user_id, fecha_carga=BASE)
+    segunda = make_practica(user_id=user_id, fecha_carga=BASE + datetime.timedelta(minutes=5))
+    sin_analisis = make_practica(user_id=user_id, letra=LetraPermitida.b)
+    sin_resumen = make_practica(user_id=user_id, letra=LetraPermitida.c)
+    for practica, general in ((primera, 40), (segunda, 80), (sin_analisis, 50), (sin_resumen, 90)):
+        await complete(repositories, practica, general)
+    expected_a = (await stats_by_letter(repositories, user_id))[LetraPermitida.a]
+
+    # Resumen desincronizado: una fila con cuentas erróneas, una sin prácticas detrás y una que falta
+    async with session_factory() as session:
+        await session.execute(
+            update(PracticeLetterStatsDB)
+            .where(PracticeLetterStatsDB.user_id == user_id, PracticeLetterStatsDB.letra_plantilla == LetraPermitida.a)
+            .values(intentos=99, suma_general=0)
+        )
+        await session.execute(delete(AnalisisDB).where(AnalisisDB.practice_id == sin_analisis.practice_id))
+        await session.execute(
+            delete(PracticeLetterStatsDB)
+            .where(PracticeLetterStatsDB.user_id == user_id, PracticeLetterStatsDB.letra_plantilla == LetraPermitida.c)
+        )
+        await session.commit()
+
+    rebuilt = await repositories.practices.rebuild_letter_stats(user_id)
+
+    assert [row.letra_plantilla for row in rebuilt] == [LetraPermitida.a, LetraPermitida.c]
+    assert rebuilt[0] == expected_a
+    assert (rebuilt[1].intentos, rebuilt[1].general.suma, rebuilt[1].ultima_practice_id) == (1, 90, sin_resumen.practice_id)
+    assert await repositories.practices.rebuild_letter_stats(user_id) == rebuilt
+    assert await repositories.practices.get_letter_stats(user_id) == rebuilt
+
+
+async def test_find_letter_stats_user_ids_pages_in_order(repositories):
+    completados = [uuid.uuid4() for _ in range(3)]
+    for user_id in completados:
+        await complete(repositories, make_practica(user_id=user_id), general=60)
+    await repositories.practices.save(make_practica())  # Sin análisis: no tiene resumen que recalcular
+
+    seen = []
+    after = None
+    while True:
+        page = await repositories.practices.find_letter_stats_user_ids(after, limit=2)
+        seen.extend(page)
+        if len(page) < 2:
+            break
+        after = page[-1]
+
+    assert seen == sorted(completados)
@@ -0,0 +1,69 @@
+import datetime
+import uuid
+
+import pytest
+
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+from src.ports.repositories.read_models import PracticeExportFilter
+from tests.factories import make_analisis, make_practica
+
+pytestmark = pytest.mark.anyio
+
+BASE = datetime.datetime(2024, 3, 1, 9, 0, 0)
+
+
+async def save_history(repositories, user_id):
+    practicas = [
+        make_practica(user_id=user_id, letra=letra, fecha_carga=BASE + datetime.timedelta(hours=i))
+        for i, letra in enumerate([LetraPermitida.a, LetraPermitida.b, LetraPermitida.a, LetraPermitida.a, LetraPermitida.b])
+    ]
+    await repositories.practices.save_many(practicas + [make_practica(fecha_carga=BASE)])
+    await repositories.practices.complete_if_pending(practicas[0].practice_id, make_analisis(general=55))
+    return practicas
+
+
+async def collect(repositories, user_id, filtro, batch_size):
+    return [batch async for batch in repositories.practices.stream_export(user_id, filtro, batch_size)]
+
+
+async def test_stream_export_in_batches_newest_first(repositories):
+    user_id = uuid.uuid4()
+    practicas = await save_history(repositories, user_id)
+
+    batches = await collect(repositories, user_id, PracticeExportFilter(), batch_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row.practice_id for row in rows] == [p.practice_id for p in reversed(practicas)]
+    oldest = rows[-1]
+    assert oldest.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert (oldest.puntuacion_general, oldest.fortalezas) == (55, "Trazo firme.")
+    assert rows[0].estado_analisis == EstadoAnalisis.PENDIENTE
+    assert rows[0].puntuacion_general is None and rows[0].areas_mejora is None
+
+
+async def test_stream_export_filters(repositories):
+    user_id = uuid.uuid4()
+    practicas = await save_history(repositories, user_id)
+    # `desde` incluida, `hasta` excluida
+    filtro = PracticeExportFilter(
+        letra=LetraPermitida.a, desde=BASE, hasta=BASE + datetime.timedelta(hours=3)
+    )
+
+    rows = [row for batch in await collect(repositories, user_id, filtro, batch_size=10) for row in batch]
+
+    assert [row.practice_id for row in rows] == [practicas[2].practice_id, practicas[0].practice_id]
+    assert await collect(repositories, uuid.uuid4(), PracticeExportFilter(), batch_size=10) == []
+
+
+async def test_stream_export_closed_early_releases_connection(repositories):
+    user_id = uuid.uuid4()
+    await save_history(repositories, user_id)
+
+    stream = repositories.practices.stream_export(user_id, PracticeExportFilter(), 2)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert len(first) == 2
+    # La sesión sigue utilizable tras cerrar el cursor a medias
+    assert await repositories.practices.find_by_id(first[0].practice_id) is not None
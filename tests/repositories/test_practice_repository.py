@@ -0,0 +1,206 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+from src.ports.repositories.read_models import CompletionOutcome, DeletionOutcome, HistoryCursor
+from tests.factories import make_analisis, make_practica, make_trabajo
+
+pytestmark = pytest.mark.anyio
+
+
+async def count_rows(session_factory, table: str) -> int:
+    async with session_factory() as session:
+        return (await session.execute(text(f"SELECT COUNT(*) FROM {table}"))).scalar_one()
+
+
+async def test_save_and_find_by_id(repositories):
+    practica = make_practica()
+    await repositories.practices.save(practica)
+
+    found = await repositories.practices.find_by_id(practica.practice_id)
+
+    assert found is not None
+    assert found.practice_id == practica.practice_id
+    assert found.user_id == practica.user_id
+    assert found.estado_analisis == EstadoAnalisis.PENDIENTE
+    assert found.analisis is None
+    assert await repositories.practices.find_by_id(uuid.uuid4()) is None
+
+
+async def test_save_with_job_persists_practice_and_job(repositories):
+    practica = make_practica()
+    await repositories.practices.save_with_job(practica, make_trabajo(practica))
+
+    assert await repositories.practices.find_by_id(practica.practice_id) is not None
+    trabajo = await repositories.jobs.claim_next(visibility_timeout=60)
+    assert trabajo is not None
+    assert trabajo.practice_id == practica.practice_id
+
+
+async def test_save_with_job_is_atomic(repositories_factory):
+    primera = make_practica()
+    trabajo = make_trabajo(primera)
+    segunda = make_practica()
+    async with repositories_factory() as repositories:
+        await repositories.practices.save_with_job(primera, trabajo)
+        # El trabajo repite la clave primaria: falla el INSERT y no debe quedar la práctica sin trabajo
+        with pytest.raises(IntegrityError):
+            await repositories.practices.save_with_job(segunda, make_trabajo(segunda, job_id=trabajo.job_id))
+
+    async with repositories_factory() as repositories:
+        assert await repositories.practices.find_by_id(primera.practice_id) is not None
+        assert await repositories.practices.find_by_id(segunda.practice_id) is None
+
+
+async def test_save_many_with_jobs_completes_reused_results(repositories):
+    user_id = uuid.uuid4()
+    reutilizada = make_practica(user_id=user_id)
+    reutilizada.marcar_como_completada(make_analisis(general=90))
+    pendiente = make_practica(user_id=user_id, letra=LetraPermitida.b)
+
+    await repositories.practices.save_many_with_jobs([reutilizada, pendiente], [make_trabajo(pendiente)])
+
+    found = await repositories.practices.find_by_id(reutilizada.practice_id)
+    assert found.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert found.analisis.puntuacion_general == 90
+    stats = await repositories.practices.get_letter_stats(user_id)
+    assert [(s.letra_plantilla, s.intentos) for s in stats] == [(LetraPermitida.a, 1)]
+    trabajo = await repositories.jobs.claim_next(visibility_timeout=60)
+    assert trabajo.practice_id == pendiente.practice_id
+    assert await repositories.jobs.claim_next(visibility_timeout=60) is None
+
+
+async def test_complete_if_pending(repositories):
+    practica = make_practica()
+    await repositories.practices.save(practica)
+
+    completion = await repositories.practices.complete_if_pending(practica.practice_id, make_analisis(general=75))
+    assert completion.outcome == CompletionOutcome.COMPLETED
+    assert completion.practica.estado_analisis == EstadoAnalisis.COMPLETADO
+
+    # Un segundo resultado (p. ej. un reintento del servicio) no sobrescribe el primero
+    repeated = await repositories.practices.complete_if_pending(practica.practice_id, make_analisis(general=10))
+    assert repeated.outcome == CompletionOutcome.NOT_PENDING
+    missing = await repositories.practices.complete_if_pending(uuid.uuid4(), make_analisis())
+    assert missing.outcome == CompletionOutcome.NOT_FOUND
+
+    found = await repositories.practices.find_by_id(practica.practice_id)
+    assert found.analisis.puntuacion_general == 75
+    stats = await repositories.practices.get_letter_stats(practica.user_id)
+    assert stats[0].intentos == 1
+    assert stats[0].general.suma == 75
+
+
+async def test_fail_if_pending(repositories):
+    pendiente = make_practica()
+    completada = make_practica()
+    await repositories.practices.save_many([pendiente, completada])
+    await repositories.practices.complete_if_pending(completada.practice_id, make_analisis(general=60))
+
+    assert await repositories.practices.fail_if_pending(pendiente.practice_id) == CompletionOutcome.COMPLETED
+    assert await repositories.practices.fail_if_pending(pendiente.practice_id) == CompletionOutcome.NOT_PENDING
+    # Una práctica ya completada conserva su resultado
+    assert await repositories.practices.fail_if_pending(completada.practice_id) == CompletionOutcome.NOT_PENDING
+    assert await repositories.practices.fail_if_pending(uuid.uuid4()) == CompletionOutcome.NOT_FOUND
+
+    assert (await repositories.practices.find_by_id(pendiente.practice_id)).estado_analisis == EstadoAnalisis.ERROR
+    found = await repositories.practices.find_by_id(completada.practice_id)
+    assert found.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert found.analisis.puntuacion_general == 60
+
+
+async def test_history_keyset_paging(repositories):
+    user_id = uuid.uuid4()
+    base = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    # Dos prácticas con la misma fecha: el desempate es practice_id
+    fechas = [base, base, base - datetime.timedelta(minutes=1), base - datetime.timedelta(minutes=2), base + datetime.timedelta(minutes=1)]
+    practicas = [make_practica(user_id=user_id, fecha_carga=fecha) for fecha in fechas]
+    await repositories.practices.save_many(practicas)
+    await repositories.practices.save(make_practica())  # De otro usuario
+
+    expected = [p.practice_id for p in sorted(practicas, key=lambda p: (p.fecha_carga, p.practice_id), reverse=True)]
+    seen = []
+    cursor = None
+    while True:
+        page = await repositories.practices.find_history_page(user_id, limit=2, cursor=cursor)
+        seen.extend(row.practice_id for row in page)
+        if len(page) < 2:
+            break
+        cursor = HistoryCursor(page[-1].fecha_carga, page[-1].practice_id)
+
+    assert seen == expected
+
+async def test_complete_many_if_pending(repositories):
+    user_id = uuid.uuid4()
+    pendiente = make_practica(user_id=user_id)
+    fallida = make_practica(user_id=user_id, letra=LetraPermitida.b)
+    fallida.marcar_como_fallida()
+    await repositories.practices.save_many([pendiente, fallida])
+
+    completions = await repositories.practices.complete_many_if_pending([
+        (pendiente.practice_id, make_analisis(general=60)),
+        (fallida.practice_id, make_analisis()),
+        (uuid.uuid4(), make_analisis()),
+        # Repetida en el mismo lote: solo la primera aparición la completa
+        (pendiente.practice_id, make_analisis(general=10)),
+    ])
+
+    assert [c.outcome for c in completions] == [
+        CompletionOutcome.COMPLETED, CompletionOutcome.NOT_PENDING, CompletionOutcome.NOT_FOUND, CompletionOutcome.NOT_PENDING
+    ]
+    assert completions[0].practica.analisis.puntuacion_general == 60
+    found = await repositories.practices.find_by_id(pendiente.practice_id)
+    assert found.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert found.analisis.puntuacion_general == 60
+    assert (await repositories.practices.find_by_id(fallida.practice_id)).estado_analisis == EstadoAnalisis.ERROR
+    stats = await repositories.practices.get_letter_stats(user_id)
+    assert [(s.letra_plantilla, s.intentos, s.general.suma) for s in stats] == [(LetraPermitida.a, 1, 60)]
+
+
+async def test_delete_checks_owner_and_cascades(repositories, session_factory):
+    user_id = uuid.uuid4()
+    primera = make_practica(user_id=user_id)
+    segunda = make_practica(user_id=user_id)
+    pendiente = make_practica(user_id=user_id, letra=LetraPermitida.b)
+    await repositories.practices.save_many_with_jobs([primera, segunda, pendiente], [make_trabajo(pendiente)])
+    await repositories.practices.complete_if_pending(primera.practice_id, make_analisis(general=40))
+    await repositories.practices.complete_if_pending(segunda.practice_id, make_analisis(general=80))
+
+    assert await repositories.practices.delete(primera.practice_id, uuid.uuid4()) == DeletionOutcome.FORBIDDEN
+    assert await repositories.practices.delete(uuid.uuid4(), user_id) == DeletionOutcome.NOT_FOUND
+    assert await repositories.practices.delete(primera.practice_id, user_id) == DeletionOutcome.DELETED
+    assert await repositories.practices.delete(pendiente.practice_id, user_id) == DeletionOutcome.DELETED
+
+    assert await repositories.practices.find_by_id(primera.practice_id) is None
+    assert await count_rows(session_factory, "analyses") == 1
+    assert await count_rows(session_factory, "analysis_jobs") == 0
+    # El resumen de la letra se recalcula con las prácticas completadas que quedan
+    stats = await repositories.practices.get_letter_stats(user_id)
+    assert [(s.letra_plantilla, s.intentos, s.general.suma) for s in stats] == [(LetraPermitida.a, 1, 80)]
+    assert stats[0].ultima_practice_id == segunda.practice_id
+
+
+async def test_purge_user_batch(repositories, session_factory):
+    user_id = uuid.uuid4()
+    practicas = [make_practica(user_id=user_id) for _ in range(3)]
+    otra = make_practica()
+    await repositories.practices.save_many_with_jobs(practicas + [otra], [make_trabajo(practicas[2])])
+    for practica in practicas[:2] + [otra]:
+        await repositories.practices.complete_if_pending(practica.practice_id, make_analisis())
+
+    first = await repositories.practices.purge_user_batch(user_id, limit=2)
+    assert len(first) == 2
+    # Mientras quedan prácticas, el resumen por letra se conserva
+    assert await repositories.practices.get_letter_stats(user_id) != []
+    second = await repositories.practices.purge_user_batch(user_id, limit=2)
+
+    assert set(first + second) == {p.practice_id for p in practicas}
+    assert await repositories.practices.get_letter_stats(user_id) == []
+    assert await repositories.practices.find_by_id(otra.practice_id) is not None
+    assert await count_rows(session_factory, "practices") == 1
+    assert await count_rows(session_factory, "analyses") == 1
+    assert await count_rows(session_factory, "analysis_jobs") == 0
@@ -0,0 +1,30 @@
+import hashlib
+import io
+
+import pytest
+
+from tests.factories import PNG
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_save_file_is_content_addressed(file_storage, tmp_path):
+    first = await file_storage.save_file(io.BytesIO(PNG), content_type="image/png")
+    again = await file_storage.save_file(io.BytesIO(PNG), content_type="image/png")
+    other = await file_storage.save_file(io.BytesIO(PNG + b"\x00"), content_type="image/png")
+
+    assert first == again
+    assert first.sha256 == hashlib.sha256(PNG).hexdigest()
+    assert first.size == len(PNG)
+    assert first.url == f"/media/{first.key}"
+    assert other.key != first.key
+    assert await file_storage.read(first.key) == PNG
+    # Los temporales se descartan, también el del duplicado
+    assert list((tmp_path / "media" / ".tmp").iterdir()) == []
+
+
+async def test_read_rejects_unknown_and_escaping_keys(file_storage):
+    with pytest.raises(FileNotFoundError):
+        await file_storage.read("images/00/no-existe.png")
+    with pytest.raises(FileNotFoundError):
+        await file_storage.read("../trace.db")
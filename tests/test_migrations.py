@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+from src.config import settings
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_migrations_match_models(tmp_path, monkeypatch):
+    """Las migraciones crean en SQLite el mismo esquema que los modelos con los que se prueban los repositorios."""
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path / 'trace.db'}")
+    # Sin archivo .ini: env.py no reconfigura el logging de las demás pruebas
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+
+    command.upgrade(config, "head")
+    # Falla si autogenerate detecta diferencias entre la base de datos migrada y los modelos
+    command.check(config)
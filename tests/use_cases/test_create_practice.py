@@ -0,0 +1,78 @@
+import hashlib
+import uuid
+
+import pytest
+
+from src.config import settings
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida
+from src.ports.repositories.read_models import AnalysisResultKey
+from src.use_cases.create_practice import MENSAJE_EN_COLA, MENSAJE_REUTILIZADO, CreatePracticeUseCase
+from src.use_cases.create_practice_batch import CreatePracticeBatchUseCase, PracticeBatchItem
+from tests.factories import PNG, make_resultado, make_upload
+
+pytestmark = pytest.mark.anyio
+
+
+def result_key(content: bytes, letra: LetraPermitida) -> AnalysisResultKey:
+    return AnalysisResultKey(hashlib.sha256(content).hexdigest(), letra, settings.get_analysis_result_version())
+
+
+async def test_create_practice_queues_analysis(repositories, file_storage):
+    use_case = CreatePracticeUseCase(repositories.practices, file_storage, repositories.analysis_results)
+
+    response = await use_case.execute(uuid.uuid4(), LetraPermitida.a, make_upload(), content_type="image/png")
+
+    assert response.estado_analisis == EstadoAnalisis.PENDIENTE
+    assert response.mensaje == MENSAJE_EN_COLA
+    practica = await repositories.practices.find_by_id(uuid.UUID(response.practice_id))
+    assert practica.estado_analisis == EstadoAnalisis.PENDIENTE
+    trabajo = await repositories.jobs.claim_next(visibility_timeout=60)
+    assert trabajo.practice_id == practica.practice_id
+    assert await file_storage.read(trabajo.imagen_key) == PNG
+
+
+async def test_create_practice_reuses_result_without_job(repositories, file_storage):
+    await repositories.analysis_results.save(result_key(PNG, LetraPermitida.a), make_resultado(general=64))
+    use_case = CreatePracticeUseCase(repositories.practices, file_storage, repositories.analysis_results)
+    user_id = uuid.uuid4()
+
+    response = await use_case.execute(user_id, LetraPermitida.a, make_upload())
+
+    assert response.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert response.mensaje == MENSAJE_REUTILIZADO
+    practica = await repositories.practices.find_by_id(uuid.UUID(response.practice_id))
+    assert practica.analisis.puntuacion_general == 64
+    assert [s.intentos for s in await repositories.practices.get_letter_stats(user_id)] == [1]
+    assert await repositories.jobs.claim_next(visibility_timeout=60) is None
+
+
+async def test_create_batch_looks_up_results_once(repositories, file_storage):
+    otra_imagen = PNG + b"\x00"
+    await repositories.analysis_results.save(result_key(PNG, LetraPermitida.a), make_resultado())
+    calls = []
+    find_many = repositories.analysis_results.find_many
+
+    async def counting_find_many(keys):
+        calls.append(list(keys))
+        return await find_many(keys)
+
+    repositories.analysis_results.find_many = counting_find_many
+    use_case = CreatePracticeBatchUseCase(repositories.practices, file_storage, repositories.analysis_results)
+    items = [
+        PracticeBatchItem(LetraPermitida.a, make_upload(PNG)),
+        PracticeBatchItem(LetraPermitida.b, make_upload(PNG)),
+        PracticeBatchItem(LetraPermitida.a, make_upload(otra_imagen)),
+    ]
+
+    responses = await use_case.execute(uuid.uuid4(), items)
+
+    assert len(calls) == 1 and len(calls[0]) == 3
+    assert [r.estado_analisis for r in responses] == [
+        EstadoAnalisis.COMPLETADO, EstadoAnalisis.PENDIENTE, EstadoAnalisis.PENDIENTE
+    ]
+    claimed = {
+        (await repositories.jobs.claim_next(visibility_timeout=60)).practice_id,
+        (await repositories.jobs.claim_next(visibility_timeout=60)).practice_id,
+    }
+    assert claimed == {uuid.UUID(responses[1].practice_id), uuid.UUID(responses[2].practice_id)}
+    assert await repositories.jobs.claim_next(visibility_timeout=60) is None
@@ -0,0 +1,47 @@
+import uuid
+
+import pytest
+
+from src.use_cases.delete_practice import DeletePracticeUseCase
+from src.use_cases.purge_user_practices import PurgeUserPracticesUseCase
+from tests.factories import make_practica
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_delete_practice(repositories):
+    practica = make_practica()
+    await repositories.practices.save(practica)
+    use_case = DeletePracticeUseCase(repositories.practices)
+
+    with pytest.raises(PermissionError):
+        await use_case.execute(practica.practice_id, uuid.uuid4())
+    await use_case.execute(practica.practice_id, practica.user_id)
+    with pytest.raises(FileNotFoundError):
+        await use_case.execute(practica.practice_id, practica.user_id)
+    assert await repositories.practices.find_by_id(practica.practice_id) is None
+
+
+@pytest.mark.parametrize("count", [0, 4, 5])
+async def test_purge_user_practices_in_batches(repositories, count):
+    user_id = uuid.uuid4()
+    await repositories.practices.save_many([make_practica(user_id=user_id) for _ in range(count)])
+    calls = []
+    purge_user_batch = repositories.practices.purge_user_batch
+
+    async def counting_purge_user_batch(user_id, limit):
+        deleted = await purge_user_batch(user_id, limit)
+        calls.append(len(deleted))
+        return deleted
+
+    repositories.practices.purge_user_batch = counting_purge_user_batch
+    use_case = PurgeUserPracticesUseCase(repositories.practices, batch_size=2, pause=0)
+
+    assert await use_case.execute(user_id) == count
+    # Un lote incompleto indica que no quedan más
+    assert calls == [2] * (count // 2) + [count % 2]
+
+
+async def test_purge_rejects_empty_batches(repositories):
+    with pytest.raises(ValueError):
+        PurgeUserPracticesUseCase(repositories.practices, batch_size=0, pause=0)
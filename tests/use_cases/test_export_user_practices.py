@@ -0,0 +1,51 @@
+import csv
+import datetime
+import io
+import json
+import uuid
+
+import pytest
+
+from src.adapters.api.export import EXPORT_COLUMNS, csv_chunk, csv_header, ndjson_chunk
+from src.domain.value_objects.enums import LetraPermitida
+from src.use_cases.export_user_practices import ExportUserPracticesUseCase, build_export_filter
+from tests.factories import make_analisis, make_practica
+
+pytestmark = pytest.mark.anyio
+
+
+def test_build_export_filter_converts_to_utc():
+    madrid = datetime.timezone(datetime.timedelta(hours=2))
+    filtro = build_export_filter(
+        letra=LetraPermitida.b, desde=datetime.datetime(2024, 5, 1, 10, tzinfo=madrid), hasta=datetime.datetime(2024, 5, 2)
+    )
+
+    assert filtro.letra == LetraPermitida.b
+    assert filtro.desde == datetime.datetime(2024, 5, 1, 8)
+    assert filtro.hasta == datetime.datetime(2024, 5, 2)
+    with pytest.raises(ValueError):
+        build_export_filter(desde=datetime.datetime(2024, 5, 2), hasta=datetime.datetime(2024, 5, 2))
+
+
+async def test_export_serializes_ndjson_and_csv(repositories):
+    user_id = uuid.uuid4()
+    completada = make_practica(user_id=user_id, fecha_carga=datetime.datetime(2024, 1, 1))
+    pendiente = make_practica(user_id=user_id, fecha_carga=datetime.datetime(2024, 1, 2))
+    await repositories.practices.save_many([completada, pendiente])
+    await repositories.practices.complete_if_pending(completada.practice_id, make_analisis(general=66))
+    use_case = ExportUserPracticesUseCase(repositories.practices, batch_size=1)
+
+    batches = [rows async for rows in use_case.execute(user_id, build_export_filter())]
+
+    assert [len(rows) for rows in batches] == [1, 1]
+    objetos = [json.loads(line) for rows in batches for line in ndjson_chunk(rows).decode().splitlines()]
+    assert [o["practice_id"] for o in objetos] == [str(pendiente.practice_id), str(completada.practice_id)]
+    assert objetos[0]["puntuacion_general"] is None
+    assert objetos[1]["puntuacion_general"] == 66
+    assert objetos[1]["fecha_carga"] == "2024-01-01T00:00:00"
+
+    contenido = csv_header() + b"".join(csv_chunk(rows) for rows in batches)
+    filas = list(csv.reader(io.StringIO(contenido.decode())))
+    assert filas[0] == list(EXPORT_COLUMNS)
+    assert filas[1][EXPORT_COLUMNS.index("puntuacion_general")] == ""
+    assert filas[2][EXPORT_COLUMNS.index("estado_analisis")] == "completado"
@@ -0,0 +1,57 @@
+import uuid
+
+import pytest
+
+from src.domain.value_objects.enums import EstadoAnalisis
+from src.use_cases.fail_practice_analysis import FailPracticeAnalysisUseCase
+from src.use_cases.update_practice_analysis import UpdatePracticeAnalysisUseCase
+from tests.factories import make_practica, make_resultado
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_fail_marks_pending_practice_as_error(repositories):
+    practica = make_practica()
+    await repositories.practices.save(practica)
+
+    await FailPracticeAnalysisUseCase(repositories.practices).execute(practica.practice_id)
+
+    assert (await repositories.practices.find_by_id(practica.practice_id)).estado_analisis == EstadoAnalisis.ERROR
+    with pytest.raises(FileNotFoundError):
+        await FailPracticeAnalysisUseCase(repositories.practices).execute(uuid.uuid4())
+
+
+async def test_completion_wins_the_race_against_failure(repositories_factory):
+    practica = make_practica()
+    async with repositories_factory() as worker_repositories:
+        await worker_repositories.practices.save(practica)
+        practices = worker_repositories.practices
+        find_by_id, fail_if_pending = practices.find_by_id, practices.fail_if_pending
+
+        async def complete_from_api():
+            # El resultado llega por PUT /practices/{id}/analysis mientras el worker se da por vencido
+            async with repositories_factory() as api_repositories:
+                await UpdatePracticeAnalysisUseCase(api_repositories.practices).execute(
+                    practica.practice_id, make_resultado(general=70)
+                )
+
+        # Tanto si el caso de uso lee antes de escribir como si no, la práctica se completa antes de su escritura
+        async def find_by_id_then_complete(practice_id):
+            found = await find_by_id(practice_id)
+            await complete_from_api()
+            return found
+
+        async def complete_then_fail_if_pending(practice_id):
+            await complete_from_api()
+            return await fail_if_pending(practice_id)
+
+        practices.find_by_id = find_by_id_then_complete
+        practices.fail_if_pending = complete_then_fail_if_pending
+
+        with pytest.raises(ValueError):
+            await FailPracticeAnalysisUseCase(practices).execute(practica.practice_id)
+
+    async with repositories_factory() as repositories:
+        found = await repositories.practices.find_by_id(practica.practice_id)
+    assert found.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert found.analisis.puntuacion_general == 70
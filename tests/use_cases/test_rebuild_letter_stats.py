@@ -0,0 +1,53 @@
+import uuid
+
+import pytest
+from sqlalchemy import delete
+
+from src.adapters.repositories.db_models import PracticeLetterStatsDB
+from src.use_cases.get_letter_stats import GetLetterStatsUseCase
+from src.use_cases.rebuild_letter_stats import RebuildLetterStatsUseCase
+from tests.factories import make_analisis, make_practica
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_rebuild_all_users_in_batches(repositories, session_factory):
+    user_ids = [uuid.uuid4() for _ in range(3)]
+    for user_id in user_ids:
+        for general in (40, 80):
+            practica = make_practica(user_id=user_id)
+            await repositories.practices.save(practica)
+            await repositories.practices.complete_if_pending(practica.practice_id, make_analisis(general=general))
+    # Como si la migración no hubiera visto ninguno de estos análisis
+    async with session_factory() as session:
+        await session.execute(delete(PracticeLetterStatsDB))
+        await session.commit()
+    use_case = RebuildLetterStatsUseCase(repositories.practices, batch_size=2, pause=0)
+
+    assert await use_case.execute() == 3
+    for user_id in user_ids:
+        [progress] = await GetLetterStatsUseCase(repositories.practices).execute(user_id)
+        assert progress.intentos == 2
+        assert progress.puntuacion_general.promedio == 60
+    # Repetirlo no cambia nada
+    assert await use_case.execute() == 3
+    assert (await GetLetterStatsUseCase(repositories.practices).execute(user_ids[0]))[0].intentos == 2
+
+
+async def test_rebuild_one_user(repositories, session_factory):
+    practica = make_practica()
+    otra = make_practica()
+    for current in (practica, otra):
+        await repositories.practices.save(current)
+        await repositories.practices.complete_if_pending(current.practice_id, make_analisis(general=70))
+    async with session_factory() as session:
+        await session.execute(delete(PracticeLetterStatsDB))
+        await session.commit()
+
+    use_case = RebuildLetterStatsUseCase(repositories.practices, batch_size=10, pause=0)
+    assert await use_case.execute(practica.user_id) == 1
+
+    assert len(await repositories.practices.get_letter_stats(practica.user_id)) == 1
+    assert await repositories.practices.get_letter_stats(otra.user_id) == []
+    with pytest.raises(ValueError):
+        RebuildLetterStatsUseCase(repositories.practices, batch_size=0, pause=0)
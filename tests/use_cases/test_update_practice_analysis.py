@@ -0,0 +1,48 @@
+import uuid
+
+import pytest
+
+from src.domain.value_objects.enums import EstadoAnalisis
+from src.use_cases.dtos import AnalysisIngestItemDTO, ResultadoIngesta
+from src.use_cases.ingest_analysis_results import IngestAnalysisResultsUseCase
+from src.use_cases.update_practice_analysis import UpdatePracticeAnalysisUseCase
+from tests.factories import make_analisis, make_practica, make_resultado
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_update_completes_pending_practice_once(repositories):
+    practica = make_practica()
+    await repositories.practices.save(practica)
+    use_case = UpdatePracticeAnalysisUseCase(repositories.practices)
+
+    response = await use_case.execute(practica.practice_id, make_resultado(general=70))
+
+    assert response.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert response.analisis.puntuacion_general == 70
+    with pytest.raises(ValueError):
+        await use_case.execute(practica.practice_id, make_resultado(general=20))
+    with pytest.raises(FileNotFoundError):
+        await use_case.execute(uuid.uuid4(), make_resultado())
+    found = await repositories.practices.find_by_id(practica.practice_id)
+    assert found.analisis.puntuacion_general == 70
+
+
+async def test_ingest_reports_each_item(repositories):
+    pendiente = make_practica()
+    completada = make_practica()
+    await repositories.practices.save_many([pendiente, completada])
+    await repositories.practices.complete_if_pending(completada.practice_id, make_analisis())
+    items = [
+        AnalysisIngestItemDTO(practice_id=practice_id, **make_resultado().model_dump())
+        for practice_id in (pendiente.practice_id, completada.practice_id, uuid.uuid4())
+    ]
+
+    response = await IngestAnalysisResultsUseCase(repositories.practices).execute(items)
+
+    assert (response.total, response.aplicados, response.ya_completadas, response.no_encontradas) == (3, 1, 1, 1)
+    assert [r.resultado for r in response.resultados] == [
+        ResultadoIngesta.APLICADO, ResultadoIngesta.YA_COMPLETADA, ResultadoIngesta.NO_ENCONTRADA
+    ]
+    assert response.resultados[0].practice_id == str(pendiente.practice_id)
+    assert (await repositories.practices.find_by_id(pendiente.practice_id)).estado_analisis == EstadoAnalisis.COMPLETADO
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import io
+import logging
+
+import pytest
+
+from src.adapters.clients import AnalysisServiceError
+from src.adapters.workers.analysis_worker import AnalysisWorkerPool
+from src.domain.value_objects.enums import EstadoAnalisis
+from src.ports.repositories.read_models import AnalysisResultKey
+from tests.factories import PNG, make_analisis, make_practica, make_resultado, make_trabajo
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeAnalysisClient:
+    """Responde como analysis-service y cuenta las llamadas."""
+
+    def __init__(self, score: int = 77):
+        self.score = score
+        self.calls = []
+
+    def retry_after(self) -> float:
+        return 0.0
+
+    async def analyze_letter(self, letter_char, image_bytes, filename=None, content_type=None):
+        self.calls.append((letter_char, image_bytes))
+        return {"metricas_detalle": {"score_global": self.score, "fortalezas_base": "Bien", "areas_mejora_base": "Mejor"}}
+
+
+async def run_until_processed(pool, repositories_factory, practica, timeout=5.0):
+    async def processed():
+        while True:
+            async with repositories_factory() as repositories:
+                found = await repositories.practices.find_by_id(practica.practice_id)
+                if found.estado_analisis != EstadoAnalisis.PENDIENTE:
+                    return found
+            await asyncio.sleep(0.01)
+
+    await pool.start()
+    try:
+        return await asyncio.wait_for(processed(), timeout=timeout)
+    finally:
+        await pool.stop()
+
+
+async def enqueue(repositories_factory, file_storage):
+    stored = await file_storage.save_file(io.BytesIO(PNG), content_type="image/png")
+    practica = make_practica()
+    async with repositories_factory() as repositories:
+        await repositories.practices.save_with_job(practica, make_trabajo(practica, imagen_key=stored.key))
+    return practica
+
+
+def make_pool(client, repositories_factory, file_storage, model_version="1", max_attempts=3):
+    return AnalysisWorkerPool(
+        client, repositories_factory, file_storage, workers=1, poll_interval=0.01,
+        model_version=model_version, max_attempts=max_attempts,
+    )
+
+
+def result_key(practica, version="1"):
+    return AnalysisResultKey(hashlib.sha256(PNG).hexdigest(), practica.letra_plantilla, version)
+
+
+async def test_memoized_result_skips_the_client(repositories_factory, file_storage):
+    practica = await enqueue(repositories_factory, file_storage)
+    async with repositories_factory() as repositories:
+        await repositories.analysis_results.save(result_key(practica), make_resultado(general=42))
+    client = FakeAnalysisClient()
+
+    found = await run_until_processed(make_pool(client, repositories_factory, file_storage), repositories_factory, practica)
+
+    assert client.calls == []
+    assert found.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert found.analisis.puntuacion_general == 42
+    async with repositories_factory() as repositories:
+        assert await repositories.jobs.claim_next(visibility_timeout=60) is None
+
+
+async def test_new_result_is_memoized_under_the_model_version(repositories_factory, file_storage):
+    practica = await enqueue(repositories_factory, file_storage)
+    async with repositories_factory() as repositories:
+        # Resultado de otra versión del modelo: no se reutiliza
+        await repositories.analysis_results.save(result_key(practica, version="1"), make_resultado(general=42))
+    client = FakeAnalysisClient(score=77)
+
+    found = await run_until_processed(
+        make_pool(client, repositories_factory, file_storage, model_version="2"), repositories_factory, practica
+    )
+
+    assert client.calls == [(practica.letra_plantilla.value, PNG)]
+    assert found.analisis.puntuacion_general == 77
+    async with repositories_factory() as repositories:
+        memoized = await repositories.analysis_results.find(result_key(practica, version="2"))
+    assert memoized.puntuacion_general == 77
+
+
+class CompletedMeanwhileClient(FakeAnalysisClient):
+    """Falla sin reintentos, pero el resultado llega por otra vía mientras el worker esperaba la respuesta."""
+
+    def __init__(self, repositories_factory, practica):
+        super().__init__()
+        self.repositories_factory = repositories_factory
+        self.practica = practica
+
+    async def analyze_letter(self, letter_char, image_bytes, filename=None, content_type=None):
+        self.calls.append((letter_char, image_bytes))
+        async with self.repositories_factory() as repositories:
+            await repositories.practices.complete_if_pending(self.practica.practice_id, make_analisis(general=64))
+        raise AnalysisServiceError("Error 400 del servicio de análisis", status="400")
+
+
+async def test_failed_job_keeps_a_practice_completed_meanwhile(repositories_factory, file_storage, caplog):
+    practica = await enqueue(repositories_factory, file_storage)
+    client = CompletedMeanwhileClient(repositories_factory, practica)
+
+    async def job_failed():
+        # El worker se da por vencido después de que la práctica se completara
+        while not any("ya no estaba pendiente" in record.getMessage() for record in caplog.records):
+            await asyncio.sleep(0.01)
+
+    caplog.set_level(logging.INFO, logger="src.adapters.workers.analysis_worker")
+    pool = make_pool(client, repositories_factory, file_storage, max_attempts=1)
+    await pool.start()
+    try:
+        await asyncio.wait_for(job_failed(), timeout=5.0)
+    finally:
+        await pool.stop()
+
+    async with repositories_factory() as repositories:
+        found = await repositories.practices.find_by_id(practica.practice_id)
+    assert found.estado_analisis == EstadoAnalisis.COMPLETADO
+    assert found.analisis.puntuacion_general == 64
+    async with repositories_factory() as repositories:
+        assert await repositories.jobs.claim_next(visibility_timeout=60) is None
@@ -0,0 +1,315 @@
+"""
+Microbenchmark del mapeo de filas de la base de datos a la respuesta JSON.
+
+Compara el coste por fila de tres caminos:
+
+- validado: el de antes. Los DTOs se validan al construirlos y FastAPI los vuelca a dict, los valida otra
+  vez contra `response_model` y los serializa, porque la ruta devuelve el DTO.
+- directo: el del servicio. Cada DTO se valida una sola vez (la página del historial, en una llamada a
+  pydantic-core) y se serializa sin revalidar con `dto_response`.
+- construct: como el directo, pero con `model_construct` (sin validación) para entidades y DTOs. Se mide
+  como referencia: con pydantic 2, `model_construct` es Python puro y resulta más lento que validar en
+  pydantic-core, así que el servicio no lo usa.
+
+Se mide sobre listas del tamaño de una página del historial (por defecto, 50 y 200 filas):
+
+    python -m tools.bench_mapping
+    python -m tools.bench_mapping --rows 50 200 1000 --repeat 7 --output benchmarks/mapping.json
+
+No necesita base de datos: las filas se generan en memoria con los mismos tipos que devuelven las columnas.
+"""
+import argparse
+import datetime
+import json
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.adapters.api.responses import dto_response  # noqa: E402
+from src.adapters.repositories.db_models import AnalisisDB, PracticeDB  # noqa: E402
+from src.adapters.repositories.mappers import practice_db_to_entity  # noqa: E402
+from src.domain.entities.analisis import Analisis  # noqa: E402
+from src.domain.entities.practica import Practica  # noqa: E402
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida  # noqa: E402
+from src.ports.repositories.read_models import PracticeHistoryRow  # noqa: E402
+from src.use_cases.dto_mappers import practice_history_dtos, practice_result_dto  # noqa: E402
+from src.use_cases.dtos import AnalisisDetailDTO, PracticeHistoryDTO, PracticeResultDTO  # noqa: E402
+
+LETTERS = list(LetraPermitida)
+_HISTORY_ADAPTER = TypeAdapter(List[PracticeHistoryDTO])
+_RESULT_ADAPTER = TypeAdapter(PracticeResultDTO)
+
+
+# --- Datos ---
+
+def make_history_rows(count: int) -> List[PracticeHistoryRow]:
+    now = datetime.datetime.utcnow()
+    return [
+        PracticeHistoryRow(
+            practice_id=uuid.uuid4(),
+            letra_plantilla=random.choice(LETTERS),
+            fecha_carga=now - datetime.timedelta(minutes=i),
+            puntuacion_general=random.randint(0, 100) if i % 4 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def make_practice_rows(count: int) -> List[PracticeDB]:
+    """Modelos SQLAlchemy transitorios, con su análisis, como los que carga `find_by_id`."""
+    rows = []
+    user_id = uuid.uuid4()
+    for i in range(count):
+        practice = PracticeDB(
+            practice_id=uuid.uuid4(),
+            user_id=user_id,
+            letra_plantilla=random.choice(LETTERS),
+            url_imagen=f"/media/images/{i:02x}/{uuid.uuid4().hex}.png",
+            fecha_carga=datetime.datetime.utcnow(),
+            estado_analisis=EstadoAnalisis.COMPLETADO,
+        )
+        practice.analisis = AnalisisDB(
+            analisis_id=uuid.uuid4(),
+            practice_id=practice.practice_id,
+            puntuacion_general=random.randint(0, 100),
+            puntuacion_proporcion=random.randint(0, 100),
+            puntuacion_inclinacion=random.randint(0, 100),
+            puntuacion_espaciado=random.randint(0, 100),
+            puntuacion_consistencia=random.randint(0, 100),
+            fortalezas="Trazo firme y proporciones regulares.",
+            areas_mejora="Mantener la inclinación en las letras con bucle.",
+        )
+        rows.append(practice)
+    return rows
+
+
+# --- Camino validado (referencia) ---
+
+def _response_model_json(adapter: TypeAdapter, content) -> bytes:
+    """Lo que hace FastAPI con `response_model`: volcar a dict, validar, serializar y `json.dumps`."""
+    if isinstance(content, list):
+        dumped = [item.model_dump(by_alias=True) for item in content]
+    else:
+        dumped = content.model_dump(by_alias=True)
+    validated = adapter.validate_python(dumped)
+    payload = adapter.dump_python(validated, mode="json", by_alias=True)
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def validated_history(rows: List[PracticeHistoryRow]) -> bytes:
+    items = [
+        PracticeHistoryDTO(
+            practice_id=str(row.practice_id),
+            letra_plantilla=row.letra_plantilla,
+            fecha_carga=row.fecha_carga,
+            puntuacion_general=row.puntuacion_general,
+        )
+        for row in rows
+    ]
+    return _response_model_json(_HISTORY_ADAPTER, items)
+
+
+def validated_result(practice_db: PracticeDB) -> bytes:
+    analisis_db = practice_db.analisis
+    practica = Practica(
+        practice_id=practice_db.practice_id,
+        user_id=practice_db.user_id,
+        letra_plantilla=practice_db.letra_plantilla,
+        url_imagen=practice_db.url_imagen,
+        fecha_carga=practice_db.fecha_carga,
+        estado_analisis=practice_db.estado_analisis,
+        analisis=Analisis(
+            analisis_id=analisis_db.analisis_id,
+            puntuacion_general=analisis_db.puntuacion_general,
+            puntuacion_proporcion=analisis_db.puntuacion_proporcion,
+            puntuacion_inclinacion=analisis_db.puntuacion_inclinacion,
+            puntuacion_espaciado=analisis_db.puntuacion_espaciado,
+            puntuacion_consistencia=analisis_db.puntuacion_consistencia,
+            fortalezas=analisis_db.fortalezas,
+            areas_mejora=analisis_db.areas_mejora,
+        ),
+    )
+    dto = PracticeResultDTO(
+        practice_id=str(practica.practice_id),
+        user_id=str(practica.user_id),
+        letra_plantilla=practica.letra_plantilla,
+        url_imagen=practica.url_imagen,
+        fecha_carga=practica.fecha_carga,
+        estado_analisis=practica.estado_analisis,
+        analisis=AnalisisDetailDTO(**practica.analisis.model_dump(exclude={"analisis_id"})),
+    )
+    return _response_model_json(_RESULT_ADAPTER, dto)
+
+
+# --- Camino directo (el del servicio) ---
+
+def direct_history(rows: List[PracticeHistoryRow]) -> bytes:
+    return dto_response(practice_history_dtos(rows)).body
+
+
+def direct_result(practice_db: PracticeDB) -> bytes:
+    return dto_response(practice_result_dto(practice_db_to_entity(practice_db))).body
+
+
+# --- Camino sin validación (referencia) ---
+
+def construct_history(rows: List[PracticeHistoryRow]) -> bytes:
+    return dto_response([
+        PracticeHistoryDTO.model_construct(
+            practice_id=str(row.practice_id),
+            letra_plantilla=row.letra_plantilla,
+            fecha_carga=row.fecha_carga,
+            puntuacion_general=row.puntuacion_general,
+        )
+        for row in rows
+    ]).body
+
+
+def construct_result(practice_db: PracticeDB) -> bytes:
+    analisis_db = practice_db.analisis
+    practica = Practica.model_construct(
+        practice_id=practice_db.practice_id,
+        user_id=practice_db.user_id,
+        letra_plantilla=practice_db.letra_plantilla,
+        url_imagen=practice_db.url_imagen,
+        fecha_carga=practice_db.fecha_carga,
+        estado_analisis=practice_db.estado_analisis,
+        analisis=Analisis.model_construct(
+            analisis_id=analisis_db.analisis_id,
+            puntuacion_general=analisis_db.puntuacion_general,
+            puntuacion_proporcion=analisis_db.puntuacion_proporcion,
+            puntuacion_inclinacion=analisis_db.puntuacion_inclinacion,
+            puntuacion_espaciado=analisis_db.puntuacion_espaciado,
+            puntuacion_consistencia=analisis_db.puntuacion_consistencia,
+            fortalezas=analisis_db.fortalezas,
+            areas_mejora=analisis_db.areas_mejora,
+        ),
+    )
+    analisis = practica.analisis
+    dto = PracticeResultDTO.model_construct(
+        practice_id=str(practica.practice_id),
+        user_id=str(practica.user_id),
+        letra_plantilla=practica.letra_plantilla,
+        url_imagen=practica.url_imagen,
+        fecha_carga=practica.fecha_carga,
+        estado_analisis=practica.estado_analisis,
+        analisis=AnalisisDetailDTO.model_construct(
+            puntuacion_general=analisis.puntuacion_general,
+            puntuacion_proporcion=analisis.puntuacion_proporcion,
+            puntuacion_inclinacion=analisis.puntuacion_inclinacion,
+            puntuacion_espaciado=analisis.puntuacion_espaciado,
+            puntuacion_consistencia=analisis.puntuacion_consistencia,
+            fortalezas=analisis.fortalezas,
+            areas_mejora=analisis.areas_mejora,
+        ),
+    )
+    return dto_response(dto).body
+
+
+# --- Medida ---
+
+def best_time(func: Callable[[], object], repeat: int, min_seconds: float = 0.2) -> float:
+    """Mejor tiempo por llamada de `repeat` tandas; cada tanda dura al menos `min_seconds`."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        if time.perf_counter() - start >= min_seconds:
+            break
+        calls *= 2
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def check_parity(history_rows: List[PracticeHistoryRow], practice_rows: List[PracticeDB]) -> None:
+    """Los tres caminos tienen que producir el mismo JSON; si no, la comparación no tiene sentido."""
+    expected = json.loads(validated_history(history_rows))
+    for path in (direct_history, construct_history):
+        if json.loads(path(history_rows)) != expected:
+            raise SystemExit(f"El historial de '{path.__name__}' no coincide con el del camino validado.")
+    for practice_db in practice_rows:
+        expected = json.loads(validated_result(practice_db))
+        for path in (direct_result, construct_result):
+            if json.loads(path(practice_db)) != expected:
+                raise SystemExit(f"El detalle de '{path.__name__}' no coincide con el del camino validado.")
+
+
+def run(rows_options: List[int], repeat: int) -> List[Dict[str, object]]:
+    results = []
+    for count in rows_options:
+        history_rows = make_history_rows(count)
+        practice_rows = make_practice_rows(count)
+        check_parity(history_rows, practice_rows)
+
+        scenarios = {
+            "history": (validated_history, direct_history, construct_history),
+            "detail": (
+                lambda rows: [validated_result(p) for p in rows],
+                lambda rows: [direct_result(p) for p in rows],
+                lambda rows: [construct_result(p) for p in rows],
+            ),
+        }
+        inputs = {"history": history_rows, "detail": practice_rows}
+        for scenario, (validated, direct, construct) in scenarios.items():
+            rows = inputs[scenario]
+            before = best_time(lambda: validated(rows), repeat) / count
+            after = best_time(lambda: direct(rows), repeat) / count
+            constructed = best_time(lambda: construct(rows), repeat) / count
+            results.append({
+                "scenario": scenario,
+                "rows": count,
+                "validated_us_per_row": round(before * 1e6, 2),
+                "direct_us_per_row": round(after * 1e6, 2),
+                "construct_us_per_row": round(constructed * 1e6, 2),
+                "speedup": round(before / after, 2) if after else None,
+            })
+    return results
+
+
+def print_table(results: List[Dict[str, object]]) -> None:
+    print(f"{'escenario':<10}{'filas':>7}{'validado µs/fila':>19}{'directo µs/fila':>18}{'construct µs/fila':>20}{'mejora':>9}")
+    for r in results:
+        print(
+            f"{r['scenario']:<10}{r['rows']:>7}{r['validated_us_per_row']:>19}"
+            f"{r['direct_us_per_row']:>18}{r['construct_us_per_row']:>20}{str(r['speedup']) + 'x':>9}"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Microbenchmark del mapeo de filas a respuestas JSON.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 200], help="Tamaños de lista a medir.")
+    parser.add_argument("--repeat", type=int, default=5, help="Tandas por medida; se toma la mejor.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Fichero JSON donde guardar los resultados.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    random.seed(args.seed)
+    results = run(args.rows, args.repeat)
+    print_table(results)
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps({"python": sys.version.split()[0], "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
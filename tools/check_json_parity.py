@@ -0,0 +1,184 @@
+"""
+Comprueba, byte a byte, que los renderizadores de `JSON_RENDERER` producen el mismo JSON que FastAPI.
+
+La referencia es FastAPI tal cual: una aplicación mínima cuyas rutas devuelven el DTO con `response_model`
+y la `JSONResponse` por defecto (revalidación, `jsonable_encoder` y `json.dumps`). Para cada caso del corpus
+(historiales vacíos y de varios tamaños, prácticas pendientes, completadas y con error, textos con acentos,
+emojis, comillas, barras, caracteres de control, separadores de línea Unicode y HTML) se compara esa
+respuesta con la de cada renderizador disponible. orjson se omite si no está instalado.
+
+    python -m tools.check_json_parity
+    python -m tools.check_json_parity --renderer orjson --random-cases 2000
+
+Termina con código 1 si algún renderizador no coincide, así que se puede usar en CI antes de cambiar
+`JSON_RENDERER` o de actualizar pydantic, FastAPI u orjson. `tests/api/test_json_parity.py` usa este mismo
+corpus y la misma referencia dentro de la suite de pytest.
+"""
+import argparse
+import datetime
+import random
+import sys
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.adapters.api.responses import build_renderer  # noqa: E402
+from src.domain.value_objects.enums import EstadoAnalisis, LetraPermitida  # noqa: E402
+from src.use_cases.dtos import AnalisisDetailDTO, PracticeHistoryDTO, PracticeResultDTO  # noqa: E402
+
+RENDERERS = ("pydantic", "orjson", "standard")
+
+# Textos que suelen separar a los codificadores JSON
+TRICKY_TEXTS = [
+    "",
+    "Trazo firme y proporciones regulares.",
+    "Inclinación constante; mejora la «ñ» y la «ü».",
+    "Comillas \"dobles\", 'simples' y barra invertida \\ y /",
+    "Saltos\nde línea\r\ny\ttabuladores",
+    "Control \x00 \x01 \x1f \x7f fin",
+    "Separadores \u2028 y \u2029 de JavaScript",
+    "</script><script>alert(1)</script> & <b>",
+    "Emojis ✍️🖋️👍🏽 y CJK 書道 한글",
+    "x" * 5000,
+]
+_RANDOM_ALPHABET = (
+    [chr(c) for c in range(0x20)] + list("aáéíóúñÑ\"\\/ <>&'") + ["\u2028", "\u2029", "€", "𝒜", "🖋", "\ufeff"]
+)
+
+
+# --- Corpus ---
+
+def _fecha(rng: random.Random) -> datetime.datetime:
+    base = datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=rng.randint(0, 200_000_000))
+    # La mitad sin microsegundos: isoformat los omite y es donde más difieren los codificadores
+    return base.replace(microsecond=rng.choice([0, rng.randint(1, 999_999)]))
+
+
+def history_cases(rng: random.Random) -> List[List[PracticeHistoryDTO]]:
+    def item(score: Optional[int]) -> PracticeHistoryDTO:
+        return PracticeHistoryDTO(
+            practice_id=str(uuid.UUID(int=rng.getrandbits(128))),
+            letra_plantilla=rng.choice(list(LetraPermitida)),
+            fecha_carga=_fecha(rng),
+            puntuacion_general=score,
+        )
+
+    return [
+        [],
+        [item(None)],
+        [item(0), item(100), item(None)],
+        [item(rng.choice([None, rng.randint(0, 100)])) for _ in range(50)],
+        [item(rng.choice([None, rng.randint(0, 100)])) for _ in range(200)],
+    ]
+
+
+def result_case(rng: random.Random, estado: EstadoAnalisis, fortalezas: str, areas_mejora: str) -> PracticeResultDTO:
+    analisis = None
+    if estado == EstadoAnalisis.COMPLETADO:
+        analisis = AnalisisDetailDTO(
+            puntuacion_general=rng.randint(0, 100),
+            puntuacion_proporcion=rng.randint(0, 100),
+            puntuacion_inclinacion=rng.randint(0, 100),
+            puntuacion_espaciado=rng.randint(0, 100),
+            puntuacion_consistencia=rng.randint(0, 100),
+            fortalezas=fortalezas,
+            areas_mejora=areas_mejora,
+        )
+    return PracticeResultDTO(
+        practice_id=str(uuid.UUID(int=rng.getrandbits(128))),
+        user_id=str(uuid.UUID(int=rng.getrandbits(128))),
+        letra_plantilla=rng.choice(list(LetraPermitida)),
+        url_imagen=f"/media/images/ab/{uuid.UUID(int=rng.getrandbits(128)).hex}.png",
+        fecha_carga=_fecha(rng),
+        estado_analisis=estado,
+        analisis=analisis,
+    )
+
+
+def result_cases(rng: random.Random, random_cases: int) -> List[PracticeResultDTO]:
+    cases = [result_case(rng, EstadoAnalisis.PENDIENTE, "", ""), result_case(rng, EstadoAnalisis.ERROR, "", "")]
+    cases += [result_case(rng, EstadoAnalisis.COMPLETADO, text, text[::-1]) for text in TRICKY_TEXTS]
+    for _ in range(random_cases):
+        text = "".join(rng.choice(_RANDOM_ALPHABET) for _ in range(rng.randint(0, 40)))
+        cases.append(result_case(rng, EstadoAnalisis.COMPLETADO, text, text))
+    return cases
+
+
+# --- Referencia ---
+
+def reference_client(histories: List[List[PracticeHistoryDTO]], results: List[PracticeResultDTO]) -> TestClient:
+    """FastAPI sin cambios: las rutas devuelven el DTO y FastAPI lo valida y serializa con `response_model`."""
+    app = FastAPI()
+
+    @app.get("/history/{case}", response_model=List[PracticeHistoryDTO])
+    def history(case: int):
+        return histories[case]
+
+    @app.get("/result/{case}", response_model=PracticeResultDTO)
+    def result(case: int):
+        return results[case]
+
+    return TestClient(app)
+
+
+def first_difference(expected: bytes, actual: bytes) -> str:
+    position = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+    start = max(0, position - 30)
+    return f"byte {position}: esperado {expected[start:position + 30]!r}, obtenido {actual[start:position + 30]!r}"
+
+
+def check(renderer_names: List[str], seed: int, random_cases: int) -> int:
+    rng = random.Random(seed)
+    histories = history_cases(rng)
+    results = result_cases(rng, random_cases)
+    client = reference_client(histories, results)
+    expected = {("history", i): client.get(f"/history/{i}").content for i in range(len(histories))}
+    expected.update({("result", i): client.get(f"/result/{i}").content for i in range(len(results))})
+    contents = {("history", i): case for i, case in enumerate(histories)}
+    contents.update({("result", i): case for i, case in enumerate(results)})
+
+    failed = False
+    for name in renderer_names:
+        try:
+            render = build_renderer(name)
+        except ImportError as exc:
+            print(f"{name:<9} omitido: {exc}")
+            continue
+
+        mismatches = []
+        for key, content in contents.items():
+            actual = render(content)
+            if actual != expected[key]:
+                mismatches.append((key, first_difference(expected[key], actual)))
+
+        if mismatches:
+            failed = True
+            print(f"{name:<9} {len(mismatches)} de {len(contents)} casos NO coinciden")
+            for (kind, index), detail in mismatches[:5]:
+                print(f"    {kind}[{index}] {detail}")
+        else:
+            print(f"{name:<9} {len(contents)} casos idénticos")
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compara los renderizadores de JSON_RENDERER con FastAPI, byte a byte.")
+    parser.add_argument("--renderer", choices=RENDERERS, action="append", help="Renderizador a comprobar (por defecto, todos).")
+    parser.add_argument("--random-cases", type=int, default=500, help="Prácticas con textos aleatorios además del corpus fijo.")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return check(args.renderer or list(RENDERERS), args.seed, args.random_cases)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
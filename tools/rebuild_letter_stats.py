@@ -0,0 +1,55 @@
+"""
+Recalcula el resumen por letra (`practice_letter_stats`) a partir de los análisis de `analyses`.
+
+Es el paso posterior al despliegue de la migración `0005_practice_letter_stats`: los análisis que complete
+la versión anterior entre la migración y el despliegue no se suman al resumen. También sirve para reparar
+el resumen de un usuario concreto:
+
+    python -m tools.rebuild_letter_stats
+    python -m tools.rebuild_letter_stats --user-id 3f0c... --user-id 9a41...
+    python -m tools.rebuild_letter_stats --batch-size 200 --pause 0.5
+
+Usa la misma configuración que el servicio (`DATABASE_URL`, `DB_ASYNC`...). Cada usuario se recalcula en su
+propia transacción y el resultado no depende del resumen anterior: si se interrumpe, basta con repetirlo.
+"""
+import argparse
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.adapters.repositories.providers import open_repositories  # noqa: E402
+from src.use_cases.rebuild_letter_stats import RebuildLetterStatsUseCase  # noqa: E402
+
+
+async def rebuild(user_ids: List[uuid.UUID], batch_size: int, pause: float) -> int:
+    async with open_repositories() as repositories:
+        use_case = RebuildLetterStatsUseCase(repositories.practices, batch_size=batch_size, pause=pause)
+        if not user_ids:
+            return await use_case.execute()
+        for user_id in user_ids:
+            await use_case.execute(user_id)
+        return len(user_ids)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Recalcula practice_letter_stats a partir de analyses.")
+    parser.add_argument("--user-id", type=uuid.UUID, action="append", default=[], help="Usuario a recalcular (por defecto, todos).")
+    parser.add_argument("--batch-size", type=int, default=500, help="Usuarios por lote al recalcular todos.")
+    parser.add_argument("--pause", type=float, default=0.1, help="Segundos de pausa entre lotes.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    total = asyncio.run(rebuild(args.user_id, args.batch_size, args.pause))
+    print(f"Resumen por letra recalculado para {total} usuarios")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Servidor de pruebas que imita a analysis-service (`POST /v1/analyze`).
+
+Sirve para ver cómo se comporta el cliente (reintentos, bulkhead y circuit breaker)
+cuando la dependencia va lenta o falla, sin levantar el servicio real:
+
+    uvicorn tools.stub_analysis_service:app --port 8001
+    ANALYSIS_SERVICE_BASE_URL=http://localhost:8001/v1 uvicorn src.adapters.api.main:app
+
+El comportamiento se fija al arrancar con variables de entorno y se puede cambiar en caliente:
+
+    STUB_LATENCY=0.2            # segundos de espera por petición
+    STUB_LATENCY_JITTER=0.1     # espera extra aleatoria entre 0 y este valor
+    STUB_FAILURE_RATE=0.0       # probabilidad de responder con STUB_FAILURE_STATUS
+    STUB_FAILURE_STATUS=503
+
+    curl -X PUT localhost:8001/admin/mode -H 'content-type: application/json' \\
+         -d '{"latency": 40}'                # más que ANALYSIS_SERVICE_TIMEOUT: timeouts
+    curl -X PUT localhost:8001/admin/mode -d '{"failure_rate": 1}' -H 'content-type: application/json'
+    curl localhost:8001/admin/stats
+"""
+import asyncio
+import os
+import random
+from typing import Optional
+
+from fastapi import FastAPI, File, Form, UploadFile
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+app = FastAPI(title="analysis-service (stub)")
+
+
+class StubMode(BaseModel):
+    latency: float = float(os.getenv("STUB_LATENCY", "0.2"))
+    latency_jitter: float = float(os.getenv("STUB_LATENCY_JITTER", "0.1"))
+    failure_rate: float = float(os.getenv("STUB_FAILURE_RATE", "0.0"))
+    failure_status: int = int(os.getenv("STUB_FAILURE_STATUS", "503"))
+    retry_after: Optional[float] = None
+
+
+class StubModeUpdate(BaseModel):
+    latency: Optional[float] = None
+    latency_jitter: Optional[float] = None
+    failure_rate: Optional[float] = None
+    failure_status: Optional[int] = None
+    retry_after: Optional[float] = None
+
+
+mode = StubMode()
+stats = {"requests": 0, "failures": 0, "in_flight": 0, "max_in_flight": 0}
+
+
+@app.post("/v1/analyze")
+async def analyze(letter_char: str = Form(...), file: UploadFile = File(...)):
+    stats["requests"] += 1
+    stats["in_flight"] += 1
+    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+    try:
+        content = await file.read()
+        await asyncio.sleep(mode.latency + random.uniform(0, mode.latency_jitter))
+
+        if random.random() < mode.failure_rate:
+            stats["failures"] += 1
+            headers = {"Retry-After": str(mode.retry_after)} if mode.retry_after is not None else None
+            return JSONResponse({"detail": "fallo simulado"}, status_code=mode.failure_status, headers=headers)
+
+        # Puntuación estable por imagen para que los resultados sean reproducibles
+        score = 50 + len(content) % 50
+        return {
+            "metricas_detalle": {
+                "score_global": score,
+                "puntuacion_proporcion": score,
+                "puntuacion_inclinacion": score - 5,
+                "puntuacion_espaciado": score - 10,
+                "puntuacion_consistencia": score - 3,
+                "fortalezas_base": f"Buen trazo de la '{letter_char}'",
+                "areas_mejora_base": "Cuidar la inclinación",
+            },
+            "feedback_final": {},
+        }
+    finally:
+        stats["in_flight"] -= 1
+
+
+@app.put("/admin/mode")
+async def update_mode(update: StubModeUpdate):
+    global mode
+    mode = mode.model_copy(update=update.model_dump(exclude_unset=True))
+    return mode
+
+
+@app.get("/admin/stats")
+async def get_stats():
+    return {**stats, "mode": mode}